@@ -2,16 +2,141 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import frontmatter
+import yaml
 
+from batou.index import EntityIndex
 from batou.schema import Schema
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 ARCHIVE_DIR = "zzz_archive"
 
+# Maximum number of parsed files kept in memory per EntityTools instance
+PARSE_CACHE_SIZE = 4096
+
+# Files at least this large are searched through mmap instead of read()
+MMAP_THRESHOLD = 64 * 1024
+
+# Frontmatter delimiter line ("---", optionally longer or with trailing spaces)
+_FM_DELIMITER = re.compile(rb"-{3,}\s*")
+
+# Opening delimiter (after any leading blank lines) and closing delimiter line
+_FM_OPEN = re.compile(rb"\s*-{3,}[ \t]*\r?\n")
+_FM_CLOSE = re.compile(rb"^-{3,}[ \t]*\r?(?:\n|\Z)", re.MULTILINE)
+
+# Threads used to overlap file reads and parsing in listings and searches
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Non-ASCII characters that case-insensitive str matching equates with an
+# ASCII letter (KELVIN SIGN, LONG S, dotted/dotless I), as UTF-8 alternations
+_FOLD_ALTERNATES = {
+    "i": rb"(?:i|\xc4\xb0|\xc4\xb1)",
+    "k": rb"(?:k|\xe2\x84\xaa)",
+    "s": rb"(?:s|\xc5\xbf)",
+}
+
+
+def _compile_prefilter(query: str) -> re.Pattern:
+    """Compile a search query into a pattern for scanning a file's raw body.
+
+    The pattern is deliberately looser than the real match so it never
+    rejects a body the parsed search would accept: whitespace matches any
+    whitespace run. ASCII queries compile to a bytes pattern (with UTF-8
+    alternatives for the few non-ASCII characters that fold to an ASCII
+    letter); anything else needs decoded text for Unicode case folding.
+
+    Args:
+        query: Search query
+
+    Returns:
+        Case-insensitive compiled pattern (bytes or str)
+    """
+    words = [re.escape(word) for word in query.split()]
+    if query.isascii():
+        encoded = [
+            re.sub(
+                rb"[iks]",
+                lambda m: _FOLD_ALTERNATES[m.group().lower().decode()],
+                word.encode(),
+                flags=re.IGNORECASE,
+            )
+            for word in words
+        ]
+        return re.compile(rb"\s+".join(encoded), re.IGNORECASE)
+    return re.compile(r"\s+".join(words), re.IGNORECASE)
+
+
+def _frontmatter_bounds(data: bytes | mmap.mmap) -> tuple[int, int, int] | None:
+    """Locate the YAML header in raw file bytes.
+
+    Args:
+        data: Raw markdown file contents (bytes or a read-only mmap)
+
+    Returns:
+        (header_start, header_end, body_start) offsets, where body_start is
+        right after the closing delimiter line, or None if the file has no
+        complete frontmatter block
+    """
+    opening = _FM_OPEN.match(data)
+    if opening is None:
+        return None
+    closing = _FM_CLOSE.search(data, opening.end())
+    if closing is None:
+        return None
+    return opening.end(), closing.start(), closing.end()
+
+
+def _split_frontmatter(data: bytes) -> tuple[bytes, bytes] | None:
+    """Split raw file bytes into the YAML header and everything after it.
+
+    Args:
+        data: Raw markdown file contents
+
+    Returns:
+        (header, rest) where rest starts right after the closing delimiter
+        line, or None if the file has no complete frontmatter block
+    """
+    bounds = _frontmatter_bounds(data)
+    if bounds is None:
+        return None
+    header_start, header_end, body_start = bounds
+    return data[header_start:header_end], data[body_start:]
+
+
+def _dump_frontmatter(fm: dict[str, Any]) -> bytes:
+    """Serialize frontmatter to a YAML header block (without delimiters).
+
+    Keys keep their insertion order so rewrites don't reshuffle headers.
+
+    Args:
+        fm: Frontmatter dict
+
+    Returns:
+        UTF-8 encoded YAML, ending with a newline
+    """
+    return yaml.dump(
+        fm,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    ).encode("utf-8")
+
 
 class EntityTools:
     """Structured entity operations on local filesystem."""
@@ -24,11 +149,40 @@ class EntityTools:
         """
         self.workspace_path = Path(workspace_path)
         self.schema = Schema(self.workspace_path)
+        # "<workspace>/" prefix, for slicing relative paths off result paths
+        self._workspace_prefix = os.path.join(str(self.workspace_path), "")
+        # path -> (st_mtime_ns, st_size, frontmatter, content), in LRU order.
+        # content is None when only the frontmatter has been read.
+        self._parse_cache: OrderedDict[Path, tuple[int, int, dict[str, Any], str | None]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Persistent second cache tier, shared across server restarts. Rows
+        # are buffered and written by _flush_index() once per operation.
+        self._index = EntityIndex.open(self.workspace_path)
+        # Directories known to exist, so writes can skip mkdir
+        self._known_dirs: set[Path] = set()
+        self._executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="batou-io")
 
     def _entity_id_from_path(self, path: Path) -> str:
         """Extract entity ID from file path."""
         return path.stem  # filename without extension
 
+    def _relative_path(self, path: Path | str) -> str:
+        """Get a path relative to the workspace root, as a string.
+
+        Slices off the precomputed workspace prefix instead of going through
+        Path.relative_to for every result.
+
+        Args:
+            path: Path inside the workspace
+
+        Returns:
+            Relative path string
+        """
+        path_str = str(path)
+        if path_str.startswith(self._workspace_prefix):
+            return path_str[len(self._workspace_prefix):]
+        return str(Path(path).relative_to(self.workspace_path))
+
     def _get_archive_dir(self, entity_type: str) -> Path:
         """Get the archive directory for an entity type."""
         return self.schema.get_directory(entity_type) / ARCHIVE_DIR
@@ -37,6 +191,26 @@ class EntityTools:
         """Check if a path is in an archive directory."""
         return ARCHIVE_DIR in path.parts
 
+    def _locate_entity(self, entity_type: str, entity_id: str) -> tuple[Path, bool] | None:
+        """Find an entity's file, checking the main directory then the archive.
+
+        Args:
+            entity_type: Entity type
+            entity_id: Entity ID (filename without extension)
+
+        Returns:
+            (path, is_archived), or None if the entity doesn't exist
+        """
+        path = self.schema.get_directory(entity_type) / f"{entity_id}.md"
+        if path.exists():
+            return path, False
+
+        archive_path = self._get_archive_dir(entity_type) / f"{entity_id}.md"
+        if archive_path.exists():
+            return archive_path, True
+
+        return None
+
     def _find_references(self, entity_type: str, entity_id: str) -> list[dict[str, Any]]:
         """Find all entities that reference this entity.
 
@@ -66,7 +240,7 @@ class EntityTools:
                     continue
 
                 try:
-                    fm, _ = self._parse_file(path)
+                    fm = self._parse_frontmatter_only(path)
 
                     # Check all frontmatter fields for references
                     for field, value in fm.items():
@@ -81,20 +255,321 @@ class EntityTools:
                 except Exception:
                     continue
 
+        self._flush_index()
         return references
 
-    def _parse_file(self, path: Path) -> tuple[dict[str, Any], str]:
+    def _scan_markdown(self, directory: Path) -> list[tuple[str, os.stat_result]]:
+        """List markdown files in a directory, newest first.
+
+        Uses os.scandir so each entry costs a single stat and no Path
+        object is built until the caller actually needs one. Entries are
+        stat'ed in inode order (free from readdir), which keeps inode table
+        reads sequential on cold caches and spinning disks.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            List of (path string, stat result) tuples sorted by mtime
+            descending (empty if the directory doesn't exist)
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it if entry.name.endswith(".md")]
+        except FileNotFoundError:
+            return []
+        entries.sort(key=os.DirEntry.inode)
+
+        files = [(entry.path, entry.stat()) for entry in entries if entry.is_file()]
+        files.sort(key=lambda item: item[1].st_mtime_ns, reverse=True)
+        return files
+
+    def _file_may_match(
+        self,
+        path: str,
+        st: os.stat_result,
+        prefilter: re.Pattern,
+        matcher: re.Pattern,
+    ) -> bool:
+        """Check whether a file could match a search query.
+
+        Searches match against f"{title} {content}". The body is scanned as
+        raw bytes, which skips decoding and YAML parsing for most files. The
+        title is only compared in its parsed form (YAML quoting and escapes
+        mean the raw header can't be trusted), so a file whose body misses
+        needs its frontmatter, from the parse cache where possible.
+
+        Args:
+            path: Path to the markdown file
+            st: Stat result for the file
+            prefilter: Pattern from _compile_prefilter
+            matcher: The search's real (case-insensitive) matcher
+
+        Returns:
+            False only if the file definitely does not match
+        """
+        with open(path, "rb") as f:
+            if st.st_size >= MMAP_THRESHOLD and isinstance(prefilter.pattern, bytes):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    bounds = _frontmatter_bounds(mm)
+                    body_start = bounds[2] if bounds is not None else 0
+                    if prefilter.search(mm, body_start) is not None:
+                        return True
+                    header = mm[bounds[0]:bounds[1]] if bounds is not None else None
+                    body = mm[body_start:] if " " in matcher.pattern else b""
+            else:
+                data = f.read()
+                bounds = _frontmatter_bounds(data)
+                body_start = bounds[2] if bounds is not None else 0
+                body = data[body_start:]
+                if isinstance(prefilter.pattern, str):
+                    if prefilter.search(body.decode("utf-8", "replace")) is not None:
+                        return True
+                elif prefilter.search(body) is not None:
+                    return True
+                header = data[bounds[0]:bounds[1]] if bounds is not None else None
+
+        if header is None:
+            title = ""
+        else:
+            cached = self._cache_lookup(Path(path), st, need_content=False)
+            if cached is not None:
+                metadata = cached[0]
+            else:
+                loaded = yaml.load(header, Loader=SafeLoader)
+                metadata = loaded if isinstance(loaded, dict) else {}
+                self._cache_store(Path(path), st, metadata, None)
+            title = metadata.get("title", "")
+
+        # The body can't match on its own, but a match may lie in the title
+        # or, for queries containing a space, run from the title into the body
+        if " " not in matcher.pattern:
+            return matcher.search(f"{title}") is not None
+        content = body.decode("utf-8", "replace").strip()
+        return matcher.search(f"{title} {content}") is not None
+
+    def _cache_lookup(
+        self,
+        path: Path,
+        st: os.stat_result,
+        need_content: bool,
+    ) -> tuple[dict[str, Any], str | None] | None:
+        """Find a parse result for this version of a file.
+
+        Checks the in-memory LRU first, then the on-disk index (promoting
+        hits into memory).
+
+        Args:
+            path: Path to the markdown file
+            st: Current stat result for the file
+            need_content: If True, frontmatter-only entries don't count
+
+        Returns:
+            (frontmatter, content) or None on a miss
+        """
+        with self._cache_lock:
+            cached = self._parse_cache.get(path)
+            if (
+                cached is not None
+                and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size
+                and (cached[3] is not None or not need_content)
+            ):
+                self._parse_cache.move_to_end(path)
+                return cached[2], cached[3]
+
+        if self._index is None:
+            return None
+        indexed = self._index.get(str(path), st.st_mtime_ns, st.st_size)
+        if indexed is None or (need_content and indexed[1] is None):
+            return None
+        self._cache_store(path, st, indexed[0], indexed[1], persist=False)
+        return indexed
+
+    def _cache_store(
+        self,
+        path: Path,
+        st: os.stat_result,
+        metadata: dict[str, Any],
+        content: str | None,
+        persist: bool = True,
+    ) -> None:
+        """Record a parse result in the in-memory LRU and the on-disk index.
+
+        Args:
+            path: Path to the markdown file
+            st: Stat result the file was parsed at
+            metadata: Parsed frontmatter
+            content: Parsed content, or None for a frontmatter-only parse
+            persist: Also write through to the on-disk index
+        """
+        with self._cache_lock:
+            # Don't clobber a full parse with a frontmatter-only one
+            cached = self._parse_cache.get(path)
+            if (
+                content is None
+                and cached is not None
+                and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size
+            ):
+                return
+            self._parse_cache[path] = (st.st_mtime_ns, st.st_size, metadata, content)
+            self._parse_cache.move_to_end(path)
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        if persist and self._index is not None:
+            self._index.put(str(path), st.st_mtime_ns, st.st_size, metadata, content)
+
+    def _flush_index(self) -> None:
+        """Write parse results buffered during this operation to the index."""
+        if self._index is not None:
+            self._index.flush()
+
+    def _move_cached(self, old_path: Path, new_path: Path) -> None:
+        """Re-key cached parse results after a file is renamed."""
+        with self._cache_lock:
+            cached = self._parse_cache.pop(old_path, None)
+            if cached is not None:
+                self._parse_cache[new_path] = cached
+        if self._index is not None:
+            self._index.rename(str(old_path), str(new_path))
+
+    def _parse_file(self, path: Path, st: os.stat_result | None = None) -> tuple[dict[str, Any], str]:
         """Parse a markdown file into frontmatter and content.
 
+        Results are cached per path (in memory and in the on-disk index) and
+        reused until the file's mtime or size changes, so repeated listings
+        skip YAML parsing entirely.
+
+        Args:
+            path: Path to the markdown file
+            st: Stat result for the file, if the caller already has one
+
+        Returns:
+            Tuple of (frontmatter dict, content string). The dict is shared
+            with the cache: copy it before mutating.
+        """
+        if st is None:
+            st = os.stat(path)
+
+        cached = self._cache_lookup(path, st, need_content=True)
+        if cached is not None:
+            return cached[0], cached[1]
+
+        # One read, delimiter split on bytes, C-level YAML on just the header
+        data = path.read_bytes()
+        parts = _split_frontmatter(data)
+        if parts is None:
+            metadata: dict[str, Any] = {}
+            content = data.decode("utf-8").strip()
+        else:
+            header, rest = parts
+            loaded = yaml.load(header, Loader=SafeLoader)
+            metadata = loaded if isinstance(loaded, dict) else {}
+            content = rest.decode("utf-8").strip()
+
+        self._cache_store(path, st, metadata, content)
+        return metadata, content
+
+    def _parse_frontmatter_only(
+        self,
+        path: Path,
+        st: os.stat_result | None = None,
+    ) -> dict[str, Any]:
+        """Parse only the frontmatter block of a markdown file.
+
+        Reads lines up to the closing delimiter and never touches the body,
+        which is all listings need. Shares the cache with _parse_file.
+
         Args:
             path: Path to the markdown file
+            st: Stat result for the file, if the caller already has one
 
         Returns:
-            Tuple of (frontmatter dict, content string)
+            Frontmatter dict (empty if the file has no frontmatter), shared
+            with the cache: copy it before mutating
         """
-        with open(path) as f:
-            post = frontmatter.load(f)
-        return dict(post.metadata), post.content
+        if st is None:
+            st = os.stat(path)
+
+        cached = self._cache_lookup(path, st, need_content=False)
+        if cached is not None:
+            return cached[0]
+
+        metadata: dict[str, Any] = {}
+        with open(path, "rb") as f:
+            first = f.readline()
+            while first and not first.strip():
+                first = f.readline()
+
+            if _FM_DELIMITER.fullmatch(first):
+                header = []
+                for line in f:
+                    if _FM_DELIMITER.fullmatch(line):
+                        loaded = yaml.load(b"".join(header), Loader=SafeLoader)
+                        if isinstance(loaded, dict):
+                            metadata = loaded
+                        break
+                    header.append(line)
+
+        self._cache_store(path, st, metadata, None)
+        return metadata
+
+    def _try_parse_frontmatter(self, path: str, st: os.stat_result) -> dict[str, Any] | None:
+        """Parse a file's frontmatter for a listing, returning None on failure."""
+        try:
+            return self._parse_frontmatter_only(Path(path), st)
+        except Exception:
+            return None
+
+    def _parse_if_match(
+        self,
+        path: str,
+        st: os.stat_result,
+        prefilter: re.Pattern,
+        matcher: re.Pattern,
+    ) -> tuple[dict[str, Any], str] | None:
+        """Parse a file for a search, returning None if it can't match or be parsed."""
+        try:
+            cached = self._cache_lookup(Path(path), st, need_content=True)
+            if cached is not None:
+                return cached[0], cached[1]
+            if not self._file_may_match(path, st, prefilter, matcher):
+                return None
+            return self._parse_file(Path(path), st)
+        except Exception:
+            return None
+
+    def _map_batched(
+        self,
+        func: Callable[..., Any],
+        files: Sequence[tuple[str, os.stat_result]],
+        batch_size: int,
+        *args: Any,
+    ) -> Iterator[Any]:
+        """Run func(path, stat, *args) over files on the I/O pool, in order.
+
+        Work is submitted one batch at a time so callers that stop early
+        (e.g. once a limit is reached) don't read the rest of the directory.
+
+        Args:
+            func: Per-file function taking (path string, stat result, *args)
+            files: Output of _scan_markdown
+            batch_size: Number of files submitted per round
+            *args: Extra arguments passed to func
+
+        Yields:
+            func's result for each file, in input order
+        """
+        batch_size = max(batch_size, 1)
+        for start in range(0, len(files), batch_size):
+            futures = [
+                self._executor.submit(func, path, st, *args)
+                for path, st in files[start:start + batch_size]
+            ]
+            for future in futures:
+                yield future.result()
 
     def _write_file(self, path: Path, fm: dict[str, Any], content: str) -> None:
         """Write frontmatter and content to a markdown file.
@@ -104,10 +579,70 @@ class EntityTools:
             fm: Frontmatter dict
             content: Markdown content
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        post = frontmatter.Post(content, **fm)
-        with open(path, "w") as f:
-            f.write(frontmatter.dumps(post))
+        data = b"---\n" + _dump_frontmatter(fm) + b"---\n\n" + content.encode("utf-8")
+        self._write_bytes(path, data)
+
+    def _write_bytes(self, path: Path, data: bytes) -> None:
+        """Atomically write raw bytes to a file.
+
+        Writes to a hidden temp file next to the target and renames it into
+        place, so readers never see a torn file. Parent directories are
+        created once per instance rather than on every write.
+
+        Args:
+            path: Path to write to
+            data: File contents
+        """
+        parent = path.parent
+        if parent not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
+
+        tmp = parent / f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            try:
+                f = open(tmp, "wb")
+            except FileNotFoundError:
+                # Directory was removed behind our back; recreate it
+                parent.mkdir(parents=True, exist_ok=True)
+                f = open(tmp, "wb")
+            with f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def _rewrite_frontmatter(self, path: Path, updates: dict[str, Any]) -> dict[str, Any] | None:
+        """Merge updates into a file's frontmatter without re-parsing the body.
+
+        Only the YAML header is parsed and re-emitted; the bytes after the
+        closing delimiter are written back untouched.
+
+        Args:
+            path: Path to the markdown file
+            updates: Frontmatter fields to set
+
+        Returns:
+            The merged frontmatter, or None if the file has no well-formed
+            frontmatter block (callers should fall back to a full rewrite)
+        """
+        parts = _split_frontmatter(path.read_bytes())
+        if parts is None:
+            return None
+        header, body = parts
+
+        fm = yaml.load(header, Loader=SafeLoader)
+        if fm is None:
+            fm = {}
+        elif not isinstance(fm, dict):
+            return None
+
+        fm.update(updates)
+        fm["updated_at"] = datetime.now().isoformat()
+
+        self._write_bytes(path, b"---\n" + _dump_frontmatter(fm) + b"---\n" + body)
+        return fm
 
     def list_entities(
         self,
@@ -132,13 +667,19 @@ class EntityTools:
         if not directory.exists():
             return {"success": True, "entities": [], "count": 0}
 
+        files = self._scan_markdown(directory)
+        parsed_files = self._map_batched(self._try_parse_frontmatter, files, limit)
+
         entities = []
-        for path in sorted(directory.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True):
+        for (path_str, _), parsed in zip(files, parsed_files):
             if len(entities) >= limit:
                 break
+            if parsed is None:
+                continue
 
+            path = Path(path_str)
             try:
-                fm, _ = self._parse_file(path)
+                fm = parsed
                 entity_status = fm.get("status")
 
                 # Apply status filter (case-insensitive)
@@ -158,13 +699,14 @@ class EntityTools:
                     "entity_type": entity_type,
                     "title": fm.get("title") or fm.get("name") or path.stem,
                     "status": entity_status,
-                    "path": str(path.relative_to(self.workspace_path)),
+                    "path": self._relative_path(path_str),
                     "frontmatter": fm,
                 })
             except Exception:
                 # Skip files that can't be parsed
                 continue
 
+        self._flush_index()
         return {
             "success": True,
             "entities": entities,
@@ -187,29 +729,22 @@ class EntityTools:
         Returns:
             Dict with entity data or error
         """
-        directory = self.schema.get_directory(entity_type)
-        path = directory / f"{entity_id}.md"
-        is_archived = False
-
-        # Check main directory first, then archive
-        if not path.exists():
-            archive_path = self._get_archive_dir(entity_type) / f"{entity_id}.md"
-            if archive_path.exists():
-                path = archive_path
-                is_archived = True
-            else:
-                return {
-                    "success": False,
-                    "error": f"Entity not found: {entity_type}/{entity_id}",
-                }
+        located = self._locate_entity(entity_type, entity_id)
+        if located is None:
+            return {
+                "success": False,
+                "error": f"Entity not found: {entity_type}/{entity_id}",
+            }
+        path, is_archived = located
 
         try:
             fm, content = self._parse_file(path)
+            self._flush_index()
             result = {
                 "success": True,
                 "entity_type": entity_type,
                 "entity_id": entity_id,
-                "path": str(path.relative_to(self.workspace_path)),
+                "path": self._relative_path(path),
                 "frontmatter": fm,
                 "content": content,
             }
@@ -263,7 +798,7 @@ class EntityTools:
         if path.exists():
             return {
                 "success": False,
-                "error": f"Entity already exists: {path.relative_to(self.workspace_path)}",
+                "error": f"Entity already exists: {self._relative_path(path)}",
             }
 
         # Validate required fields
@@ -283,7 +818,7 @@ class EntityTools:
                 "success": True,
                 "entity_type": entity_type,
                 "entity_id": entity_id,
-                "path": str(path.relative_to(self.workspace_path)),
+                "path": self._relative_path(path),
                 "frontmatter": fm,
             }
         except Exception as e:
@@ -310,32 +845,40 @@ class EntityTools:
         Returns:
             Dict with updated entity info or error
         """
-        # Get existing entity
-        existing = self.get_entity(entity_type, entity_id)
-        if not existing.get("success"):
-            return existing
+        located = self._locate_entity(entity_type, entity_id)
+        if located is None:
+            return {
+                "success": False,
+                "error": f"Entity not found: {entity_type}/{entity_id}",
+            }
+        path, _ = located
 
-        # Merge frontmatter
-        new_fm = {**existing["frontmatter"]}
-        if frontmatter:
-            new_fm.update(frontmatter)
+        try:
+            # Frontmatter-only updates patch the header and keep the body bytes
+            new_fm = None
+            if content is None:
+                new_fm = self._rewrite_frontmatter(path, frontmatter or {})
 
-        # Add updated_at
-        new_fm["updated_at"] = datetime.now().isoformat()
+            if new_fm is None:
+                existing_fm, existing_content = self._parse_file(path)
 
-        # Use new content or keep existing
-        new_content = content if content is not None else existing["content"]
+                # Merge frontmatter
+                new_fm = {**existing_fm}
+                if frontmatter:
+                    new_fm.update(frontmatter)
 
-        # Write back
-        path = self.workspace_path / existing["path"]
+                # Add updated_at
+                new_fm["updated_at"] = datetime.now().isoformat()
+
+                # Use new content or keep existing
+                new_content = content if content is not None else existing_content
+                self._write_file(path, new_fm, new_content)
 
-        try:
-            self._write_file(path, new_fm, new_content)
             return {
                 "success": True,
                 "entity_type": entity_type,
                 "entity_id": entity_id,
-                "path": existing["path"],
+                "path": self._relative_path(path),
                 "frontmatter": new_fm,
             }
         except Exception as e:
@@ -369,6 +912,8 @@ class EntityTools:
 
         try:
             path.unlink()
+            if self._index is not None:
+                self._index.discard(str(path))
             return {
                 "success": True,
                 "entity_type": entity_type,
@@ -423,12 +968,13 @@ class EntityTools:
 
         try:
             path.rename(archive_path)
+            self._move_cached(path, archive_path)
             return {
                 "success": True,
                 "entity_type": entity_type,
                 "entity_id": entity_id,
                 "archived": True,
-                "path": str(archive_path.relative_to(self.workspace_path)),
+                "path": self._relative_path(archive_path),
             }
         except Exception as e:
             return {
@@ -471,12 +1017,13 @@ class EntityTools:
 
         try:
             archive_path.rename(path)
+            self._move_cached(archive_path, path)
             return {
                 "success": True,
                 "entity_type": entity_type,
                 "entity_id": entity_id,
                 "unarchived": True,
-                "path": str(path.relative_to(self.workspace_path)),
+                "path": self._relative_path(path),
             }
         except Exception as e:
             return {
@@ -503,29 +1050,99 @@ class EntityTools:
         if not archive_dir.exists():
             return {"success": True, "entities": [], "count": 0}
 
+        files = self._scan_markdown(archive_dir)
+        parsed_files = self._map_batched(self._try_parse_frontmatter, files, limit)
+
         entities = []
-        for path in sorted(archive_dir.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True):
+        for (path_str, _), parsed in zip(files, parsed_files):
             if len(entities) >= limit:
                 break
+            if parsed is None:
+                continue
 
+            path = Path(path_str)
             try:
-                fm, _ = self._parse_file(path)
+                fm = parsed
                 entities.append({
                     "entity_id": self._entity_id_from_path(path),
                     "entity_type": entity_type,
                     "title": fm.get("title") or fm.get("name") or path.stem,
-                    "path": str(path.relative_to(self.workspace_path)),
+                    "path": self._relative_path(path_str),
                     "frontmatter": fm,
                 })
             except Exception:
                 continue
 
+        self._flush_index()
         return {
             "success": True,
             "entities": entities,
             "count": len(entities),
         }
 
+    def _search_directories(
+        self,
+        query: str,
+        directories: list[tuple[str, Path]],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Search markdown files across several entity directories.
+
+        Directories are scanned concurrently and their files pooled into one
+        work queue, so the I/O pool stays busy across directory boundaries
+        instead of draining at the end of each one. Stops as soon as limit
+        results have been found.
+
+        Args:
+            query: Search query (case-insensitive substring match)
+            directories: (entity type, directory) pairs to search
+            limit: Maximum results
+
+        Returns:
+            List of matching entity result dicts
+        """
+        results: list[dict[str, Any]] = []
+        if limit <= 0:
+            return results
+
+        matcher = re.compile(re.escape(query), re.IGNORECASE)
+        prefilter = _compile_prefilter(query)
+
+        files: list[tuple[str, os.stat_result]] = []
+        file_types: list[str] = []
+        scans = self._executor.map(self._scan_markdown, [directory for _, directory in directories])
+        for (et, _), scanned in zip(directories, scans):
+            files.extend(scanned)
+            file_types.extend([et] * len(scanned))
+
+        batch_size = max(limit, IO_WORKERS)
+        candidates = self._map_batched(self._parse_if_match, files, batch_size, prefilter, matcher)
+
+        for et, (path_str, _), parsed in zip(file_types, files, candidates):
+            if parsed is None:
+                continue
+
+            path = Path(path_str)
+            try:
+                fm, content = parsed
+                if matcher.search(f"{fm.get('title', '')} {content}"):
+                    results.append({
+                        "entity_id": self._entity_id_from_path(path),
+                        "entity_type": et,
+                        "title": fm.get("title") or fm.get("name") or path.stem,
+                        "path": self._relative_path(path_str),
+                        "frontmatter": fm,
+                    })
+            except Exception:
+                continue
+
+            # Check right after a hit so no further file is read or parsed
+            if len(results) >= limit:
+                break
+
+        self._flush_index()
+        return results
+
     def search_archived(
         self,
         query: str,
@@ -542,9 +1159,6 @@ class EntityTools:
         Returns:
             Dict with matching archived entities
         """
-        query_lower = query.lower()
-        results = []
-
         # Determine which directories to search
         if entity_type:
             archive_dirs = [(entity_type, self._get_archive_dir(entity_type))]
@@ -553,28 +1167,7 @@ class EntityTools:
             entity_types.update(["tasks", "notes", "projects", "threads", "journal"])
             archive_dirs = [(et, self._get_archive_dir(et)) for et in entity_types]
 
-        for et, archive_dir in archive_dirs:
-            if not archive_dir.exists():
-                continue
-
-            for path in archive_dir.glob("*.md"):
-                if len(results) >= limit:
-                    break
-
-                try:
-                    fm, content = self._parse_file(path)
-                    full_text = f"{fm.get('title', '')} {content}".lower()
-
-                    if query_lower in full_text:
-                        results.append({
-                            "entity_id": self._entity_id_from_path(path),
-                            "entity_type": et,
-                            "title": fm.get("title") or fm.get("name") or path.stem,
-                            "path": str(path.relative_to(self.workspace_path)),
-                            "frontmatter": fm,
-                        })
-                except Exception:
-                    continue
+        results = self._search_directories(query, archive_dirs, limit)
 
         return {
             "success": True,
@@ -601,9 +1194,6 @@ class EntityTools:
         Returns:
             Dict with matching entities
         """
-        query_lower = query.lower()
-        results = []
-
         # Determine which directories to search
         if entity_type:
             directories = [(entity_type, self.schema.get_directory(entity_type))]
@@ -617,28 +1207,7 @@ class EntityTools:
                 for et in entity_types
             ]
 
-        for et, directory in directories:
-            if not directory.exists():
-                continue
-
-            for path in directory.glob("*.md"):
-                if len(results) >= limit:
-                    break
-
-                try:
-                    fm, content = self._parse_file(path)
-                    full_text = f"{fm.get('title', '')} {content}".lower()
-
-                    if query_lower in full_text:
-                        results.append({
-                            "entity_id": self._entity_id_from_path(path),
-                            "entity_type": et,
-                            "title": fm.get("title") or fm.get("name") or path.stem,
-                            "path": str(path.relative_to(self.workspace_path)),
-                            "frontmatter": fm,
-                        })
-                except Exception:
-                    continue
+        results = self._search_directories(query, directories, limit)
 
         return {
             "success": True,
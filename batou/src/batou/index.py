@@ -0,0 +1,213 @@
+"""Persistent on-disk index of parsed entity files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+
+def cache_root() -> Path:
+    """Per-user cache directory for batou.
+
+    Indexes live here rather than in the workspace, which is a git
+    repository that gets auto-committed and pushed.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "batou"
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON default hook: tag YAML dates so they round-trip with their type."""
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    """JSON object hook: restore values tagged by _encode_value."""
+    if len(obj) == 1:
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+        if "$date" in obj:
+            return date.fromisoformat(obj["$date"])
+    return obj
+
+
+class EntityIndex:
+    """SQLite-backed cache of parsed frontmatter and content.
+
+    Rows are keyed by file path and only returned while the file's mtime
+    and size still match, so the markdown files remain the source of truth
+    and a fresh server process can skip YAML parsing for unchanged files.
+
+    put() only buffers rows; flush() writes everything buffered in one
+    transaction, so a scan costs one commit rather than one per file.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open (creating if needed) the index database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Rows written by put() and not yet flushed: path -> row
+        self._pending: dict[str, tuple[str, int, int, str, str | None]] = {}
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        # WAL with synchronous=NORMAL can lose the last commits on power
+        # loss but never corrupts the database
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entities (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                frontmatter TEXT NOT NULL,
+                content TEXT
+            )
+            """
+        )
+
+    @classmethod
+    def open(cls, workspace_path: Path) -> EntityIndex | None:
+        """Open the index for a workspace.
+
+        Args:
+            workspace_path: Path to the workspace root directory
+
+        Returns:
+            EntityIndex under cache_root(), keyed by the resolved workspace
+            path, or None if the workspace is missing or the cache directory
+            is not writable
+        """
+        if not workspace_path.is_dir():
+            return None
+        key = hashlib.sha256(str(workspace_path.resolve()).encode("utf-8")).hexdigest()[:16]
+        try:
+            return cls(cache_root() / f"{key}.db")
+        except (OSError, sqlite3.Error):
+            return None
+
+    def get(self, path: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], str | None] | None:
+        """Look up a parsed file.
+
+        Args:
+            path: File path
+            mtime_ns: Current st_mtime_ns of the file
+            size: Current st_size of the file
+
+        Returns:
+            (frontmatter, content) if indexed for this mtime/size, else None.
+            content is None if only the frontmatter was indexed.
+        """
+        try:
+            with self._lock:
+                pending = self._pending.get(path)
+                if pending is not None and pending[1] == mtime_ns and pending[2] == size:
+                    row = pending[3:]
+                else:
+                    row = self._conn.execute(
+                        "SELECT frontmatter, content FROM entities WHERE path = ? AND mtime_ns = ? AND size = ?",
+                        (path, mtime_ns, size),
+                    ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+        return json.loads(row[0], object_hook=_decode_value), row[1]
+
+    def put(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        frontmatter: dict[str, Any],
+        content: str | None,
+    ) -> None:
+        """Buffer a parsed file for the next flush().
+
+        Frontmatter that can't round-trip through JSON unchanged (sets,
+        binary, non-string keys) is silently left out of the index.
+
+        Args:
+            path: File path
+            mtime_ns: st_mtime_ns the file was parsed at
+            size: st_size the file was parsed at
+            frontmatter: Parsed frontmatter
+            content: Parsed content, or None for a frontmatter-only parse
+        """
+        try:
+            encoded = json.dumps(frontmatter, default=_encode_value)
+        except (TypeError, ValueError):
+            return
+        if json.loads(encoded, object_hook=_decode_value) != frontmatter:
+            return
+
+        with self._lock:
+            self._pending[path] = (path, mtime_ns, size, encoded, content)
+
+    def flush(self) -> None:
+        """Write all buffered rows in one transaction."""
+        with self._lock:
+            if not self._pending:
+                return
+            rows = list(self._pending.values())
+            self._pending.clear()
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entities (path, mtime_ns, size, frontmatter, content) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+
+    def discard(self, path: str) -> None:
+        """Remove a file from the index.
+
+        Args:
+            path: File path
+        """
+        try:
+            with self._lock:
+                self._pending.pop(path, None)
+                self._conn.execute("DELETE FROM entities WHERE path = ?", (path,))
+        except sqlite3.Error:
+            pass
+
+    def rename(self, old_path: str, new_path: str) -> None:
+        """Move a file's row after the file was renamed.
+
+        A rename keeps the file's mtime and size, so the row stays valid
+        under its new path.
+
+        Args:
+            old_path: Path the file was indexed under
+            new_path: Path the file now has
+        """
+        with self._lock:
+            pending = self._pending.pop(old_path, None)
+            if pending is not None:
+                self._pending[new_path] = (new_path, *pending[1:])
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM entities WHERE path = ?", (new_path,))
+                self._conn.execute("UPDATE entities SET path = ? WHERE path = ?", (new_path, old_path))
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
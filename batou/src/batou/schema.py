@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 from datetime import date
 from pathlib import Path
@@ -9,6 +11,21 @@ from typing import Any
 
 import yaml
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Slug building blocks, compiled once at import
+_SEPARATORS = re.compile(r"[\s_]+")
+_HYPHEN_RUNS = re.compile(r"-+")
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+_NON_SLUG_ASCII = bytes(
+    c for c in range(128) if not (chr(c).isdigit() or "a" <= chr(c) <= "z" or chr(c) == "-")
+)
+
 
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug.
@@ -19,16 +36,12 @@ def slugify(text: str) -> str:
     Returns:
         Lowercase slug with hyphens
     """
-    # Lowercase and replace spaces/underscores with hyphens
-    slug = text.lower().strip()
-    slug = re.sub(r'[\s_]+', '-', slug)
-    # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r'[^a-z0-9-]', '', slug)
-    # Collapse multiple hyphens
-    slug = re.sub(r'-+', '-', slug)
-    # Strip leading/trailing hyphens
-    slug = slug.strip('-')
-    return slug
+    # Lowercase and replace whitespace/underscore runs with a hyphen
+    slug = _SEPARATORS.sub("-", text.lower())
+    # Drop everything except a-z, 0-9 and hyphens in one C-level pass
+    slug = slug.encode("ascii", "ignore").translate(None, _NON_SLUG_ASCII).decode("ascii")
+    # Collapse multiple hyphens and strip leading/trailing ones
+    return _HYPHEN_RUNS.sub("-", slug).strip("-")
 
 
 class Schema:
@@ -42,26 +55,48 @@ class Schema:
         """
         self.workspace_path = workspace_path
         self._schema: dict[str, Any] = {}
+        # st_mtime_ns of the schema.yaml last loaded (0 if it was absent)
+        self.loaded_mtime_ns = 0
+
+        # Per-type lookups are pure until reload(), so memoize them per instance
+        self.get_entity_config = functools.lru_cache(maxsize=None)(self._get_entity_config_uncached)
+        self.get_directory = functools.lru_cache(maxsize=None)(self._get_directory_uncached)
+        self.get_required_fields = functools.lru_cache(maxsize=None)(self._get_required_fields_uncached)
+        self.get_defaults = functools.lru_cache(maxsize=None)(self._get_defaults_uncached)
+
         self._load()
 
     def _load(self) -> None:
         """Load schema from .claude/schema.yaml if it exists."""
         schema_path = self.workspace_path / ".claude" / "schema.yaml"
 
-        if schema_path.exists():
-            with open(schema_path) as f:
-                self._schema = yaml.safe_load(f) or {}
+        # Stat before reading: an edit in between then shows up as a changed
+        # mtime on the next check rather than being missed
+        try:
+            self.loaded_mtime_ns = os.stat(schema_path).st_mtime_ns
+        except OSError:
+            # A removed schema reloads as empty, matching the 0 mtime
+            self.loaded_mtime_ns = 0
+            self._schema = {}
+            return
+
+        with open(schema_path) as f:
+            self._schema = yaml.load(f, Loader=SafeLoader) or {}
 
     def reload(self) -> None:
         """Reload schema from disk."""
         self._load()
+        self.get_entity_config.cache_clear()
+        self.get_directory.cache_clear()
+        self.get_required_fields.cache_clear()
+        self.get_defaults.cache_clear()
 
     @property
     def entities(self) -> dict[str, dict]:
         """Get entity type definitions."""
         return self._schema.get("entities", {})
 
-    def get_entity_config(self, entity_type: str) -> dict[str, Any]:
+    def _get_entity_config_uncached(self, entity_type: str) -> dict[str, Any]:
         """Get configuration for an entity type.
 
         Args:
@@ -70,6 +105,7 @@ class Schema:
         Returns:
             Entity configuration dict with directory, naming, frontmatter rules.
             Returns sensible defaults if entity type not defined in schema.
+            Cached (as get_entity_config) until reload(); do not mutate.
         """
         config = self.entities.get(entity_type, {})
 
@@ -81,7 +117,7 @@ class Schema:
             "frontmatter": config.get("frontmatter", {}),
         }
 
-    def get_directory(self, entity_type: str) -> Path:
+    def _get_directory_uncached(self, entity_type: str) -> Path:
         """Get the directory path for an entity type.
 
         Args:
@@ -93,26 +129,27 @@ class Schema:
         config = self.get_entity_config(entity_type)
         return self.workspace_path / config["directory"]
 
-    def get_required_fields(self, entity_type: str) -> list[str]:
+    def _get_required_fields_uncached(self, entity_type: str) -> list[str]:
         """Get required frontmatter fields for an entity type.
 
         Args:
             entity_type: The entity type name
 
         Returns:
-            List of required field names
+            List of required field names (cached until reload(); do not mutate)
         """
         config = self.get_entity_config(entity_type)
         return config.get("frontmatter", {}).get("required", [])
 
-    def get_defaults(self, entity_type: str) -> dict[str, Any]:
+    def _get_defaults_uncached(self, entity_type: str) -> dict[str, Any]:
         """Get default frontmatter values for an entity type.
 
         Args:
             entity_type: The entity type name
 
         Returns:
-            Dict of field names to default values
+            Dict of field names to default values (cached until reload();
+            do not mutate)
         """
         config = self.get_entity_config(entity_type)
         return config.get("frontmatter", {}).get("defaults", {})
@@ -127,32 +164,24 @@ class Schema:
         Returns:
             Generated filename (e.g., 'my-task.md', '2024-01-15.md')
         """
-        config = self.get_entity_config(entity_type)
-        naming = config["naming"]
-
-        # Build substitution dict with special values
-        subs = dict(frontmatter)
-
-        # Handle {slug} - derive from title if not explicitly provided
-        if "{slug}" in naming and "slug" not in subs:
-            title = frontmatter.get("title", "untitled")
-            subs["slug"] = slugify(title)
-
-        # Handle {date} - use today if not provided
-        if "{date}" in naming and "date" not in subs:
-            subs["date"] = date.today().isoformat()
-
-        # Handle {number} - would need to scan directory for next number
-        # For now, leave it for the caller to provide
-
-        # Template substitution
-        filename = naming
-        for key, value in subs.items():
-            placeholder = "{" + key + "}"
-            if placeholder in filename:
-                filename = filename.replace(placeholder, str(value))
-
-        return filename
+        naming = self.get_entity_config(entity_type)["naming"]
+
+        def substitute(match: re.Match) -> str:
+            key = match.group(1)
+            if key in frontmatter:
+                return str(frontmatter[key])
+            # Handle {slug} - derive from title if not explicitly provided
+            if key == "slug":
+                return slugify(frontmatter.get("title", "untitled"))
+            # Handle {date} - use today if not provided
+            if key == "date":
+                return date.today().isoformat()
+            # Handle {number} - would need to scan directory for next number
+            # For now, leave it (and any unknown placeholder) for the caller
+            return match.group(0)
+
+        # Template substitution in a single pass
+        return _PLACEHOLDER.sub(substitute, naming)
 
     def has_entity_type(self, entity_type: str) -> bool:
         """Check if an entity type is defined in the schema.
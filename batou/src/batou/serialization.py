@@ -0,0 +1,30 @@
+"""JSON serialization for tool results."""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import orjson
+
+# Compact output by default; BATOU_PRETTY=1 indents responses for debugging.
+# Dates and datetimes go through default=str so they keep the str(datetime)
+# format ("2024-01-02 03:04:05") that json.dumps(default=str) produced.
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+if os.environ.get("BATOU_PRETTY") == "1":
+    _OPTIONS |= orjson.OPT_INDENT_2
+
+
+def to_json(result: Any) -> str:
+    """Serialize a tool result to JSON text.
+
+    Uses orjson. Dates and datetimes from YAML frontmatter, and anything
+    else it can't encode, fall back to str().
+
+    Args:
+        result: Result dict returned by EntityTools or LibraryTools
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(result, default=str, option=_OPTIONS).decode("utf-8")
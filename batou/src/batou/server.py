@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-import json
+import argparse
+import asyncio
 import logging
 import os
+import threading
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from batou.entities import EntityTools
-from batou.library import LibraryTools
+from batou.serialization import to_json
+
+# Entity and library tools pull in YAML and the librarian; import them on first use
+if TYPE_CHECKING:
+    from batou.entities import EntityTools
+    from batou.library import LibraryTools
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,512 +32,497 @@ server = Server("batou")
 # Tools instances (initialized from WORKSPACE_PATH env var)
 _entity_tools: EntityTools | None = None
 _library_tools: LibraryTools | None = None
+# Tool calls run on worker threads, so guard first-call initialization
+_init_lock = threading.Lock()
+
+# Serialized get_schema reply, keyed on the loaded schema's st_mtime_ns
+_schema_reply: tuple[int, str] | None = None
 
 
 def get_entity_tools() -> EntityTools:
     """Get or create EntityTools instance."""
     global _entity_tools
-    if _entity_tools is None:
+    if _entity_tools is not None:
+        return _entity_tools
+
+    with _init_lock:
+        if _entity_tools is not None:
+            return _entity_tools
+
         cwd = os.getcwd()
         env_workspace = os.environ.get("WORKSPACE_PATH")
         workspace_path = env_workspace or cwd
 
-        logger.info(f"[BATOU] cwd: {cwd}")
-        logger.info(f"[BATOU] WORKSPACE_PATH env: {env_workspace}")
-        logger.info(f"[BATOU] Using workspace: {workspace_path}")
-        logger.info(f"[BATOU] Workspace exists: {Path(workspace_path).exists()}")
-        logger.info(f"[BATOU] Workspace contents: {list(Path(workspace_path).iterdir()) if Path(workspace_path).exists() else 'N/A'}")
+        logger.info("[BATOU] cwd: %s", cwd)
+        logger.info("[BATOU] WORKSPACE_PATH env: %s", env_workspace)
+        logger.info("[BATOU] Using workspace: %s", workspace_path)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[BATOU] Workspace exists: %s", os.path.isdir(workspace_path))
+        # Listing the workspace can enumerate thousands of entries; debug only
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[BATOU] Workspace contents: %s",
+                os.listdir(workspace_path) if os.path.isdir(workspace_path) else "N/A",
+            )
+
+        from batou.entities import EntityTools
 
         _entity_tools = EntityTools(workspace_path)
-        logger.info(f"[BATOU] EntityTools initialized")
-    return _entity_tools
+        logger.info("[BATOU] EntityTools initialized")
+        return _entity_tools
 
 
 def get_library_tools() -> LibraryTools:
     """Get or create LibraryTools instance."""
     global _library_tools
-    if _library_tools is None:
-        workspace_path = os.environ.get("WORKSPACE_PATH") or os.getcwd()
-        _library_tools = LibraryTools(workspace_path)
-        logger.info(f"[BATOU] LibraryTools initialized")
-    return _library_tools
-
-
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    return [
-        Tool(
-            name="list_entities",
-            description="List entities of a given type with optional filtering. Returns entity IDs, titles, status, and paths. By default excludes archived entities.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type (e.g., 'tasks', 'notes', 'projects', 'journal')",
-                    },
-                    "status": {
-                        "type": "string",
-                        "description": "Filter by status (e.g., 'open', 'done', 'archived'). Optional.",
-                    },
-                    "include_archived": {
-                        "type": "boolean",
-                        "description": "Include archived entities (default false). Set true to see all entities including archived.",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (default 50)",
-                    },
+    if _library_tools is not None:
+        return _library_tools
+
+    with _init_lock:
+        if _library_tools is None:
+            from batou.library import LibraryTools
+
+            workspace_path = os.environ.get("WORKSPACE_PATH") or os.getcwd()
+            _library_tools = LibraryTools(workspace_path)
+            logger.info("[BATOU] LibraryTools initialized")
+        return _library_tools
+
+
+# Shared input-schema fragments. Tools reference these objects rather than
+# each carrying its own copy, so treat them as read-only.
+_ENTITY_TYPE_PROP = {"type": "string", "description": "Entity type"}
+_ENTITY_ID_PROP = {"type": "string", "description": "Entity ID"}
+_QUERY_PROP = {"type": "string", "description": "Search query"}
+_ENTITY_TYPE_FILTER_PROP = {"type": "string", "description": "Filter to specific entity type (optional)"}
+_LIMIT_50_PROP = {"type": "integer", "description": "Maximum number of results (default 50)"}
+_LIMIT_10_PROP = {"type": "integer", "description": "Maximum results (default 10)"}
+_TOPIC_FILTER_PROP = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": "Filter by topic IDs (optional)",
+}
+_NO_ARGS_SCHEMA = {"type": "object", "properties": {}}
+_ENTITY_REF_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "entity_type": _ENTITY_TYPE_PROP,
+        "entity_id": _ENTITY_ID_PROP,
+    },
+    "required": ["entity_type", "entity_id"],
+}
+
+# Tool definitions are static, so build them once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="list_entities",
+        description="List entities of a given type with optional filtering. Returns entity IDs, titles, status, and paths. By default excludes archived entities.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": {
+                    "type": "string",
+                    "description": "Entity type (e.g., 'tasks', 'notes', 'projects', 'journal')",
                 },
-                "required": ["entity_type"],
-            },
-        ),
-        Tool(
-            name="get_entity",
-            description="Get a specific entity by type and ID. Returns frontmatter and full content.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type",
-                    },
-                    "entity_id": {
-                        "type": "string",
-                        "description": "Entity ID (filename without .md extension)",
-                    },
+                "status": {
+                    "type": "string",
+                    "description": "Filter by status (e.g., 'open', 'done', 'archived'). Optional.",
                 },
-                "required": ["entity_type", "entity_id"],
-            },
-        ),
-        Tool(
-            name="create_entity",
-            description="Create a new entity with frontmatter and content. Applies schema defaults and validates required fields.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type",
-                    },
-                    "frontmatter": {
-                        "type": "object",
-                        "description": "Entity frontmatter (title, status, slug, etc.)",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Markdown content body",
-                    },
+                "include_archived": {
+                    "type": "boolean",
+                    "description": "Include archived entities (default false). Set true to see all entities including archived.",
                 },
-                "required": ["entity_type", "frontmatter", "content"],
+                "limit": _LIMIT_50_PROP,
             },
-        ),
-        Tool(
-            name="update_entity",
-            description="Update an existing entity's frontmatter and/or content. Frontmatter is merged with existing values.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type",
-                    },
-                    "entity_id": {
-                        "type": "string",
-                        "description": "Entity ID",
-                    },
-                    "frontmatter": {
-                        "type": "object",
-                        "description": "Frontmatter updates (merged with existing)",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "New content (replaces existing if provided)",
-                    },
+            "required": ["entity_type"],
+        },
+    ),
+    Tool(
+        name="get_entity",
+        description="Get a specific entity by type and ID. Returns frontmatter and full content.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": _ENTITY_TYPE_PROP,
+                "entity_id": {
+                    "type": "string",
+                    "description": "Entity ID (filename without .md extension)",
                 },
-                "required": ["entity_type", "entity_id"],
             },
-        ),
-        Tool(
-            name="delete_entity",
-            description="Delete an entity by type and ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type",
-                    },
-                    "entity_id": {
-                        "type": "string",
-                        "description": "Entity ID",
-                    },
+            "required": ["entity_type", "entity_id"],
+        },
+    ),
+    Tool(
+        name="create_entity",
+        description="Create a new entity with frontmatter and content. Applies schema defaults and validates required fields.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": _ENTITY_TYPE_PROP,
+                "frontmatter": {
+                    "type": "object",
+                    "description": "Entity frontmatter (title, status, slug, etc.)",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Markdown content body",
                 },
-                "required": ["entity_type", "entity_id"],
             },
-        ),
-        Tool(
-            name="search_entities",
-            description="Search entities by text content (case-insensitive substring match).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                    },
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Filter to specific entity type (optional)",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum results (default 10)",
-                    },
+            "required": ["entity_type", "frontmatter", "content"],
+        },
+    ),
+    Tool(
+        name="update_entity",
+        description="Update an existing entity's frontmatter and/or content. Frontmatter is merged with existing values.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": _ENTITY_TYPE_PROP,
+                "entity_id": _ENTITY_ID_PROP,
+                "frontmatter": {
+                    "type": "object",
+                    "description": "Frontmatter updates (merged with existing)",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "New content (replaces existing if provided)",
                 },
-                "required": ["query"],
             },
-        ),
-        Tool(
-            name="get_schema",
-            description="Get information about the workspace schema, including defined entity types and their configuration.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["entity_type", "entity_id"],
+        },
+    ),
+    Tool(
+        name="delete_entity",
+        description="Delete an entity by type and ID.",
+        inputSchema=_ENTITY_REF_SCHEMA,
+    ),
+    Tool(
+        name="search_entities",
+        description="Search entities by text content (case-insensitive substring match).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": _QUERY_PROP,
+                "entity_type": _ENTITY_TYPE_FILTER_PROP,
+                "limit": _LIMIT_10_PROP,
             },
-        ),
-        Tool(
-            name="debug_info",
-            description="Get debug information about batou's configuration (cwd, workspace path, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_schema",
+        description="Get information about the workspace schema, including defined entity types and their configuration.",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="debug_info",
+        description="Get debug information about batou's configuration (cwd, workspace path, etc.)",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="archive_entity",
+        description="Archive an entity by moving it to zzz_archive/. Blocks if other active entities reference this one.",
+        inputSchema=_ENTITY_REF_SCHEMA,
+    ),
+    Tool(
+        name="unarchive_entity",
+        description="Unarchive an entity by moving it back from zzz_archive/ to the main directory.",
+        inputSchema=_ENTITY_REF_SCHEMA,
+    ),
+    Tool(
+        name="list_archived_entities",
+        description="List archived entities of a given type from zzz_archive/.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": _ENTITY_TYPE_PROP,
+                "limit": _LIMIT_50_PROP,
             },
-        ),
-        Tool(
-            name="archive_entity",
-            description="Archive an entity by moving it to zzz_archive/. Blocks if other active entities reference this one.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type",
-                    },
-                    "entity_id": {
-                        "type": "string",
-                        "description": "Entity ID",
-                    },
-                },
-                "required": ["entity_type", "entity_id"],
+            "required": ["entity_type"],
+        },
+    ),
+    Tool(
+        name="search_archived",
+        description="Search archived entities by text content (case-insensitive substring match).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": _QUERY_PROP,
+                "entity_type": _ENTITY_TYPE_FILTER_PROP,
+                "limit": _LIMIT_10_PROP,
             },
-        ),
-        Tool(
-            name="unarchive_entity",
-            description="Unarchive an entity by moving it back from zzz_archive/ to the main directory.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type",
-                    },
-                    "entity_id": {
-                        "type": "string",
-                        "description": "Entity ID",
-                    },
+            "required": ["query"],
+        },
+    ),
+    # Library tools for querying ingested documents
+    Tool(
+        name="browse_topics",
+        description="Browse library topics/concepts. Returns topics with document counts. Use to explore what knowledge is available in the library.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic_id": {
+                    "type": "string",
+                    "description": "Get details for a specific topic ID (optional)",
                 },
-                "required": ["entity_type", "entity_id"],
-            },
-        ),
-        Tool(
-            name="list_archived_entities",
-            description="List archived entities of a given type from zzz_archive/.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Entity type",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results (default 50)",
-                    },
+                "include_counts": {
+                    "type": "boolean",
+                    "description": "Include document counts (default true)",
                 },
-                "required": ["entity_type"],
             },
-        ),
-        Tool(
-            name="search_archived",
-            description="Search archived entities by text content (case-insensitive substring match).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                    },
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Filter to specific entity type (optional)",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum results (default 10)",
-                    },
+        },
+    ),
+    Tool(
+        name="find_documents",
+        description="Search for documents in the library by query. Returns documents with summaries at the requested level. Use to find relevant external content.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (matches titles, summaries, topics)",
                 },
-                "required": ["query"],
-            },
-        ),
-        # Library tools for querying ingested documents
-        Tool(
-            name="browse_topics",
-            description="Browse library topics/concepts. Returns topics with document counts. Use to explore what knowledge is available in the library.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic_id": {
-                        "type": "string",
-                        "description": "Get details for a specific topic ID (optional)",
-                    },
-                    "include_counts": {
-                        "type": "boolean",
-                        "description": "Include document counts (default true)",
-                    },
+                "topic_filter": _TOPIC_FILTER_PROP,
+                "doc_type_filter": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filter by document types (transcript, article, etc.)",
                 },
-            },
-        ),
-        Tool(
-            name="find_documents",
-            description="Search for documents in the library by query. Returns documents with summaries at the requested level. Use to find relevant external content.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (matches titles, summaries, topics)",
-                    },
-                    "topic_filter": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by topic IDs (optional)",
-                    },
-                    "doc_type_filter": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by document types (transcript, article, etc.)",
-                    },
-                    "summary_level": {
-                        "type": "string",
-                        "enum": ["brief", "standard", "detailed"],
-                        "description": "Summary level to return (default: standard)",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum results (default 10)",
-                    },
+                "summary_level": {
+                    "type": "string",
+                    "enum": ["brief", "standard", "detailed"],
+                    "description": "Summary level to return (default: standard)",
                 },
-                "required": ["query"],
+                "max_results": _LIMIT_10_PROP,
             },
-        ),
-        Tool(
-            name="get_library_document",
-            description="Get a specific document from the library by ID. Returns full details including summaries and optionally full content.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_id": {
-                        "type": "string",
-                        "description": "Document ID",
-                    },
-                    "include_summary": {
-                        "type": "boolean",
-                        "description": "Include summaries (default true)",
-                    },
-                    "include_content": {
-                        "type": "boolean",
-                        "description": "Include full document content (default false)",
-                    },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_library_document",
+        description="Get a specific document from the library by ID. Returns full details including summaries and optionally full content.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_id": {
+                    "type": "string",
+                    "description": "Document ID",
+                },
+                "include_summary": {
+                    "type": "boolean",
+                    "description": "Include summaries (default true)",
+                },
+                "include_content": {
+                    "type": "boolean",
+                    "description": "Include full document content (default false)",
                 },
-                "required": ["document_id"],
             },
-        ),
-        Tool(
-            name="list_library_documents",
-            description="List all documents in the library with optional filtering by topic or type.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic_filter": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by topic IDs (optional)",
-                    },
-                    "doc_type_filter": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by document types (optional)",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum results (default 50)",
-                    },
+            "required": ["document_id"],
+        },
+    ),
+    Tool(
+        name="list_library_documents",
+        description="List all documents in the library with optional filtering by topic or type.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic_filter": _TOPIC_FILTER_PROP,
+                "doc_type_filter": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filter by document types (optional)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum results (default 50)",
                 },
             },
-        ),
-    ]
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools."""
+    return _TOOLS
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls."""
+    """Handle tool calls.
+
+    Handlers do blocking filesystem work, so they (and result encoding) run
+    on a worker thread and concurrent calls overlap instead of stalling the
+    event loop. The shared EntityTools and LibraryTools instances must
+    therefore be thread-safe (LibraryIndex locks its own operations).
+    """
     try:
-        result = _dispatch_tool(name, arguments)
-        return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+        text = await asyncio.to_thread(_render_tool, name, arguments)
+        return [TextContent(type="text", text=text)]
     except Exception as e:
-        logger.exception(f"Tool {name} failed")
+        logger.exception("Tool %s failed", name)
         error_result = {
             "success": False,
             "error": str(e),
         }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+        return [TextContent(type="text", text=to_json(error_result))]
 
 
-def _dispatch_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-    """Dispatch tool call to appropriate handler."""
-    tools = get_entity_tools()
+def _debug_info(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Report batou's view of its working directory and workspace."""
+    cwd = os.getcwd()
+    env_workspace = os.environ.get("WORKSPACE_PATH")
+    workspace_path = env_workspace or cwd
 
-    if name == "list_entities":
-        return tools.list_entities(
-            arguments["entity_type"],
-            arguments.get("status"),
-            arguments.get("include_archived", False),
-            arguments.get("limit", 50),
-        )
-
-    elif name == "get_entity":
-        return tools.get_entity(
-            arguments["entity_type"],
-            arguments["entity_id"],
-        )
-
-    elif name == "create_entity":
-        return tools.create_entity(
-            arguments["entity_type"],
-            arguments["frontmatter"],
-            arguments["content"],
-        )
-
-    elif name == "update_entity":
-        return tools.update_entity(
-            arguments["entity_type"],
-            arguments["entity_id"],
-            arguments.get("frontmatter"),
-            arguments.get("content"),
-        )
-
-    elif name == "delete_entity":
-        return tools.delete_entity(
-            arguments["entity_type"],
-            arguments["entity_id"],
-        )
-
-    elif name == "search_entities":
-        return tools.search_entities(
-            arguments["query"],
-            arguments.get("entity_type"),
-            arguments.get("limit", 10),
-        )
-
-    elif name == "get_schema":
-        return tools.get_schema_info()
-
-    elif name == "archive_entity":
-        return tools.archive_entity(
-            arguments["entity_type"],
-            arguments["entity_id"],
-        )
-
-    elif name == "unarchive_entity":
-        return tools.unarchive_entity(
-            arguments["entity_type"],
-            arguments["entity_id"],
-        )
-
-    elif name == "list_archived_entities":
-        return tools.list_archived_entities(
-            arguments["entity_type"],
-            arguments.get("limit", 50),
-        )
-
-    elif name == "search_archived":
-        return tools.search_archived(
-            arguments["query"],
-            arguments.get("entity_type"),
-            arguments.get("limit", 10),
-        )
-
-    elif name == "debug_info":
-        cwd = os.getcwd()
-        env_workspace = os.environ.get("WORKSPACE_PATH")
-        workspace_path = env_workspace or cwd
-        workspace = Path(workspace_path)
-        return {
-            "success": True,
-            "cwd": cwd,
-            "WORKSPACE_PATH_env": env_workspace,
-            "effective_workspace": workspace_path,
-            "workspace_exists": workspace.exists(),
-            "workspace_contents": [p.name for p in workspace.iterdir()] if workspace.exists() else [],
-            "projects_dir_exists": (workspace / "projects").exists(),
-            "projects_count": len(list((workspace / "projects").glob("*.md"))) if (workspace / "projects").exists() else 0,
-        }
+    # scandir doubles as the existence check and builds no Path objects
+    try:
+        with os.scandir(workspace_path) as it:
+            workspace_contents = [entry.name for entry in it]
+        workspace_exists = True
+    except OSError:
+        # Missing, unreadable, or not a directory
+        workspace_contents = []
+        workspace_exists = os.path.exists(workspace_path)
 
+    try:
+        with os.scandir(os.path.join(workspace_path, "projects")) as it:
+            projects_count = sum(1 for entry in it if entry.name.endswith(".md"))
+        projects_dir_exists = True
+    except OSError:
+        projects_count = 0
+        projects_dir_exists = os.path.exists(os.path.join(workspace_path, "projects"))
+
+    return {
+        "success": True,
+        "cwd": cwd,
+        "WORKSPACE_PATH_env": env_workspace,
+        "effective_workspace": workspace_path,
+        "workspace_exists": workspace_exists,
+        "workspace_contents": workspace_contents,
+        "projects_dir_exists": projects_dir_exists,
+        "projects_count": projects_count,
+    }
+
+
+# Tool name -> handler(arguments), built once so dispatch is a single lookup
+_DISPATCH: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "list_entities": lambda a: get_entity_tools().list_entities(
+        a["entity_type"],
+        a.get("status"),
+        a.get("include_archived", False),
+        a.get("limit", 50),
+    ),
+    "get_entity": lambda a: get_entity_tools().get_entity(
+        a["entity_type"],
+        a["entity_id"],
+    ),
+    "create_entity": lambda a: get_entity_tools().create_entity(
+        a["entity_type"],
+        a["frontmatter"],
+        a["content"],
+    ),
+    "update_entity": lambda a: get_entity_tools().update_entity(
+        a["entity_type"],
+        a["entity_id"],
+        a.get("frontmatter"),
+        a.get("content"),
+    ),
+    "delete_entity": lambda a: get_entity_tools().delete_entity(
+        a["entity_type"],
+        a["entity_id"],
+    ),
+    "search_entities": lambda a: get_entity_tools().search_entities(
+        a["query"],
+        a.get("entity_type"),
+        a.get("limit", 10),
+    ),
+    "archive_entity": lambda a: get_entity_tools().archive_entity(
+        a["entity_type"],
+        a["entity_id"],
+    ),
+    "unarchive_entity": lambda a: get_entity_tools().unarchive_entity(
+        a["entity_type"],
+        a["entity_id"],
+    ),
+    "list_archived_entities": lambda a: get_entity_tools().list_archived_entities(
+        a["entity_type"],
+        a.get("limit", 50),
+    ),
+    "search_archived": lambda a: get_entity_tools().search_archived(
+        a["query"],
+        a.get("entity_type"),
+        a.get("limit", 10),
+    ),
+    "debug_info": _debug_info,
     # Library tools
-    elif name == "browse_topics":
-        library = get_library_tools()
-        return library.browse_topics(
-            arguments.get("topic_id"),
-            arguments.get("include_counts", True),
-        )
-
-    elif name == "find_documents":
-        library = get_library_tools()
-        return library.find_documents(
-            arguments["query"],
-            arguments.get("topic_filter"),
-            arguments.get("doc_type_filter"),
-            arguments.get("summary_level", "standard"),
-            arguments.get("max_results", 10),
-        )
-
-    elif name == "get_library_document":
-        library = get_library_tools()
-        return library.get_document(
-            arguments["document_id"],
-            arguments.get("include_summary", True),
-            arguments.get("include_content", False),
-        )
-
-    elif name == "list_library_documents":
-        library = get_library_tools()
-        return library.list_documents(
-            arguments.get("topic_filter"),
-            arguments.get("doc_type_filter"),
-            arguments.get("limit", 50),
-        )
-
-    else:
+    "browse_topics": lambda a: get_library_tools().browse_topics(
+        a.get("topic_id"),
+        a.get("include_counts", True),
+    ),
+    "find_documents": lambda a: get_library_tools().find_documents(
+        a["query"],
+        a.get("topic_filter"),
+        a.get("doc_type_filter"),
+        a.get("summary_level", "standard"),
+        a.get("max_results", 10),
+    ),
+    "get_library_document": lambda a: get_library_tools().get_document(
+        a["document_id"],
+        a.get("include_summary", True),
+        a.get("include_content", False),
+    ),
+    "list_library_documents": lambda a: get_library_tools().list_documents(
+        a.get("topic_filter"),
+        a.get("doc_type_filter"),
+        a.get("limit", 50),
+    ),
+}
+
+
+def _schema_text() -> str:
+    """Get the serialized get_schema reply, re-encoding only when schema.yaml changes.
+
+    The schema is reloaded whenever schema.yaml's mtime differs from the one
+    it was loaded at, so edits show up without a restart, including edits
+    made before the first get_schema call.
+    """
+    global _schema_reply
+    tools = get_entity_tools()
+    try:
+        mtime_ns = os.stat(tools.workspace_path / ".claude" / "schema.yaml").st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+
+    if mtime_ns != tools.schema.loaded_mtime_ns:
+        tools.schema.reload()
+    loaded_mtime_ns = tools.schema.loaded_mtime_ns
+
+    reply = _schema_reply
+    if reply is not None and reply[0] == loaded_mtime_ns:
+        return reply[1]
+
+    text = to_json(tools.get_schema_info())
+    _schema_reply = (loaded_mtime_ns, text)
+    return text
+
+
+def _render_tool(name: str, arguments: dict[str, Any]) -> str:
+    """Run a tool and serialize its result to the JSON text sent to the client."""
+    if name == "get_schema":
+        return _schema_text()
+    return to_json(_dispatch_tool(name, arguments))
+
+
+def _dispatch_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Dispatch tool call to appropriate handler."""
+    handler = _DISPATCH.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return handler(arguments)
 
 
 def main():
     """Run the MCP server."""
-    import argparse
-    import asyncio
-
     parser = argparse.ArgumentParser(description="Batou MCP server")
     parser.add_argument("--workspace", help="Workspace path (overrides WORKSPACE_PATH env var)")
     args = parser.parse_args()
@@ -544,7 +536,7 @@ def main():
             # Try to resolve - but cwd is wrong at this point
             workspace = workspace.resolve()
         os.environ["WORKSPACE_PATH"] = str(workspace)
-        logger.info(f"[BATOU] --workspace arg set WORKSPACE_PATH to: {workspace}")
+        logger.info("[BATOU] --workspace arg set WORKSPACE_PATH to: %s", workspace)
 
     async def run():
         async with stdio_server() as (read_stream, write_stream):
@@ -0,0 +1,38 @@
+"""Shared fixtures for batou tests."""
+
+from pathlib import Path
+
+import pytest
+
+from batou.entities import EntityTools
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the per-user cache directory at a temp dir."""
+    home = tmp_path / "cache-home"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    return home
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """An empty workspace directory."""
+    path = tmp_path / "workspace"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def tools(workspace: Path) -> EntityTools:
+    """EntityTools for the empty workspace."""
+    return EntityTools(workspace)
+
+
+def write_entity(workspace: Path, entity_type: str, entity_id: str, text: str) -> Path:
+    """Write a raw markdown entity file and return its path."""
+    directory = workspace / entity_type
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{entity_id}.md"
+    path.write_text(text, encoding="utf-8")
+    return path
@@ -0,0 +1,92 @@
+"""Tests for EntityTools' in-process caches."""
+
+import os
+import shutil
+
+from batou.entities import EntityTools
+
+from conftest import write_entity
+
+
+def test_same_instance_sees_external_edits(workspace, tools):
+    path = write_entity(workspace, "notes", "a", "---\ntitle: Old\n---\n\nold body\n")
+    assert tools.get_entity("notes", "a")["content"].strip() == "old body"
+
+    path.write_text("---\ntitle: New\n---\n\nnew body, longer\n")
+    result = tools.get_entity("notes", "a")
+
+    assert result["frontmatter"]["title"] == "New"
+    assert result["content"].strip() == "new body, longer"
+
+
+def test_updates_do_not_change_earlier_results(workspace, tools):
+    write_entity(workspace, "notes", "a", "---\ntitle: A\n---\n\nbody\n")
+    first = tools.get_entity("notes", "a")
+
+    tools.update_entity("notes", "a", frontmatter={"status": "done"})
+    tools.update_entity("notes", "a", frontmatter={"owner": "sam"}, content="new body")
+
+    assert first["frontmatter"] == {"title": "A"}
+    second = tools.get_entity("notes", "a")
+    assert second["frontmatter"]["status"] == "done"
+    assert second["frontmatter"]["owner"] == "sam"
+    assert second["content"].strip() == "new body"
+
+
+def test_listing_reflects_create_and_delete(workspace, tools):
+    tools.create_entity("notes", {"title": "First"}, "body")
+    assert [e["title"] for e in tools.list_entities("notes")["entities"]] == ["First"]
+
+    tools.delete_entity("notes", "first")
+    assert tools.list_entities("notes")["entities"] == []
+
+
+def test_removed_directory_is_recreated_on_write(workspace, tools):
+    tools.create_entity("notes", {"title": "First"}, "body")
+    shutil.rmtree(workspace / "notes")
+
+    result = tools.create_entity("notes", {"title": "Second"}, "body")
+
+    assert result["success"], result
+    assert (workspace / "notes" / "second.md").exists()
+
+
+def test_schema_lookups_follow_reload(workspace):
+    schema_path = workspace / ".claude" / "schema.yaml"
+    schema_path.parent.mkdir()
+    schema_path.write_text("entities:\n  notes:\n    directory: notes\n")
+    tools = EntityTools(workspace)
+    assert tools.schema.get_directory("notes") == workspace / "notes"
+
+    schema_path.write_text("entities:\n  notes:\n    directory: docs/notes\n")
+    assert tools.schema.get_directory("notes") == workspace / "notes"
+
+    tools.schema.reload()
+    assert tools.schema.get_directory("notes") == workspace / "docs" / "notes"
+
+
+def test_temp_files_are_not_left_behind(workspace, tools):
+    tools.create_entity("notes", {"title": "First"}, "body")
+    tools.update_entity("notes", "first", frontmatter={"status": "done"})
+
+    assert sorted(os.listdir(workspace / "notes")) == ["first.md"]
+
+
+def test_schema_records_the_mtime_it_was_loaded_at(workspace):
+    schema_path = workspace / ".claude" / "schema.yaml"
+    tools = EntityTools(workspace)
+    assert tools.schema.loaded_mtime_ns == 0
+
+    schema_path.parent.mkdir()
+    schema_path.write_text("entities:\n  notes:\n    directory: notes\n")
+    # Edited after loading: the recorded mtime no longer matches the file
+    assert tools.schema.loaded_mtime_ns != os.stat(schema_path).st_mtime_ns
+
+    tools.schema.reload()
+    assert tools.schema.loaded_mtime_ns == os.stat(schema_path).st_mtime_ns
+    assert tools.schema.list_entity_types() == ["notes"]
+
+    schema_path.unlink()
+    tools.schema.reload()
+    assert tools.schema.loaded_mtime_ns == 0
+    assert tools.schema.list_entity_types() == []
@@ -0,0 +1,155 @@
+"""Tests for the on-disk entity index."""
+
+import sqlite3
+import threading
+from datetime import date
+
+import pytest
+
+from batou import entities
+from batou.entities import EntityTools
+from batou.index import EntityIndex
+
+from conftest import write_entity
+
+
+def _rows(tools: EntityTools) -> dict[str, str]:
+    """Indexed path -> frontmatter JSON, read straight from the database."""
+    tools._index.flush()
+    return dict(tools._index._conn.execute("SELECT path, frontmatter FROM entities"))
+
+
+def _forbid_yaml(monkeypatch: pytest.MonkeyPatch):
+    """Make any YAML parse fail, so only indexed results can be served."""
+    monkeypatch.setattr(entities.yaml, "load", lambda *args, **kwargs: pytest.fail("YAML parsed"))
+
+
+def test_index_lives_outside_the_workspace(workspace, tools, cache_home):
+    write_entity(workspace, "notes", "a", "---\ntitle: A\n---\n\nbody\n")
+    tools.list_entities("notes")
+
+    assert list(cache_home.glob("batou/*.db"))
+    assert sorted(p.name for p in workspace.iterdir()) == ["notes"]
+
+
+def test_hit_skips_parsing(workspace, monkeypatch):
+    write_entity(workspace, "notes", "a", "---\ntitle: A\ndue: 2024-01-02\n---\n\nbody\n")
+    EntityTools(workspace).get_entity("notes", "a")
+
+    _forbid_yaml(monkeypatch)
+    result = EntityTools(workspace).get_entity("notes", "a")
+
+    assert result["frontmatter"] == {"title": "A", "due": date(2024, 1, 2)}
+    assert result["content"] == "body"
+
+
+def test_change_invalidates(workspace, tools):
+    path = write_entity(workspace, "notes", "a", "---\ntitle: Old\n---\n\nbody\n")
+    tools.get_entity("notes", "a")
+
+    path.write_text("---\ntitle: New title\n---\n\nbody\n")
+    result = EntityTools(workspace).get_entity("notes", "a")
+
+    assert result["frontmatter"]["title"] == "New title"
+
+
+def test_rows_are_buffered_until_the_operation_ends(workspace, tools):
+    for i in range(5):
+        write_entity(workspace, "notes", f"n{i}", f"---\ntitle: N{i}\n---\n\nbody\n")
+
+    tools._parse_frontmatter_only(workspace / "notes" / "n0.md")
+    assert tools._index._conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0] == 0
+
+    tools.list_entities("notes")
+    assert tools._index._conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0] == 5
+
+
+def test_delete_removes_row(workspace, tools):
+    path = write_entity(workspace, "notes", "a", "---\ntitle: A\n---\n\nbody\n")
+    tools.get_entity("notes", "a")
+    assert str(path) in _rows(tools)
+
+    tools.delete_entity("notes", "a")
+
+    assert str(path) not in _rows(tools)
+
+
+def test_archive_and_unarchive_move_rows(workspace, tools, monkeypatch):
+    path = write_entity(workspace, "notes", "a", "---\ntitle: A\n---\n\nbody\n")
+    archived = workspace / "notes" / entities.ARCHIVE_DIR / "a.md"
+    tools.get_entity("notes", "a")
+
+    assert tools.archive_entity("notes", "a")["success"]
+    assert set(_rows(tools)) == {str(archived)}
+
+    _forbid_yaml(monkeypatch)
+    assert EntityTools(workspace).get_entity("notes", "a")["archived"] is True
+    monkeypatch.undo()
+
+    assert tools.unarchive_entity("notes", "a")["success"]
+    assert set(_rows(tools)) == {str(path)}
+
+
+def test_unserializable_frontmatter_is_not_indexed(tmp_path):
+    index = EntityIndex(tmp_path / "index.db")
+    index.put("p", 1, 2, {"tags": {"a", "b"}}, "body")
+    index.flush()
+
+    assert index.get("p", 1, 2) is None
+
+
+def test_stale_row_is_ignored(tmp_path):
+    index = EntityIndex(tmp_path / "index.db")
+    index.put("p", 1, 2, {"title": "A"}, None)
+    index.flush()
+
+    assert index.get("p", 1, 2) == ({"title": "A"}, None)
+    assert index.get("p", 1, 3) is None
+    assert index.get("p", 9, 2) is None
+
+
+def test_concurrent_writers(tmp_path):
+    db_path = tmp_path / "index.db"
+    indexes = [EntityIndex(db_path) for _ in range(4)]
+    errors = []
+
+    def write(index: EntityIndex, worker: int):
+        try:
+            for i in range(100):
+                index.put(f"path-{i}", worker, i, {"worker": worker}, None)
+                if i % 10 == 9:
+                    index.flush()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(index, n)) for n, index in enumerate(indexes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT path, mtime_ns, frontmatter FROM entities").fetchall()
+    assert len(rows) == 100
+    for path, worker, frontmatter in rows:
+        assert frontmatter == f'{{"worker": {worker}}}'
+
+
+def test_listing_from_many_threads(workspace, tools):
+    for i in range(40):
+        write_entity(workspace, "notes", f"n{i}", f"---\ntitle: N{i}\n---\n\nbody {i}\n")
+    results = []
+
+    def work():
+        results.append(tools.list_entities("notes", limit=100)["count"])
+        results.append(tools.search_entities("body 3", "notes", limit=100)["count"])
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [11] * 8 + [40] * 8
+    assert len(_rows(tools)) == 40
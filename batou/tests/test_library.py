@@ -0,0 +1,82 @@
+"""Tests for LibraryTools called from concurrent tool-call threads."""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from batou.library import LibraryTools
+from batou.serialization import to_json
+from major.librarian import DocumentSummaries, IndexedDocument, Topic
+
+
+def _library(workspace, count: int) -> LibraryTools:
+    tools = LibraryTools(str(workspace))
+    tools.index.add_topic(Topic(id="odd", name="Odd"))
+    tools.index.add_topic(Topic(id="even", name="Even"))
+    with tools.index.batch():
+        for i in range(count):
+            tools.index.add_document(IndexedDocument(
+                id=f"d{i}",
+                source_path=f"files/d{i}",
+                title=f"Document {i}",
+                doc_type="note",
+                summaries=DocumentSummaries(brief="", standard="", detailed=""),
+                topics=["odd" if i % 2 else "even"],
+            ))
+    return tools
+
+
+def test_concurrent_library_tool_calls_see_complete_topics(workspace):
+    tools = _library(workspace, 2000)
+    expected = sorted(f"d{i}" for i in range(1, 2000, 2))
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def browse() -> int:
+        # Rebuilds every topic's document list, as the server's browse_topics does
+        deadline = time.monotonic() + 0.5
+        calls = 0
+        while time.monotonic() < deadline:
+            to_json(tools.browse_topics())
+            calls += 1
+        return calls
+
+    def list_odd() -> list[str]:
+        deadline = time.monotonic() + 0.5
+        wrong = []
+        while time.monotonic() < deadline:
+            listed = tools.list_documents(topic_filter=["odd"], limit=5000)["documents"]
+            topic = tools.browse_topics("odd")["topic"]
+            if sorted(d["id"] for d in listed) != expected or topic["document_count"] != 1000:
+                wrong.append(topic["document_count"])
+        return wrong
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            browsing = executor.submit(browse)
+            listing = executor.submit(list_odd)
+            assert listing.result() == []
+            assert browsing.result() > 0
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_concurrent_library_writes_are_not_lost(workspace):
+    tools = _library(workspace, 0)
+
+    def add(i: int):
+        tools.index.add_document(IndexedDocument(
+            id=f"d{i}",
+            source_path=f"files/d{i}",
+            title=f"Document {i}",
+            doc_type="note",
+            summaries=DocumentSummaries(brief="", standard="", detailed=""),
+            topics=["odd" if i % 2 else "even"],
+        ))
+        return tools.browse_topics()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(add, range(200)))
+
+    counts = {t["id"]: t["document_count"] for t in LibraryTools(str(workspace)).browse_topics()["topics"]}
+    assert counts == {"odd": 100, "even": 100}
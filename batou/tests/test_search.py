@@ -0,0 +1,90 @@
+"""Search results must not depend on the raw-byte prefilter."""
+
+import pytest
+
+from batou import entities
+from batou.entities import EntityTools
+
+from conftest import write_entity
+
+
+def _ids(result: dict) -> list[str]:
+    return sorted(item["entity_id"] for item in result["results"])
+
+
+def test_query_spanning_title_and_body(workspace, tools):
+    write_entity(workspace, "notes", "greeting", "---\ntitle: Hello\nstatus: open\n---\n\nWorld and more\n")
+
+    assert _ids(tools.search_entities("hello world", "notes")) == ["greeting"]
+
+
+def test_query_spanning_title_and_body_without_frontmatter(workspace, tools):
+    write_entity(workspace, "notes", "plain", "World is round\n")
+
+    # No frontmatter: the searched text is " World is round"
+    assert _ids(tools.search_entities(" world", "notes")) == ["plain"]
+
+
+@pytest.mark.parametrize(
+    ("title_yaml", "query"),
+    [
+        ('"Say \\"cheese\\""', 'say "cheese"'),
+        ('"Caf\\u00e9 society"', "café society"),
+        ('"line \\\n  continued"', "line continued"),
+        ("'It''s here'", "it's here"),
+        (">\n  folded\n  title", "folded title"),
+        ("0x1F", "31"),
+        ("yes", "true"),
+    ],
+)
+def test_title_in_parsed_form(workspace, tools, title_yaml, query):
+    write_entity(workspace, "notes", "target", f"---\ntitle: {title_yaml}\n---\n\nunrelated body\n")
+
+    assert _ids(tools.search_entities(query, "notes")) == ["target"]
+
+
+def test_non_ascii_case_folding_in_body(workspace, tools):
+    write_entity(workspace, "notes", "kelvin", "---\ntitle: Temperature\n---\n\n273 K\n")
+
+    assert _ids(tools.search_entities("273 k", "notes")) == ["kelvin"]
+
+
+def test_large_file_spanning_match(workspace, tools):
+    body = "World " + "filler " * (entities.MMAP_THRESHOLD // 6)
+    write_entity(workspace, "notes", "big", f"---\ntitle: Hello\n---\n\n{body}\n")
+
+    assert _ids(tools.search_entities("hello world", "notes")) == ["big"]
+
+
+def test_non_matching_files_are_excluded(workspace, tools):
+    write_entity(workspace, "notes", "match", "---\ntitle: Alpha\n---\n\nneedle here\n")
+    write_entity(workspace, "notes", "other", "---\ntitle: Beta\n---\n\nhaystack only\n")
+
+    assert _ids(tools.search_entities("needle", "notes")) == ["match"]
+    assert _ids(tools.search_entities("beta", "notes")) == ["other"]
+    assert _ids(tools.search_entities("zebra", "notes")) == []
+
+
+def test_matches_agree_with_full_parse(workspace, tools):
+    texts = {
+        "a": "---\ntitle: Red fox\n---\n\njumps over\n",
+        "b": "---\ntitle: 'Lazy ''dog'''\n---\n\nsleeps\n",
+        "c": "no frontmatter fox jumps\n",
+        "d": "---\ntitle: [fox, dog]\n---\n\nlist title\n",
+    }
+    for entity_id, text in texts.items():
+        write_entity(workspace, "notes", entity_id, text)
+
+    for query in ["fox", "fox jumps", "'dog'", "dog' sleeps", "['fox'", "x j", "sleeps"]:
+        fresh = EntityTools(workspace)
+        expected = sorted(
+            entity_id
+            for entity_id in texts
+            if query.lower() in _searched_text(fresh, workspace / "notes" / f"{entity_id}.md").lower()
+        )
+        assert _ids(tools.search_entities(query, "notes")) == expected, query
+
+
+def _searched_text(tools: EntityTools, path) -> str:
+    fm, content = tools._parse_file(path)
+    return f"{fm.get('title', '')} {content}"
@@ -0,0 +1,31 @@
+"""Tests for tool result serialization."""
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+from batou.serialization import to_json
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def test_output_matches_json_dumps_with_str_fallback():
+    result = {
+        "created": datetime(2024, 1, 2, 3, 4, 5),
+        "updated": datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+        "due": date(2024, 1, 2),
+        "tags": ["a", "b"],
+        "count": 3,
+        "title": "Café",
+    }
+
+    assert json.loads(to_json(result)) == json.loads(json.dumps(result, default=str))
+    assert json.loads(to_json(result))["created"] == "2024-01-02 03:04:05"
+
+
+def test_dataclasses_and_non_str_keys():
+    assert json.loads(to_json({"p": _Point(1, 2), 1: "one"})) == {"p": {"x": 1, "y": 2}, "1": "one"}
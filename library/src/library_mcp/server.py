@@ -2,37 +2,51 @@
 
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import io
 import json
 import logging
 import os
 import re
+import secrets
 import sys
-import uuid
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import httpx
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-# Import LibraryManager from major without triggering major's __init__.py
-# (which pulls in heavy dependencies like claude_agent_sdk)
-import importlib.util
-
-_library_module_path = str(
-    Path(__file__).parent.parent.parent.parent / "major" / "src" / "major" / "library.py"
-)
-_spec = importlib.util.spec_from_file_location("major_library", _library_module_path)
-_library_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_library_module)
-LibraryManager = _library_module.LibraryManager
+# Use major's LibraryManager when major is installed (its __init__ imports
+# claude_agent_sdk lazily, so this stays light). Otherwise load library.py
+# straight from the monorepo checkout.
+try:
+    from major.library import LibraryManager
+except ImportError:
+    _library_module_path = Path(__file__).parents[3] / "major" / "src" / "major" / "library.py"
+    _spec = importlib.util.spec_from_file_location("major_library", _library_module_path)
+    _library_module = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_library_module)
+    LibraryManager = _library_module.LibraryManager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("library-mcp")
 
+# Compact responses by default; LIBRARY_PRETTY=1 indents them for debugging
+_PRETTY = os.environ.get("LIBRARY_PRETTY") == "1"
+
 # Create MCP server
 server = Server("library")
 
@@ -48,12 +62,12 @@ def get_library_manager() -> LibraryManager:
         env_workspace = os.environ.get("WORKSPACE_PATH")
         workspace_path = env_workspace or cwd
 
-        logger.info(f"[LIBRARY] cwd: {cwd}")
-        logger.info(f"[LIBRARY] WORKSPACE_PATH env: {env_workspace}")
-        logger.info(f"[LIBRARY] Using workspace: {workspace_path}")
+        logger.info("[LIBRARY] cwd: %s", cwd)
+        logger.info("[LIBRARY] WORKSPACE_PATH env: %s", env_workspace)
+        logger.info("[LIBRARY] Using workspace: %s", workspace_path)
 
         _library_manager = LibraryManager(workspace_path)
-        logger.info(f"[LIBRARY] LibraryManager initialized")
+        logger.info("[LIBRARY] LibraryManager initialized")
     return _library_manager
 
 
@@ -120,6 +134,11 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Search query to match against filenames and content",
                     },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results (default: 50)",
+                        "default": 50,
+                    },
                 },
                 "required": ["query"],
             },
@@ -164,49 +183,56 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
         result = _dispatch_tool(name, arguments)
-        return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+        return [TextContent(type="text", text=_to_json(result))]
     except Exception as e:
-        logger.exception(f"Tool {name} failed")
+        logger.exception("Tool %s failed", name)
         error_result = {
             "success": False,
             "error": str(e),
         }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+        return [TextContent(type="text", text=_to_json(error_result))]
+
+
+def _to_json(result: dict[str, Any]) -> str:
+    """Serialize a tool result, with orjson when it's installed.
+
+    Dates and datetimes go through default=str either way, so both encoders
+    write them the same way.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if _PRETTY:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(result, default=str, option=option).decode("utf-8")
+    return json.dumps(result, indent=2 if _PRETTY else None, default=str)
+
+
+# Tool name -> handler(manager, arguments)
+_HANDLERS: dict[str, Callable[[LibraryManager, dict[str, Any]], dict[str, Any]]] = {
+    "add_to_library": lambda manager, a: _add_to_library(
+        manager,
+        a["content"],
+        a["filename"],
+        a.get("content_type", "text/markdown"),
+    ),
+    "list_library_files": lambda manager, a: _list_files(manager, a.get("status")),
+    "get_library_file": lambda manager, a: _get_file(manager, a["file_id"]),
+    "search_library": lambda manager, a: _search_files(manager, a["query"], a.get("limit", 50)),
+    "delete_library_file": lambda manager, a: _delete_file(manager, a["file_id"]),
+    "import_google_doc": lambda manager, a: _import_google_doc(
+        manager,
+        a["url"],
+        a.get("filename"),
+    ),
+}
 
 
 def _dispatch_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Dispatch tool call to appropriate handler."""
-    manager = get_library_manager()
-
-    if name == "add_to_library":
-        return _add_to_library(
-            manager,
-            arguments["content"],
-            arguments["filename"],
-            arguments.get("content_type", "text/markdown"),
-        )
-
-    elif name == "list_library_files":
-        return _list_files(manager, arguments.get("status"))
-
-    elif name == "get_library_file":
-        return _get_file(manager, arguments["file_id"])
-
-    elif name == "search_library":
-        return _search_files(manager, arguments["query"])
-
-    elif name == "delete_library_file":
-        return _delete_file(manager, arguments["file_id"])
-
-    elif name == "import_google_doc":
-        return _import_google_doc(
-            manager,
-            arguments["url"],
-            arguments.get("filename"),
-        )
-
-    else:
+    handler = _HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return handler(get_library_manager(), arguments)
 
 
 def _add_to_library(
@@ -216,7 +242,7 @@ def _add_to_library(
     content_type: str,
 ) -> dict[str, Any]:
     """Add text content to the library."""
-    file_id = uuid.uuid4().hex[:12]
+    file_id = secrets.token_hex(6)
 
     # Save the file
     library_file = manager.save_uploaded_file(
@@ -226,25 +252,44 @@ def _add_to_library(
         content_type=content_type,
     )
 
-    # Process (extract content)
-    library_file = manager.process_file(file_id)
+    # Extract content in the background; the file is listed as pending until then
+    _process_in_background(manager, file_id)
 
     return {
         "success": True,
         "file": library_file.to_dict(),
-        "message": f"Added '{filename}' to library (id: {file_id})",
+        "message": (
+            f"Added '{filename}' to library (id: {file_id}). "
+            "Content extraction is running in the background."
+        ),
     }
 
 
+# Runs content extraction after add/import calls have already returned
+_process_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="library-process")
+
+
+def _process_in_background(manager: LibraryManager, file_id: str) -> None:
+    """Queue content extraction for a saved file."""
+
+    def process() -> None:
+        try:
+            manager.process_file(file_id)
+        except Exception:
+            logger.exception("Processing %s failed", file_id)
+
+    _process_executor.submit(process)
+
+
 def _list_files(
     manager: LibraryManager,
     status: str | None,
 ) -> dict[str, Any]:
     """List library files with optional status filter."""
-    files = manager.list_files()
-
     if status:
-        files = [f for f in files if f.status == status]
+        files = manager.list_files_by_status(status)
+    else:
+        files = manager.list_files()
 
     return {
         "success": True,
@@ -287,25 +332,45 @@ def _get_file(
 def _search_files(
     manager: LibraryManager,
     query: str,
+    limit: int = 50,
 ) -> dict[str, Any]:
-    """Search library files by filename or content."""
-    query_lower = query.lower()
+    """Search library files by filename or content, stopping after limit matches."""
+    # Case-insensitive literal match, scanned in C without lowered copies
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
     files = manager.list_files()
     matches = []
 
+    # Candidate content matches from the full-text index, or None to scan
+    indexed = manager.search_content(query)
+
+    # Split on filename first so a scan only reads the files it must check
+    name_matches = {f.id for f in files if pattern.search(f.filename)}
+    if indexed is None:
+        scanned = manager.iter_extracted_content(f.id for f in files if f.id not in name_matches)
+
+    truncated = False
     for f in files:
+        if len(matches) >= limit:
+            truncated = True
+            break
+
         # Match against filename
-        if query_lower in f.filename.lower():
+        if f.id in name_matches:
             matches.append({"file": f.to_dict(), "match": "filename"})
             continue
 
         # Match against extracted content
-        extracted = manager.get_extracted_content(f.id)
-        if extracted and query_lower in extracted.lower():
+        if indexed is not None:
+            extracted = indexed.get(f.id)
+        else:
+            extracted = next(scanned)[1]
+        if not extracted:
+            continue
+        match = pattern.search(extracted)
+        if match:
             # Include a snippet around the match
-            idx = extracted.lower().index(query_lower)
-            start = max(0, idx - 100)
-            end = min(len(extracted), idx + len(query) + 100)
+            start = max(0, match.start() - 100)
+            end = min(len(extracted), match.end() + 100)
             snippet = extracted[start:end]
             if start > 0:
                 snippet = "..." + snippet
@@ -317,6 +382,7 @@ def _search_files(
         "success": True,
         "query": query,
         "count": len(matches),
+        "truncated": truncated,
         "results": matches,
     }
 
@@ -340,35 +406,113 @@ def _delete_file(
         }
 
 
-_GOOGLE_DOC_ID_RE = re.compile(r"/document/d/([a-zA-Z0-9_-]+)")
+# Doc ID from a /document/d/<id> URL, or a bare ID (alphanumeric, hyphens,
+# underscores) making up the whole string apart from surrounding whitespace
+_GOOGLE_DOC_ID_RE = re.compile(r"/document/d/([a-zA-Z0-9_-]+)|^\s*([a-zA-Z0-9_-]+)\s*$")
+
+_TITLE_RE = re.compile(r"<title>(.+?)(?:\s*-\s*Google Docs)?</title>")
 
 
 def _extract_google_doc_id(url: str) -> str:
     """Extract Google Doc ID from a URL or raw ID string."""
     match = _GOOGLE_DOC_ID_RE.search(url)
     if match:
-        return match.group(1)
-    # Treat as raw doc ID if it looks like one (alphanumeric, hyphens, underscores)
-    stripped = url.strip()
-    if re.fullmatch(r"[a-zA-Z0-9_-]+", stripped):
-        return stripped
+        return match.group(1) or match.group(2)
     raise ValueError(f"Could not extract Google Doc ID from: {url}")
 
 
+# Doc titles already fetched, keyed by doc ID (only successful lookups)
+_TITLE_CACHE_SIZE = 256
+_title_cache: OrderedDict[str, str] = OrderedDict()
+_title_cache_lock = threading.Lock()
+
+# Runs the title lookup alongside the export download
+_title_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="library-title")
+
+
+# HTTP client shared by Google Doc imports, created on first use
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client():
+    """Return the shared httpx.Client, creating it on first use.
+
+    Reusing one client keeps connections to docs.google.com alive between
+    the title and export requests and across imports. HTTP/2 is used when
+    the optional h2 package is installed.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                # Imported here so server startup doesn't pay for httpx unless a doc is imported
+                import httpx
+
+                _http_client = httpx.Client(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    follow_redirects=True,
+                    timeout=30,
+                    limits=httpx.Limits(max_keepalive_connections=8),
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+
+# The <title> tag sits near the top of the edit page, so ask for this much
+_TITLE_PREFIX_BYTES = 4096
+
+
+def _read_title(response) -> str | None:
+    """Read a streamed HTML response only as far as its </title> tag."""
+    head = bytearray()
+    for chunk in response.iter_bytes():
+        start = max(0, len(head) - len(b"</title>"))
+        head += chunk
+        if head.find(b"</title>", start) != -1:
+            break
+    match = _TITLE_RE.search(head.decode(response.encoding or "utf-8", errors="replace"))
+    if match:
+        return match.group(1).strip() or None
+    return None
+
+
 def _fetch_google_doc_title(doc_id: str) -> str | None:
-    """Best-effort fetch of the doc title from the HTML page."""
+    """Best-effort fetch of the doc title from the HTML page.
+
+    Requests only the first few KB of the page, and stops reading once the
+    title has been seen; a full GET is made only if the title wasn't in a
+    truncated (206) prefix.
+    """
+    with _title_cache_lock:
+        if doc_id in _title_cache:
+            _title_cache.move_to_end(doc_id)
+            return _title_cache[doc_id]
+
+    url = f"https://docs.google.com/document/d/{doc_id}/edit"
     try:
-        resp = httpx.get(
-            f"https://docs.google.com/document/d/{doc_id}/edit",
-            follow_redirects=True,
-            timeout=10,
-        )
-        if resp.status_code == 200:
-            match = re.search(r"<title>(.+?)(?:\s*-\s*Google Docs)?</title>", resp.text)
-            if match:
-                title = match.group(1).strip()
-                if title:
-                    return title
+        client = _get_http_client()
+        title = None
+        with client.stream(
+            "GET",
+            url,
+            headers={"Range": f"bytes=0-{_TITLE_PREFIX_BYTES - 1}"},
+            timeout=5,
+        ) as resp:
+            if resp.status_code in (200, 206):
+                title = _read_title(resp)
+            truncated = resp.status_code == 206
+        if title is None and truncated:
+            with client.stream("GET", url, timeout=10) as resp:
+                if resp.status_code == 200:
+                    title = _read_title(resp)
+
+        if title:
+            with _title_cache_lock:
+                _title_cache[doc_id] = title
+                if len(_title_cache) > _TITLE_CACHE_SIZE:
+                    _title_cache.popitem(last=False)
+            return title
     except Exception:
         pass
     return None
@@ -382,43 +526,64 @@ def _import_google_doc(
     """Import a publicly-shared Google Doc into the library."""
     doc_id = _extract_google_doc_id(url)
 
-    export_url = f"https://docs.google.com/document/d/{doc_id}/export?format=txt"
-    response = httpx.get(export_url, follow_redirects=True, timeout=30)
-
-    if response.status_code != 200:
-        return {
-            "success": False,
-            "error": (
-                "Could not access this Google Doc. It may be private. "
-                "Ask the user to either share it with 'anyone with the link can view', "
-                "or paste the content directly."
-            ),
-        }
-
-    content = response.text
+    # Look up the title while the export downloads rather than after it
+    title_future = None if filename else _title_executor.submit(_fetch_google_doc_title, doc_id)
 
-    if not filename:
-        filename = _fetch_google_doc_title(doc_id) or f"google-doc-{doc_id[:8]}"
-    if not filename.endswith((".md", ".txt")):
-        filename += ".md"
+    export_url = f"https://docs.google.com/document/d/{doc_id}/export?format=txt"
+    with _get_http_client().stream("GET", export_url) as response:
+        if response.status_code != 200:
+            if title_future is not None:
+                title_future.cancel()
+            return {
+                "success": False,
+                "error": (
+                    "Could not access this Google Doc. It may be private. "
+                    "Ask the user to either share it with 'anyone with the link can view', "
+                    "or paste the content directly."
+                ),
+            }
+
+        if title_future is not None:
+            filename = title_future.result() or f"google-doc-{doc_id[:8]}"
+        if not filename.endswith((".md", ".txt")):
+            filename += ".md"
+
+        # The export is UTF-8 text, so the raw bytes go to disk as-is
+        file_id = secrets.token_hex(6)
+        library_file = manager.save_uploaded_stream(
+            file_id=file_id,
+            filename=filename,
+            chunks=response.iter_bytes(chunk_size=65536),
+            content_type="text/markdown",
+        )
 
-    file_id = uuid.uuid4().hex[:12]
-    library_file = manager.save_uploaded_file(
-        file_id=file_id,
-        filename=filename,
-        content=content.encode("utf-8"),
-        content_type="text/markdown",
-    )
-    library_file = manager.process_file(file_id)
+    _process_in_background(manager, file_id)
 
     return {
         "success": True,
         "file": library_file.to_dict(),
-        "message": f"Imported Google Doc as '{filename}' (id: {file_id})",
+        "message": (
+            f"Imported Google Doc as '{filename}' (id: {file_id}). "
+            "Content extraction is running in the background."
+        ),
         "source_url": url,
     }
 
 
+# Output buffer for the stdio transport; a whole JSON-RPC message fits, so the
+# flush after each message becomes a single write() instead of several
+STDOUT_BUFFER_SIZE = 64 * 1024
+
+
+def _buffered_stdout():
+    """Wrap stdout for stdio_server with a 64 KiB write buffer."""
+    import anyio
+
+    raw = io.FileIO(sys.stdout.fileno(), "wb", closefd=False)
+    buffered = io.BufferedWriter(raw, buffer_size=STDOUT_BUFFER_SIZE)
+    return anyio.wrap_file(io.TextIOWrapper(buffered, encoding="utf-8"))
+
+
 def main():
     """Run the MCP server."""
     import argparse
@@ -434,10 +599,10 @@ def main():
         if not workspace.is_absolute():
             workspace = workspace.resolve()
         os.environ["WORKSPACE_PATH"] = str(workspace)
-        logger.info(f"[LIBRARY] --workspace arg set WORKSPACE_PATH to: {workspace}")
+        logger.info("[LIBRARY] --workspace arg set WORKSPACE_PATH to: %s", workspace)
 
     async def run():
-        async with stdio_server() as (read_stream, write_stream):
+        async with stdio_server(stdout=_buffered_stdout()) as (read_stream, write_stream):
             await server.run(read_stream, write_stream, server.create_initialization_options())
 
     asyncio.run(run())
@@ -8,38 +8,162 @@ Major is a thin wrapper around the Claude Agent SDK that:
 - Supports multimodal messages with images
 """
 
+import asyncio
 import base64
+import itertools
+import os
+import re
 import httpx
-from collections.abc import AsyncGenerator, Callable, Awaitable
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Awaitable, Iterable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
 from claude_agent_sdk.types import PermissionResultAllow
 
 from .config import MajorConfig
-from .prompt import build_system_prompt
+from .image_cache import ImageCache
+from .prompt import build_system_prompt, load_base_prompt, prompt_source_paths
 from .tools import create_major_tools
 
 
-async def fetch_image_as_base64(url: str) -> tuple[str, str]:
-    """Fetch an image from URL and return (base64_data, media_type)."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, follow_redirects=True)
+# Sessions, and fetched images per session, whose content blocks are kept for
+# reuse when an image is resent on a later turn
+IMAGE_BLOCK_SESSIONS = 16
+IMAGE_BLOCKS_PER_SESSION = 8
+
+
+async def fetch_image_as_base64(
+    url: str,
+    client: httpx.AsyncClient | None = None,
+    cache: ImageCache | None = None,
+) -> tuple[str, str]:
+    """Fetch an image from URL and return (base64_data, media_type).
+
+    Args:
+        url: Image URL
+        client: Optional shared client, so several fetches can reuse its
+            connection pool. A temporary client is used if omitted.
+        cache: Optional image cache. A cached image is revalidated with a
+            conditional GET and reused on 304 Not Modified.
+    """
+    if client is None:
+        async with httpx.AsyncClient() as own_client:
+            return await fetch_image_as_base64(url, own_client, cache)
+
+    cached = await asyncio.to_thread(cache.get, url) if cache else None
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    async with client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+        if cached and response.status_code == 304:
+            return cached["data"], cached["media_type"]
         response.raise_for_status()
         content_type = response.headers.get("content-type", "image/jpeg")
-        # Normalize content type
-        if "jpeg" in content_type or "jpg" in content_type:
-            media_type = "image/jpeg"
-        elif "png" in content_type:
-            media_type = "image/png"
-        elif "gif" in content_type:
-            media_type = "image/gif"
-        elif "webp" in content_type:
-            media_type = "image/webp"
-        else:
-            media_type = "image/jpeg"  # Default
-        return base64.b64encode(response.content).decode("utf-8"), media_type
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        # Collect the body into one buffer instead of httpx's joined copy
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+
+    # Normalize content type
+    if "jpeg" in content_type or "jpg" in content_type:
+        media_type = "image/jpeg"
+    elif "png" in content_type:
+        media_type = "image/png"
+    elif "gif" in content_type:
+        media_type = "image/gif"
+    elif "webp" in content_type:
+        media_type = "image/webp"
+    else:
+        media_type = "image/jpeg"  # Default
+    # Encoding a multi-MB image takes long enough to stall other sessions
+    encoded = await asyncio.to_thread(_encode_base64, body)
+
+    # Only cache what can be revalidated; without validators it'd be refetched anyway
+    if cache and (etag or last_modified):
+        await asyncio.to_thread(cache.put, url, media_type, encoded, etag, last_modified)
+    return encoded, media_type
+
+
+# Inline image, e.g. a pasted screenshot: data:image/png;base64,<data>
+_DATA_URI_RE = re.compile(r"data:(image/[\w.+-]+);base64,(.*)", re.DOTALL)
+
+
+def parse_image_data_uri(url: str) -> tuple[str, str]:
+    """Split a base64 image data URI into (base64_data, media_type).
+
+    Raises:
+        ValueError: If the URI is not a base64-encoded image
+    """
+    match = _DATA_URI_RE.fullmatch(url)
+    if not match:
+        raise ValueError("not a base64 image data URI")
+    return match.group(2), match.group(1)
+
+
+def _encode_base64(data: bytes | bytearray) -> str:
+    """Base64-encode bytes to str (the alphabet is ASCII, so no UTF-8 decode)."""
+    return base64.b64encode(data).decode("ascii")
+
+
+def _image_block(media_type: str, base64_data: str) -> dict[str, Any]:
+    """Build a base64 image content block for a multimodal message."""
+    return {
+        "type": "image",
+        "source": {"type": "base64", "media_type": media_type, "data": base64_data},
+    }
+
+
+def _stat_fingerprint(paths: Iterable[Path]) -> tuple:
+    """Return (mtime_ns, size) for each path, or None where it's missing.
+
+    Used to tell whether cached per-workspace setup is still current.
+    """
+    fingerprint = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            fingerprint.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+
+@dataclass
+class _CachedLoad:
+    """A value loaded from files, valid while their fingerprint is unchanged."""
+    fingerprint: tuple
+    value: Any
+
+
+@dataclass
+class _WorkspaceSetup:
+    """MCP servers and base prompt for a workspace."""
+    mcp_servers: dict[str, Any]
+    base_prompt: str
+
+
+def _cached_load(
+    cache: dict[Any, _CachedLoad],
+    key: Any,
+    paths: Iterable[Path],
+    load: Callable[[], Any],
+) -> Any:
+    """Return cache[key]'s value, calling load() only if paths changed since."""
+    fingerprint = _stat_fingerprint(paths)
+    entry = cache.get(key)
+    if entry is None or entry.fingerprint != fingerprint:
+        entry = _CachedLoad(fingerprint=fingerprint, value=load())
+        cache[key] = entry
+    return entry.value
 
 
 @dataclass
@@ -79,6 +203,141 @@ class MajorAgent:
         self._pending_question: AskUserQuestionEvent | None = None
         self._answer_callback: Callable[[dict[str, str]], None] | None = None
 
+        # Config-derived setup reused across messages while the files it was
+        # built from are unchanged. MCP servers depend on the user context;
+        # the base prompt only on the workspace, so they're cached (and
+        # reloaded) separately.
+        self._mcp_cache: dict[tuple[str, tuple], _CachedLoad] = {}
+        self._prompt_cache: dict[str, _CachedLoad] = {}
+        # Fetched-image cache per workspace
+        self._image_caches: dict[str, ImageCache] = {}
+        # Source of AskUserQuestion tool_use_ids, unique for this agent
+        self._tool_use_ids = itertools.count()
+        # Image content blocks sent in recent sessions: session_id -> {url: block}
+        self._image_block_cache: OrderedDict[str, OrderedDict[str, dict[str, Any]]] = OrderedDict()
+        # MCP tool wildcards per set of server names, stable across turns
+        self._allowed_tools_cache: dict[frozenset[str], tuple[str, ...]] = {}
+
+    def invalidate_cache(self, workspace_path: str | None = None) -> None:
+        """Drop cached MCP config, prompt and skills state.
+
+        Args:
+            workspace_path: Workspace to invalidate, or None for all
+        """
+        if workspace_path is None:
+            self._mcp_cache.clear()
+            self._prompt_cache.clear()
+            self.config.forget_skills_sync()
+            return
+        for key in [k for k in self._mcp_cache if k[0] == workspace_path]:
+            del self._mcp_cache[key]
+        self._prompt_cache.pop(workspace_path, None)
+        self.config.forget_skills_sync(workspace_path)
+
+    def _workspace_setup(
+        self,
+        workspace: str,
+        user_context: dict[str, str] | None,
+    ) -> _WorkspaceSetup:
+        """Load MCP servers and the base prompt, reusing each if unchanged."""
+        mcp_servers = _cached_load(
+            self._mcp_cache,
+            (workspace, tuple(sorted((user_context or {}).items()))),
+            self.config.mcp_config_paths(workspace),
+            lambda: self.config.load_mcp_servers(workspace, user_context=user_context) or {},
+        )
+        base_prompt = _cached_load(
+            self._prompt_cache,
+            workspace,
+            prompt_source_paths(self.config.platform_config_path, workspace),
+            lambda: load_base_prompt(self.config.platform_config_path, workspace),
+        )
+        return _WorkspaceSetup(mcp_servers=mcp_servers, base_prompt=base_prompt)
+
+    def _allowed_tools(self, mcp_servers: dict[str, Any]) -> tuple[str, ...]:
+        """Return the mcp__{server}__* wildcard for each MCP server."""
+        key = frozenset(mcp_servers)
+        allowed_tools = self._allowed_tools_cache.get(key)
+        if allowed_tools is None:
+            allowed_tools = tuple(f"mcp__{name}__*" for name in mcp_servers)
+            self._allowed_tools_cache[key] = allowed_tools
+        return allowed_tools
+
+    def _session_image_blocks(self, session_id: str | None) -> OrderedDict[str, dict[str, Any]]:
+        """Image blocks already sent in a session, by URL (empty for a new session)."""
+        if session_id is None:
+            return OrderedDict()
+        blocks = self._image_block_cache.get(session_id)
+        if blocks is None:
+            blocks = OrderedDict()
+            self._image_block_cache[session_id] = blocks
+            if len(self._image_block_cache) > IMAGE_BLOCK_SESSIONS:
+                self._image_block_cache.popitem(last=False)
+        else:
+            self._image_block_cache.move_to_end(session_id)
+        return blocks
+
+    async def _build_query_message(
+        self,
+        message: str,
+        workspace: str,
+        image_urls: list[str] | None,
+        session_id: str | None = None,
+    ) -> str | list[dict[str, Any]]:
+        """Build the query: the text alone, or multimodal content blocks."""
+        if not image_urls:
+            return message
+
+        # Images resent in the same session reuse the previous turn's block
+        blocks = self._session_image_blocks(session_id)
+
+        # Data URIs already carry their base64; fetch the rest concurrently
+        # over one connection pool
+        fetch_urls = [url for url in image_urls if not url.startswith("data:") and url not in blocks]
+        fetched: dict[str, Any] = {}
+        if fetch_urls:
+            image_cache = self._image_caches.get(workspace)
+            if image_cache is None:
+                image_cache = ImageCache.for_workspace(workspace)
+                self._image_caches[workspace] = image_cache
+            async with httpx.AsyncClient() as http_client:
+                results = await asyncio.gather(
+                    *(fetch_image_as_base64(url, http_client, image_cache) for url in fetch_urls),
+                    return_exceptions=True,
+                )
+            fetched = dict(zip(fetch_urls, results))
+
+        # Construct multimodal content blocks, in the order given
+        content = []
+        for url in image_urls:
+            block = blocks.get(url)
+            if block is not None:
+                blocks.move_to_end(url)
+                content.append(block)
+                continue
+
+            if url.startswith("data:"):
+                try:
+                    result = parse_image_data_uri(url)
+                except ValueError as e:
+                    result = e
+            else:
+                result = fetched[url]
+            if isinstance(result, BaseException):
+                print(f"[Major] Failed to fetch image {url[:100]}: {result}")
+                continue
+            base64_data, media_type = result
+            block = _image_block(media_type, base64_data)
+            content.append(block)
+
+            if session_id is not None and not url.startswith("data:"):
+                blocks[url] = block
+                if len(blocks) > IMAGE_BLOCKS_PER_SESSION:
+                    blocks.popitem(last=False)
+        # Add text message last
+        content.append({"type": "text", "text": message})
+        return content
+
     async def send_message(
         self,
         message: str,
@@ -110,19 +369,22 @@ class MajorAgent:
             Raw SDK messages (SystemMessage, AssistantMessage, UserMessage,
             ResultMessage, StreamEvent). Caller should check message types.
         """
-        # Validate and normalize workspace
-        workspace = self.config.validate_workspace(workspace_path)
-
-        # Sync skills from platform/user to workspace
-        self.config.sync_skills(workspace)
-
-        # Load MCP servers with user context
-        mcp_servers = self.config.load_mcp_servers(workspace, user_context=user_context)
+        # Validate and normalize workspace (resolving it touches the filesystem)
+        workspace = await asyncio.to_thread(self.config.validate_workspace, workspace_path)
+
+        # These are independent, so overlap them: sync skills from platform/user
+        # to workspace, load MCP servers with user context (cached while configs
+        # are unchanged), and build the message content, fetching any images.
+        # The first two are blocking file IO and run off the event loop.
+        _, setup, query_message = await asyncio.gather(
+            asyncio.to_thread(self.config.sync_skills, workspace),
+            asyncio.to_thread(self._workspace_setup, workspace, user_context),
+            self._build_query_message(message, workspace, image_urls, session_id),
+        )
+        mcp_servers = dict(setup.mcp_servers)
 
         # Add major-tools (custom tools for report generation, etc.)
         major_tools = create_major_tools(workspace)
-        if mcp_servers is None:
-            mcp_servers = {}
         mcp_servers["major-tools"] = major_tools
 
         # Build system prompt with app and workspace context
@@ -131,6 +393,7 @@ class MajorAgent:
             platform_config_path=self.config.platform_config_path,
             workspace_path=workspace,
             source_constraint=source_constraint,
+            base_prompt=setup.base_prompt,
         )
 
         # Build explicit tool list - only safe tools + MCP tools
@@ -138,9 +401,10 @@ class MajorAgent:
         tools = ['Read', 'Glob', 'Grep', 'Bash', 'WebSearch', 'WebFetch']
         if on_ask_user:
             tools.append('AskUserQuestion')
-        # Add MCP tool wildcards so they're exposed to the model
-        for server_name in (mcp_servers or {}).keys():
-            tools.append(f"mcp__{server_name}__*")
+        # Allow all tools from each MCP server using wildcards, and add them
+        # to the tool list so they're exposed to the model
+        allowed_tools = self._allowed_tools(mcp_servers)
+        tools.extend(allowed_tools)
 
         # Create can_use_tool handler if we have a callback
         can_use_tool = None
@@ -156,7 +420,7 @@ class MajorAgent:
                     # Create event and call user callback
                     event = AskUserQuestionEvent(
                         questions=questions,
-                        tool_use_id=str(id(tool_input)),  # Unique ID
+                        tool_use_id=f"q{next(self._tool_use_ids)}",
                     )
                     answers = await on_ask_user(event)
 
@@ -171,12 +435,6 @@ class MajorAgent:
 
             can_use_tool = handle_tool_permission
 
-        # Build allowed_tools list for MCP servers
-        allowed_tools = []
-        for server_name in mcp_servers.keys():
-            # Allow all tools from each MCP server using wildcard
-            allowed_tools.append(f"mcp__{server_name}__*")
-
         # Configure SDK options
         # Note: Only pass tools if explicitly set - None disables all tools
         options = ClaudeAgentOptions(
@@ -185,7 +443,7 @@ class MajorAgent:
             resume=session_id,  # SDK loads history from JSONL
             system_prompt=system_prompt,
             mcp_servers=mcp_servers if mcp_servers else None,
-            allowed_tools=allowed_tools if allowed_tools else None,
+            allowed_tools=list(allowed_tools) if allowed_tools else None,
             tools=tools,
             can_use_tool=can_use_tool,
             include_partial_messages=True,  # SDK sends deltas
@@ -193,35 +451,15 @@ class MajorAgent:
             setting_sources=["project"],  # Load skills from .claude/skills/
         )
 
-        # Build message content (text or multimodal)
-        if image_urls:
-            # Construct multimodal content blocks
-            content = []
-            for url in image_urls:
-                try:
-                    base64_data, media_type = await fetch_image_as_base64(url)
-                    content.append({
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": media_type,
-                            "data": base64_data,
-                        }
-                    })
-                except Exception as e:
-                    print(f"[Major] Failed to fetch image {url}: {e}")
-            # Add text message last
-            content.append({"type": "text", "text": message})
-            query_message = content
-        else:
-            query_message = message
-
         # Run query and yield events
         async with ClaudeSDKClient(options=options) as client:
             await client.query(query_message)
 
             async for msg in client.receive_response():
                 yield msg
+                # Buffered partial-message bursts are received without
+                # suspending; give other sessions a turn between messages
+                await asyncio.sleep(0)
 
     def get_session_id_from_init(self, msg: SDKMessage) -> str | None:
         """Extract session_id from SystemMessage init event.
@@ -232,7 +470,10 @@ class MajorAgent:
         Returns:
             Session ID if this is an init message, None otherwise
         """
-        if hasattr(msg, 'subtype') and msg.subtype == 'init':
-            if hasattr(msg, 'data') and msg.data:
-                return msg.data.get('session_id')
-        return None
+        # Called on every streamed message; most have no subtype at all
+        try:
+            if msg.subtype != 'init':
+                return None
+            return msg.data.get('session_id')
+        except AttributeError:
+            return None
@@ -1,11 +1,79 @@
 """Configuration for Major agent - MCP loading, workspace validation."""
 
+import hashlib
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Parsed "mcpServers" per .mcp.json path: path -> (mtime_ns, size, servers).
+# Cached dicts are shared, so load_mcp_servers never mutates them in place.
+_mcp_config_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+_mcp_config_lock = threading.Lock()
+
+# Signature of the source and target skill listings at each workspace's last
+# complete sync: workspace skills dir -> signature. Kept in memory, not in the
+# workspace, since workspaces are git repos that get auto-committed.
+_skills_synced: dict[str, str] = {}
+_skills_synced_lock = threading.Lock()
+
+# Skill directories copied in parallel by sync_skills
+SKILL_COPY_WORKERS = 4
+
+
+def _read_mcp_servers(config_path: Path) -> dict[str, Any] | None:
+    """Return a config file's mcpServers, reparsing only when it changed.
+
+    Returns:
+        The servers mapping, or None if the file is missing or invalid
+    """
+    key = str(config_path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return None
+
+    with _mcp_config_lock:
+        cached = _mcp_config_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        data = config_path.read_bytes()
+        config = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        servers = config.get("mcpServers", {})
+    except Exception:
+        return None  # Skip invalid configs
+    if not isinstance(servers, dict):
+        return None
+
+    with _mcp_config_lock:
+        _mcp_config_cache[key] = (st.st_mtime_ns, st.st_size, servers)
+    return servers
+
+
+@lru_cache(maxsize=16)
+def _resolve_root(workspace_root: str) -> Path:
+    """Resolve the workspace root once; it's checked on every message."""
+    return Path(workspace_root).resolve()
+
+
+def _set_server_env(servers: dict[str, Any], server_name: str, name: str, value: str) -> None:
+    """Set an env var on one server, copying its config rather than mutating it."""
+    server = dict(servers[server_name])
+    server["env"] = {**server.get("env", {}), name: value}
+    servers[server_name] = server
+
 
 @dataclass
 class MajorConfig:
@@ -44,11 +112,43 @@ class MajorConfig:
         if not path.exists():
             raise ValueError(f"Workspace does not exist: {workspace_path}")
 
-        if not workspace_path.startswith(self.workspace_root):
+        # Compare resolved paths component-wise: a string prefix check would
+        # accept /opt/workspacesX or /opt/workspaces/../etc
+        if not path.resolve().is_relative_to(_resolve_root(self.workspace_root)):
             raise ValueError(f"Workspace must be under {self.workspace_root}, got: {workspace_path}")
 
         return workspace_path
 
+    def mcp_config_paths(self, workspace_path: str) -> list[Path]:
+        """MCP config files merged by load_mcp_servers, lowest precedence first.
+
+        Args:
+            workspace_path: Path to workspace
+
+        Returns:
+            Platform, user and workspace .mcp.json paths (which may not exist)
+        """
+        workspace = Path(workspace_path)
+        return [
+            Path(self.platform_config_path) / ".mcp.json",
+            workspace.parent / ".mcp.json",
+            workspace / ".mcp.json",
+        ]
+
+    def skill_source_dirs(self, workspace_path: str) -> list[Path]:
+        """Skill directories that sync_skills copies from.
+
+        Args:
+            workspace_path: Path to workspace
+
+        Returns:
+            Platform and user skill directories (which may not exist)
+        """
+        return [
+            Path(self.platform_skills_path),
+            Path(workspace_path).parent / ".claude" / "skills",
+        ]
+
     def load_mcp_servers(
         self,
         workspace_path: str,
@@ -70,38 +170,22 @@ class MajorConfig:
             Merged MCP server configurations
         """
         merged_servers: dict[str, Any] = {}
-        workspace = Path(workspace_path)
-
-        config_paths = [
-            Path(self.platform_config_path) / ".mcp.json",
-            workspace.parent / ".mcp.json",
-            workspace / ".mcp.json",
-        ]
 
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        config = json.load(f)
-                        servers = config.get("mcpServers", {})
-                        merged_servers.update(servers)
-                except Exception:
-                    pass  # Skip invalid configs
+        for config_path in self.mcp_config_paths(workspace_path):
+            servers = _read_mcp_servers(config_path)
+            if servers:
+                merged_servers.update(servers)
 
         # Inject WORKSPACE_PATH for MCP servers that need it
         for server_name in ["batou", "reports", "library"]:
             if server_name in merged_servers:
-                if "env" not in merged_servers[server_name]:
-                    merged_servers[server_name]["env"] = {}
-                merged_servers[server_name]["env"]["WORKSPACE_PATH"] = workspace_path
+                _set_server_env(merged_servers, server_name, "WORKSPACE_PATH", workspace_path)
 
         # Inject user context as env vars for MCP servers that need it
         if user_context:
             # chelle-api needs ORGANIZATION_ID (from clerk_id)
             if "chelle-api" in merged_servers and user_context.get("clerk_id"):
-                if "env" not in merged_servers["chelle-api"]:
-                    merged_servers["chelle-api"]["env"] = {}
-                merged_servers["chelle-api"]["env"]["ORGANIZATION_ID"] = user_context["clerk_id"]
+                _set_server_env(merged_servers, "chelle-api", "ORGANIZATION_ID", user_context["clerk_id"])
                 print(f"[DEBUG] Injected ORGANIZATION_ID={user_context['clerk_id']} into chelle-api MCP")
 
         print(f"[DEBUG] load_mcp_servers: user_context={user_context}, servers={list(merged_servers.keys())}")
@@ -121,27 +205,100 @@ class MajorConfig:
         workspace = Path(workspace_path)
         workspace_skills = workspace / ".claude" / "skills"
         workspace_skills.mkdir(parents=True, exist_ok=True)
+        source_dirs = self.skill_source_dirs(workspace_path)
 
-        source_dirs = [
-            Path(self.platform_skills_path),
-            workspace.parent / ".claude" / "skills",
-        ]
+        # Skip the walk entirely if nothing changed since the last sync
+        key = str(workspace_skills)
+        signature = _skills_signature(source_dirs, workspace_skills)
+        with _skills_synced_lock:
+            if _skills_synced.get(key) == signature:
+                return
 
+        # Collect missing skills first; earlier sources win on name clashes
+        copies: dict[str, tuple[str, Path]] = {}
         for source_dir in source_dirs:
-            if not source_dir.exists():
+            try:
+                it = os.scandir(source_dir)
+            except OSError:
                 continue
+            with it:
+                for entry in it:
+                    if not entry.is_dir() or entry.name in copies:
+                        continue
+
+                    target_dir = workspace_skills / entry.name
+
+                    # Don't overwrite existing workspace skills
+                    if target_dir.exists():
+                        continue
+
+                    copies[entry.name] = (entry.path, target_dir)
+
+        def copy_skill(paths: tuple[str, Path]) -> bool:
+            source, target = paths
+            try:
+                shutil.copytree(source, target)
+            except FileExistsError:
+                pass  # Copied by a concurrent sync
+            except Exception:
+                # Skip failed copies, but drop the partial tree so a later
+                # sync retries this skill
+                shutil.rmtree(target, ignore_errors=True)
+                return False
+            return True
+
+        # Skills are independent trees, so copy them concurrently
+        if len(copies) == 1:
+            copied = [copy_skill(next(iter(copies.values())))]
+        elif copies:
+            with ThreadPoolExecutor(max_workers=SKILL_COPY_WORKERS) as executor:
+                copied = list(executor.map(copy_skill, copies.values()))
+        else:
+            copied = []
+
+        # Record the post-sync state (the copies changed the target listing),
+        # unless a copy failed and the next sync should try it again
+        if all(copied):
+            signature = _skills_signature(source_dirs, workspace_skills)
+            with _skills_synced_lock:
+                _skills_synced[key] = signature
+
+    def forget_skills_sync(self, workspace_path: str | None = None) -> None:
+        """Make the next sync_skills walk the skill directories again.
 
-            for skill_dir in source_dir.iterdir():
-                if not skill_dir.is_dir():
-                    continue
+        Args:
+            workspace_path: Workspace to forget, or None for all
+        """
+        with _skills_synced_lock:
+            if workspace_path is None:
+                _skills_synced.clear()
+            else:
+                _skills_synced.pop(str(Path(workspace_path) / ".claude" / "skills"), None)
 
-                target_dir = workspace_skills / skill_dir.name
 
-                # Don't overwrite existing workspace skills
-                if target_dir.exists():
-                    continue
+def _skills_signature(source_dirs: list[Path], workspace_skills: Path) -> str:
+    """Hash the skill source entries (name, mtime) and the target skill names.
 
-                try:
-                    shutil.copytree(skill_dir, target_dir)
-                except Exception:
-                    pass  # Skip failed copies
+    A changed source skill, an added or removed one, or a skill deleted from
+    the workspace all change the signature.
+    """
+    digest = hashlib.sha256()
+    for source_dir in source_dirs:
+        digest.update(f"{source_dir}\0".encode())
+        try:
+            with os.scandir(source_dir) as it:
+                entries = sorted((e.name, e.stat().st_mtime_ns) for e in it)
+        except OSError:
+            continue
+        for name, mtime_ns in entries:
+            digest.update(f"{name}\0{mtime_ns}\0".encode())
+
+    digest.update(b"\0target\0")
+    try:
+        with os.scandir(workspace_skills) as it:
+            names = sorted(e.name for e in it)
+    except OSError:
+        names = []
+    for name in names:
+        digest.update(f"{name}\0".encode())
+    return digest.hexdigest()
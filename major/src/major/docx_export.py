@@ -2,11 +2,31 @@
 
 import io
 import re
+from itertools import takewhile
 
 from docx import Document
 from docx.shared import Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+# Block-level line patterns
+_HR_RE = re.compile(r"^(\*{3,}|-{3,}|_{3,})\s*$")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_BULLET_RE = re.compile(r"^(\s*)[-*+]\s+(.+)$")
+_NUMBER_RE = re.compile(r"^(\s*)\d+[.)]\s+(.+)$")
+
+# Inline span kinds produced by _scan_inline
+_PLAIN, _BOLD_ITALIC, _BOLD, _ITALIC, _CODE = range(5)
+
+# Delimiters to try at a "*" or "`", longest first, with the span they open
+_INLINE_DELIMITERS = {
+    "*": (("***", _BOLD_ITALIC), ("**", _BOLD), ("*", _ITALIC)),
+    "`": (("`", _CODE),),
+}
+
+# Text-based separator used for horizontal rules
+_HRULE_TEXT = "─" * 50
+
 
 def markdown_to_docx(markdown: str, title: str | None = None) -> bytes:
     """Convert markdown text to DOCX bytes.
@@ -22,110 +42,139 @@ def markdown_to_docx(markdown: str, title: str | None = None) -> bytes:
     font.name = "Calibri"
     font.size = Pt(11)
 
-    lines = markdown.split("\n")
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    # Code formatting is defined once as styles rather than set per run
+    inline_code, code_block = _add_code_styles(doc)
 
-        # Code block
+    lines = iter(markdown.splitlines())
+    for line in lines:
+        # Code block (takewhile also consumes the closing ```)
         if line.strip().startswith("```"):
-            code_lines = []
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith("```"):
-                code_lines.append(lines[i])
-                i += 1
-            i += 1  # skip closing ```
-            _add_code_block(doc, "\n".join(code_lines))
+            code_lines = list(takewhile(lambda l: not l.strip().startswith("```"), lines))
+            _add_code_block(doc, "\n".join(code_lines), code_block)
             continue
 
         # Horizontal rule
-        if re.match(r"^(\*{3,}|-{3,}|_{3,})\s*$", line.strip()):
+        if _HR_RE.match(line.strip()):
             _add_horizontal_rule(doc)
-            i += 1
             continue
 
         # Heading
-        heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+        heading_match = _HEADING_RE.match(line)
         if heading_match:
             level = min(len(heading_match.group(1)), 3)
             text = heading_match.group(2).strip()
             doc.add_heading(text, level=level)
-            i += 1
             continue
 
         # Bullet list
-        bullet_match = re.match(r"^(\s*)[-*+]\s+(.+)$", line)
+        bullet_match = _BULLET_RE.match(line)
         if bullet_match:
             text = bullet_match.group(2)
             p = doc.add_paragraph(style="List Bullet")
-            _add_inline_formatting(p, text)
-            i += 1
+            _add_inline_formatting(p, text, inline_code)
             continue
 
         # Numbered list
-        num_match = re.match(r"^(\s*)\d+[.)]\s+(.+)$", line)
+        num_match = _NUMBER_RE.match(line)
         if num_match:
             text = num_match.group(2)
             p = doc.add_paragraph(style="List Number")
-            _add_inline_formatting(p, text)
-            i += 1
+            _add_inline_formatting(p, text, inline_code)
             continue
 
         # Empty line
         if not line.strip():
-            i += 1
             continue
 
         # Regular paragraph
         p = doc.add_paragraph()
-        _add_inline_formatting(p, line)
-        i += 1
+        _add_inline_formatting(p, line, inline_code)
 
     buf = io.BytesIO()
     doc.save(buf)
     return buf.getvalue()
 
 
-def _add_inline_formatting(paragraph, text: str):
+def _scan_inline(text: str):
+    """Split inline markdown into (kind, text) spans in one linear pass.
+
+    Recognizes ***bold italic***, **bold**, *italic*, `code` and plain text.
+    A span's content is non-empty, can't cross a newline, and ends at the
+    first closing delimiter; a "*" or "`" that opens no span is dropped.
+    """
+    i = 0
+    n = len(text)
+    while i < n:
+        delimiters = _INLINE_DELIMITERS.get(text[i])
+        if delimiters is None:
+            # Plain run up to the next delimiter character
+            star = text.find("*", i)
+            tick = text.find("`", i)
+            if star == -1:
+                end = n if tick == -1 else tick
+            else:
+                end = star if tick == -1 else min(star, tick)
+            yield _PLAIN, text[i:end]
+            i = end
+            continue
+
+        for delim, kind in delimiters:
+            if not text.startswith(delim, i):
+                continue
+            start = i + len(delim)
+            close = text.find(delim, start + 1)
+            if close != -1 and text.find("\n", start, close) == -1:
+                yield kind, text[start:close]
+                i = close + len(delim)
+                break
+        else:
+            i += 1
+
+
+def _add_code_styles(doc: Document):
+    """Add the InlineCode character style and CodeBlock paragraph style.
+
+    Returns:
+        (inline code style, code block style)
+    """
+    inline_code = doc.styles.add_style("InlineCode", WD_STYLE_TYPE.CHARACTER)
+    inline_code.font.name = "Courier New"
+    inline_code.font.size = Pt(10)
+    inline_code.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
+
+    code_block = doc.styles.add_style("CodeBlock", WD_STYLE_TYPE.PARAGRAPH)
+    code_block.base_style = doc.styles["Normal"]
+    code_block.paragraph_format.space_before = Pt(6)
+    code_block.paragraph_format.space_after = Pt(6)
+    code_block.font.name = "Courier New"
+    code_block.font.size = Pt(9)
+    code_block.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
+
+    return inline_code, code_block
+
+
+def _add_inline_formatting(paragraph, text: str, code_style):
     """Parse inline markdown (bold, italic, code) and add runs to paragraph."""
-    # Pattern matches: **bold**, *italic*, `code`, or plain text
-    pattern = re.compile(
-        r"(\*\*\*(.+?)\*\*\*)"  # bold+italic
-        r"|(\*\*(.+?)\*\*)"     # bold
-        r"|(\*(.+?)\*)"         # italic
-        r"|(`(.+?)`)"           # inline code
-        r"|([^*`]+)"            # plain text
-    )
-
-    for match in pattern.finditer(text):
-        if match.group(2):  # bold+italic
-            run = paragraph.add_run(match.group(2))
+    for kind, span in _scan_inline(text):
+        if kind == _PLAIN:
+            paragraph.add_run(span)
+        elif kind == _BOLD_ITALIC:
+            run = paragraph.add_run(span)
             run.bold = True
             run.italic = True
-        elif match.group(4):  # bold
-            run = paragraph.add_run(match.group(4))
+        elif kind == _BOLD:
+            run = paragraph.add_run(span)
             run.bold = True
-        elif match.group(6):  # italic
-            run = paragraph.add_run(match.group(6))
+        elif kind == _ITALIC:
+            run = paragraph.add_run(span)
             run.italic = True
-        elif match.group(8):  # inline code
-            run = paragraph.add_run(match.group(8))
-            run.font.name = "Courier New"
-            run.font.size = Pt(10)
-            run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-        elif match.group(9):  # plain text
-            paragraph.add_run(match.group(9))
+        else:  # inline code
+            paragraph.add_run(span, style=code_style)
 
 
-def _add_code_block(doc: Document, code: str):
-    """Add a code block as a monospace paragraph with gray background."""
-    p = doc.add_paragraph()
-    p.paragraph_format.space_before = Pt(6)
-    p.paragraph_format.space_after = Pt(6)
-    run = p.add_run(code)
-    run.font.name = "Courier New"
-    run.font.size = Pt(9)
-    run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
+def _add_code_block(doc: Document, code: str, style):
+    """Add a code block as a monospace paragraph in the CodeBlock style."""
+    doc.add_paragraph(code, style=style)
 
 
 def _add_horizontal_rule(doc: Document):
@@ -134,7 +183,7 @@ def _add_horizontal_rule(doc: Document):
     p.paragraph_format.space_before = Pt(12)
     p.paragraph_format.space_after = Pt(12)
     # Add a simple text-based separator
-    run = p.add_run("─" * 50)
+    run = p.add_run(_HRULE_TEXT)
     run.font.color.rgb = RGBColor(0xCC, 0xCC, 0xCC)
     run.font.size = Pt(8)
     p.alignment = WD_ALIGN_PARAGRAPH.CENTER
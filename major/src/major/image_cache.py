@@ -0,0 +1,164 @@
+"""On-disk cache of fetched message images.
+
+Images attached to chat messages are often referenced again (avatars,
+uploaded assets), so their base64 encoding is kept per workspace and
+revalidated with a conditional GET instead of being re-downloaded.
+
+The cache lives in the user's cache directory, not the workspace:
+workspaces are git repositories that get auto-committed and pushed.
+
+Storage layout:
+    {$XDG_CACHE_HOME or ~/.cache}/major/images/{sha256(workspace)[:16]}/
+        {sha256(url)}.json    # {"media_type", "data", "etag", "last_modified"}
+
+Entries are evicted least-recently-used first (by file mtime, which is
+bumped on every hit) once the directory grows past max_bytes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+# Disk budget for one workspace's image cache
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Entries also held in memory, in front of the disk cache
+MEMORY_ENTRIES = 32
+
+
+def cache_root() -> Path:
+    """Per-user cache directory for major."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "major"
+
+
+class ImageCache:
+    """Base64 image cache for one workspace, keyed by URL."""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_workspace(cls, workspace: str | Path) -> "ImageCache":
+        """Open the image cache for a workspace.
+
+        Args:
+            workspace: Workspace root directory
+
+        Returns:
+            ImageCache under cache_root(), keyed by the resolved workspace path
+        """
+        key = hashlib.sha256(str(Path(workspace).resolve()).encode("utf-8")).hexdigest()[:16]
+        return cls(cache_root() / "images" / key)
+
+    def _path(self, url: str) -> Path:
+        """Cache file for a URL."""
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _remember(self, url: str, entry: dict[str, Any]):
+        """Put an entry in the in-memory front."""
+        with self._lock:
+            self._memory[url] = entry
+            self._memory.move_to_end(url)
+            if len(self._memory) > MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Look up a cached image.
+
+        Args:
+            url: Image URL
+
+        Returns:
+            Entry with media_type, data (base64), etag and last_modified,
+            or None if not cached
+        """
+        path = self._path(url)
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+        if entry is None:
+            try:
+                entry = json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                return None
+            self._remember(url, entry)
+
+        # Bump mtime so eviction treats this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(
+        self,
+        url: str,
+        media_type: str,
+        data: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> dict[str, Any]:
+        """Store an image, then evict old entries if over budget.
+
+        Args:
+            url: Image URL
+            media_type: Normalized image MIME type
+            data: Base64-encoded image
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+
+        Returns:
+            The stored entry
+        """
+        entry = {
+            "media_type": media_type,
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._remember(url, entry)
+
+        path = self._path(url)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return entry
+
+        self._evict()
+        return entry
+
+    def _evict(self):
+        """Delete least recently used entries until under max_bytes."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                files = []
+                for dir_entry in it:
+                    if dir_entry.name.endswith(".json") and dir_entry.is_file():
+                        st = dir_entry.stat()
+                        files.append((st.st_mtime_ns, st.st_size, dir_entry.path))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in files)
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(files):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
@@ -8,17 +8,25 @@ Storage layout:
     index/
       documents.json    # Document index
       topics.json       # Topic/ontology index
+      topic_summaries/  # Cached collection summaries, {quoted topic_id}.json each
     files/              # Raw files (managed by library.py)
 """
 
 import json
 import os
 import re
+import threading
 import uuid as _uuid
-from dataclasses import dataclass, field, asdict
+from urllib.parse import quote
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import yaml
 
@@ -29,6 +37,83 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+# orjson for the index files (optional: this module is also imported from
+# batou's environment)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Entities analyzed concurrently by index_entities (each is one API call)
+ANALYZE_WORKERS = 8
+
+# Search postings per documents.json path, shared by every LibraryIndex in
+# the process: path -> (file stamps they were built from, postings)
+_postings_cache: dict[Path, tuple[tuple, dict[str, set[str]]]] = {}
+_postings_cache_lock = threading.Lock()
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse an index file's bytes.
+
+    Raises:
+        json.JSONDecodeError: If the data isn't valid JSON (orjson's decode
+            error subclasses it)
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(value: Any) -> bytes:
+    """Serialize an index file, indented so it stays readable on disk.
+
+    Index dataclasses are serialized in place rather than first converted
+    with to_dict: orjson handles dataclasses natively, and the stdlib
+    fallback converts each one as the encoder reaches it.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, default=_to_dict).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> os.stat_result:
+    """Write a file via a temp file and rename, so readers never see it partial.
+
+    Returns:
+        Stat of the written file, taken before the rename so it can't
+        describe a file another process renamed over ours afterwards
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return st
+
+
+# Leading YAML frontmatter: from an opening --- to the next ---, plus the
+# newlines after it
+_FRONTMATTER_RE = re.compile(r"\A---.*?---\n*", re.DOTALL)
+
+
+def _strip_frontmatter(text: str) -> str:
+    """Return an entity's body without its YAML frontmatter."""
+    return _FRONTMATTER_RE.sub("", text, count=1)
+
+
+def _to_dict(obj: Any) -> dict:
+    """json.dumps default hook for the index dataclasses."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Not JSON serializable: {type(obj).__name__}")
+
 
 @dataclass
 class DocumentSummaries:
@@ -65,22 +150,60 @@ class IndexedDocument:
             "source_path": self.source_path,
             "title": self.title,
             "doc_type": self.doc_type,
-            "summaries": asdict(self.summaries),
+            "summaries": {
+                "brief": self.summaries.brief,
+                "standard": self.summaries.standard,
+                "detailed": self.summaries.detailed,
+            },
             "topics": self.topics,
-            "metadata": asdict(self.metadata),
+            "metadata": {
+                "created": self.metadata.created,
+                "modified": self.metadata.modified,
+                "word_count": self.metadata.word_count,
+                "source_filename": self.metadata.source_filename,
+            },
         }
 
+    @cached_property
+    def _search_fields(self) -> tuple[str, str, str, str]:
+        """Lowercased title and brief/standard/detailed summaries for search.
+
+        Computed on first search and kept for the object's lifetime. Not
+        serialized: to_dict lists fields explicitly, and orjson skips
+        attributes starting with an underscore.
+        """
+        return (
+            self.title.lower(),
+            self.summaries.brief.lower(),
+            self.summaries.standard.lower(),
+            self.summaries.detailed.lower(),
+        )
+
     @classmethod
     def from_dict(cls, data: dict) -> "IndexedDocument":
-        """Create from dictionary."""
+        """Create from dictionary.
+
+        Nested fields are read by name, so unknown keys are ignored.
+        """
+        summaries = data.get("summaries") or {}
+        metadata = data.get("metadata") or {}
         return cls(
             id=data["id"],
             source_path=data["source_path"],
             title=data["title"],
             doc_type=data["doc_type"],
-            summaries=DocumentSummaries(**data.get("summaries", {})),
+            summaries=DocumentSummaries(
+                brief=summaries.get("brief", ""),
+                standard=summaries.get("standard", ""),
+                detailed=summaries.get("detailed", ""),
+            ),
             topics=data.get("topics", []),
-            metadata=DocumentMetadata(**data.get("metadata", {})),
+            metadata=DocumentMetadata(
+                created=metadata.get("created", ""),
+                modified=metadata.get("modified", ""),
+                word_count=metadata.get("word_count", 0),
+                source_filename=metadata.get("source_filename", ""),
+            ),
         )
 
 
@@ -96,8 +219,18 @@ class Topic:
     # Future: parent, children, related for hierarchical ontology
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        Lists are shared with the topic, not copied.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "aliases": self.aliases,
+            "description": self.description,
+            "documents": self.documents,
+            "document_count": self.document_count,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Topic":
@@ -118,7 +251,16 @@ class InsightItem:
     created_at: str            # ISO timestamp
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "type": self.type,
+            "title": self.title,
+            "description": self.description,
+            "source_ids": self.source_ids,
+            "source_titles": self.source_titles,
+            "status": self.status,
+            "created_at": self.created_at,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "InsightItem":
@@ -138,7 +280,16 @@ class Notebook:
     updated_at: str = ""
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "source_ids": self.source_ids,
+            "source_labels": self.source_labels,
+            "chat_session_id": self.chat_session_id,
+            "audio_generation_ids": self.audio_generation_ids,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Notebook":
@@ -147,174 +298,337 @@ class Notebook:
 
 SummaryLevel = Literal["brief", "standard", "detailed"]
 
+# Runs of characters not allowed in a topic ID
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Word runs indexed for search; matches the \w+ runs inside any query
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _build_postings(
+    documents: dict[str, IndexedDocument],
+    topics: dict[str, Topic],
+) -> dict[str, set[str]]:
+    """Map each lowercased word in a document's searchable text to doc IDs.
+
+    Searchable text is what find_documents scores: the title, the three
+    summaries, and the names and aliases of the document's topics.
+    """
+    postings: dict[str, set[str]] = {}
+    for doc in documents.values():
+        fields = list(doc._search_fields)
+        for topic_id in doc.topics:
+            topic = topics.get(topic_id)
+            if topic:
+                fields.append(topic.name.lower())
+                fields.extend(alias.lower() for alias in topic.aliases)
+        for token in set(_TOKEN_RE.findall("\n".join(fields))):
+            postings.setdefault(token, set()).add(doc.id)
+    return postings
+
+
+def _search_candidates(postings: dict[str, set[str]], query_lower: str) -> set[str] | None:
+    """IDs of documents that may contain query_lower as a substring.
+
+    Every word run in the query lies inside one word of any text containing
+    it, so only documents with a word containing the query's longest word
+    can match. That scans the vocabulary rather than every summary.
+
+    Returns:
+        Candidate IDs (a superset of the matches), or None if the query has
+        no word characters and documents must be scanned
+    """
+    words = _TOKEN_RE.findall(query_lower)
+    if not words:
+        return None
+    word = max(words, key=len)
+    candidates: set[str] = set()
+    for token, doc_ids in postings.items():
+        if word in token:
+            candidates |= doc_ids
+    return candidates
+
 
 class LibraryIndex:
-    """Manages the library document and topic index."""
+    """Manages the library document and topic index.
+
+    Parsed index files are cached on the instance and reused while the
+    file's mtime and size are unchanged. Returned objects are the cached
+    ones and are never changed in place: updates save copies instead.
+
+    An instance may be shared between threads. Public operations, and a
+    whole batch(), hold the instance's lock.
+    """
 
     def __init__(self, workspace_path: str | Path):
         self.workspace = Path(workspace_path)
         self.index_dir = self.workspace / ".library" / "index"
         self.documents_path = self.index_dir / "documents.json"
         self.topics_path = self.index_dir / "topics.json"
+        self.insights_path = self.index_dir / "insights.json"
+        self.notebooks_path = self.index_dir / "notebooks.json"
+        self.topic_summaries_dir = self.index_dir / "topic_summaries"
+
+        # Parsed index files: path -> (mtime_ns, size, value). Entries whose
+        # save is deferred by batch() have mtime_ns None until flushed.
+        self._cache: dict[Path, tuple[int | None, int | None, Any]] = {}
+        # Index files whose saves are deferred by batch()
+        self._dirty: set[Path] = set()
+        self._batch_depth = 0
+        # Serializes operations (and batches) across threads
+        self._lock = threading.RLock()
+
+        # Lowercased topic names and aliases -> topic, for find_or_create_topic
+        self._topic_names: dict[str, Topic] = {}
+        self._topic_names_key: tuple | None = None
+        # Titles and per-status counts of the cached insights
+        self._insight_titles: set[str] = set()
+        self._insight_counts: Counter[str] = Counter()
+        self._insight_stats_key: tuple | None = None
 
         # Ensure directory exists
         self.index_dir.mkdir(parents=True, exist_ok=True)
 
+    def _read_cached(self, path: Path, decode: Callable[[Any], Any], empty: Callable[[], Any]) -> Any:
+        """Load an index file, reparsing only if it changed since last read.
+
+        Args:
+            path: Index file path
+            decode: Builds the value from the parsed JSON
+            empty: Returns the value to use if the file is missing or invalid
+        """
+        if path in self._dirty:
+            return self._cache[path][2]
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._cache.pop(path, None)
+            return empty()
+
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        try:
+            value = decode(_load_json(path.read_bytes()))
+        except (json.JSONDecodeError, KeyError, OSError):
+            self._cache.pop(path, None)
+            return empty()
+        self._cache[path] = (st.st_mtime_ns, st.st_size, value)
+        return value
+
+    def _write_cached(self, path: Path, value: Any):
+        """Save an index file, or defer the write while in a batch()."""
+        if self._batch_depth:
+            self._cache[path] = (None, None, value)
+            self._dirty.add(path)
+            return
+        st = _atomic_write(path, _dump_json(value))
+        self._cache[path] = (st.st_mtime_ns, st.st_size, value)
+
+    @contextmanager
+    def batch(self):
+        """Defer index file writes until the outermost batch exits.
+
+        Lets a multi-step operation (e.g. creating several topics and then
+        adding a document) write each index file once instead of per step.
+        Other threads wait until the batch is flushed, so their writes can't
+        be deferred into it or overwritten by it.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    def flush(self):
+        """Write any index files whose saves were deferred by batch()."""
+        with self._lock:
+            while self._dirty:
+                path = self._dirty.pop()
+                self._write_cached(path, self._cache[path][2])
+
     def _load_documents(self) -> dict[str, IndexedDocument]:
         """Load the document index."""
-        if not self.documents_path.exists():
-            return {}
-        try:
-            data = json.loads(self.documents_path.read_text())
-            return {k: IndexedDocument.from_dict(v) for k, v in data.items()}
-        except (json.JSONDecodeError, KeyError):
-            return {}
+        return self._read_cached(
+            self.documents_path,
+            lambda data: {k: IndexedDocument.from_dict(v) for k, v in data.items()},
+            dict,
+        )
 
     def _save_documents(self, documents: dict[str, IndexedDocument]):
         """Save the document index."""
-        data = {k: v.to_dict() for k, v in documents.items()}
-        self.documents_path.write_text(json.dumps(data, indent=2))
+        self._write_cached(self.documents_path, documents)
 
     def _load_topics(self) -> dict[str, Topic]:
         """Load the topic index."""
-        if not self.topics_path.exists():
-            return {}
-        try:
-            data = json.loads(self.topics_path.read_text())
-            return {k: Topic.from_dict(v) for k, v in data.items()}
-        except (json.JSONDecodeError, KeyError):
-            return {}
+        return self._read_cached(
+            self.topics_path,
+            lambda data: {k: Topic.from_dict(v) for k, v in data.items()},
+            dict,
+        )
 
     def _save_topics(self, topics: dict[str, Topic]):
         """Save the topic index."""
-        data = {k: v.to_dict() for k, v in topics.items()}
-        self.topics_path.write_text(json.dumps(data, indent=2))
+        self._write_cached(self.topics_path, topics)
 
     # Insight operations
 
     def _load_insights(self) -> list[InsightItem]:
         """Load insights from JSON file."""
-        insights_path = self.index_dir / "insights.json"
-        if not insights_path.exists():
-            return []
-        try:
-            data = json.loads(insights_path.read_text())
-            return [InsightItem.from_dict(item) for item in data]
-        except (json.JSONDecodeError, KeyError):
-            return []
+        return self._read_cached(
+            self.insights_path,
+            lambda data: [InsightItem.from_dict(item) for item in data],
+            list,
+        )
 
     def _save_insights(self, items: list[InsightItem]):
         """Save insights to JSON file."""
-        insights_path = self.index_dir / "insights.json"
-        data = [item.to_dict() for item in items]
-        insights_path.write_text(json.dumps(data, indent=2))
+        self._write_cached(self.insights_path, items)
+
+    def _insight_stats(self, items: list[InsightItem]) -> tuple[set[str], Counter[str]]:
+        """Return the titles and per-status counts of the cached insights.
+
+        Built on first use and kept up to date by add_insights and
+        update_insight, so they are only rebuilt when insights.json changes
+        on disk.
+
+        Args:
+            items: The insights just returned by _load_insights
+        """
+        entry = self._cache.get(self.insights_path)
+        if self._insight_stats_key is None or self._insight_stats_key[0] is not entry:
+            self._insight_titles = {item.title for item in items}
+            self._insight_counts = Counter(item.status for item in items)
+            self._insight_stats_key = (entry,)
+        return self._insight_titles, self._insight_counts
 
     def add_insights(self, items: list[InsightItem]):
         """Append insights, deduplicating by title."""
-        existing = self._load_insights()
-        existing_titles = {item.title for item in existing}
-        for item in items:
-            if item.title not in existing_titles:
-                existing.append(item)
-                existing_titles.add(item.title)
-        self._save_insights(existing)
+        with self._lock:
+            existing = self._load_insights()
+            existing_titles, status_counts = self._insight_stats(existing)
+            existing = list(existing)
+            for item in items:
+                if item.title not in existing_titles:
+                    existing.append(item)
+                    existing_titles.add(item.title)
+                    status_counts[item.status] += 1
+            self._save_insights(existing)
+            self._insight_stats_key = (self._cache.get(self.insights_path),)
 
     def list_insights(self, status_filter: str | None = None) -> list[InsightItem]:
         """List insights with optional status filter."""
-        items = self._load_insights()
-        if status_filter:
-            items = [i for i in items if i.status == status_filter]
-        return items
+        with self._lock:
+            items = self._load_insights()
+            if status_filter:
+                return [i for i in items if i.status == status_filter]
+            return list(items)
 
     def get_insight_count(self, status: str = "new") -> int:
         """Get count of insights with given status."""
-        return len([i for i in self._load_insights() if i.status == status])
+        with self._lock:
+            return self._insight_stats(self._load_insights())[1][status]
 
     def update_insight(self, insight_id: str, status: str) -> InsightItem | None:
-        """Update an insight's status. Returns updated item or None."""
-        items = self._load_insights()
-        for item in items:
-            if item.id == insight_id:
-                item.status = status
-                self._save_insights(items)
-                return item
-        return None
+        """Update an insight's status. Returns updated item or None.
+
+        Saves a copy of the insight list with the item replaced; wrap several
+        updates in batch() to write insights.json once.
+        """
+        with self._lock:
+            items = self._load_insights()
+            _, status_counts = self._insight_stats(items)
+            for i, item in enumerate(items):
+                if item.id == insight_id:
+                    if item.status != status:
+                        status_counts[item.status] -= 1
+                        status_counts[status] += 1
+                        item = replace(item, status=status)
+                        self._save_insights([*items[:i], item, *items[i + 1:]])
+                        self._insight_stats_key = (self._cache.get(self.insights_path),)
+                    return item
+            return None
 
     # Notebook operations
 
     def _load_notebooks(self) -> dict[str, Notebook]:
         """Load notebooks from JSON file."""
-        notebooks_path = self.index_dir / "notebooks.json"
-        if not notebooks_path.exists():
-            return {}
-        try:
-            data = json.loads(notebooks_path.read_text())
-            return {k: Notebook.from_dict(v) for k, v in data.items()}
-        except (json.JSONDecodeError, KeyError):
-            return {}
+        return self._read_cached(
+            self.notebooks_path,
+            lambda data: {k: Notebook.from_dict(v) for k, v in data.items()},
+            dict,
+        )
 
     def _save_notebooks(self, notebooks: dict[str, Notebook]):
         """Save notebooks to JSON file."""
-        data = {k: v.to_dict() for k, v in notebooks.items()}
-        notebooks_path = self.index_dir / "notebooks.json"
-        notebooks_path.write_text(json.dumps(data, indent=2))
+        self._write_cached(self.notebooks_path, notebooks)
 
     def list_notebooks(self) -> list[Notebook]:
         """List all notebooks, sorted by updated_at descending."""
-        notebooks = self._load_notebooks()
-        result = list(notebooks.values())
-        result.sort(key=lambda n: n.updated_at, reverse=True)
-        return result
+        with self._lock:
+            notebooks = self._load_notebooks()
+            result = list(notebooks.values())
+            result.sort(key=lambda n: n.updated_at, reverse=True)
+            return result
 
     def get_notebook(self, notebook_id: str) -> Notebook | None:
         """Get a notebook by ID."""
-        notebooks = self._load_notebooks()
-        return notebooks.get(notebook_id)
+        with self._lock:
+            notebooks = self._load_notebooks()
+            return notebooks.get(notebook_id)
 
     def create_notebook(self, title: str, source_ids: list[str], source_labels: list[str]) -> Notebook:
         """Create a new notebook."""
-        now = datetime.utcnow().isoformat()
-        notebook = Notebook(
-            id=_uuid.uuid4().hex,
-            title=title,
-            source_ids=source_ids,
-            source_labels=source_labels,
-            created_at=now,
-            updated_at=now,
-        )
-        notebooks = self._load_notebooks()
-        notebooks[notebook.id] = notebook
-        self._save_notebooks(notebooks)
-        return notebook
+        with self._lock:
+            now = datetime.utcnow().isoformat()
+            notebook = Notebook(
+                id=_uuid.uuid4().hex,
+                title=title,
+                source_ids=source_ids,
+                source_labels=source_labels,
+                created_at=now,
+                updated_at=now,
+            )
+            notebooks = self._load_notebooks()
+            notebooks[notebook.id] = notebook
+            self._save_notebooks(notebooks)
+            return notebook
 
     def update_notebook(self, notebook_id: str, **kwargs) -> Notebook | None:
         """Update a notebook's fields. Returns updated notebook or None."""
-        notebooks = self._load_notebooks()
-        notebook = notebooks.get(notebook_id)
-        if not notebook:
-            return None
-        for key, value in kwargs.items():
-            if hasattr(notebook, key):
-                setattr(notebook, key, value)
-        notebook.updated_at = datetime.utcnow().isoformat()
-        self._save_notebooks(notebooks)
-        return notebook
+        with self._lock:
+            notebooks = self._load_notebooks()
+            notebook = notebooks.get(notebook_id)
+            if not notebook:
+                return None
+            names = {f.name for f in fields(notebook)}
+            changes = {key: value for key, value in kwargs.items() if key in names}
+            changes["updated_at"] = datetime.utcnow().isoformat()
+            notebook = replace(notebook, **changes)
+            self._save_notebooks({**notebooks, notebook_id: notebook})
+            return notebook
 
     def delete_notebook(self, notebook_id: str) -> bool:
         """Delete a notebook. Returns True if deleted."""
-        notebooks = self._load_notebooks()
-        if notebook_id not in notebooks:
-            return False
-        del notebooks[notebook_id]
-        self._save_notebooks(notebooks)
-        return True
+        with self._lock:
+            notebooks = self._load_notebooks()
+            if notebook_id not in notebooks:
+                return False
+            del notebooks[notebook_id]
+            self._save_notebooks(notebooks)
+            return True
 
     # Document operations
 
     def get_document(self, doc_id: str) -> IndexedDocument | None:
         """Get a document by ID."""
-        documents = self._load_documents()
-        return documents.get(doc_id)
+        with self._lock:
+            documents = self._load_documents()
+            return documents.get(doc_id)
 
     def list_documents(
         self,
@@ -322,109 +636,174 @@ class LibraryIndex:
         doc_type_filter: list[str] | None = None,
     ) -> list[IndexedDocument]:
         """List documents with optional filters."""
-        documents = self._load_documents()
-        result = list(documents.values())
-
-        if topic_filter:
-            result = [d for d in result if any(t in d.topics for t in topic_filter)]
+        with self._lock:
+            documents = self._load_documents()
+
+            if topic_filter:
+                topics = self._load_topics()
+                if all(t in topics for t in topic_filter):
+                    # Topics list their documents in index order (see
+                    # _update_topic_counts), so look matches up instead of scanning
+                    matching_ids: dict[str, None] = {}
+                    for topic_id in topic_filter:
+                        matching_ids.update(dict.fromkeys(topics[topic_id].documents))
+                    if len(topic_filter) == 1:
+                        result = [documents[d] for d in matching_ids if d in documents]
+                    else:
+                        result = [d for d in documents.values() if d.id in matching_ids]
+                else:
+                    # An ID with no topic entry can only be found on the documents
+                    result = [d for d in documents.values() if any(t in d.topics for t in topic_filter)]
+            else:
+                result = list(documents.values())
 
-        if doc_type_filter:
-            result = [d for d in result if d.doc_type in doc_type_filter]
+            if doc_type_filter:
+                result = [d for d in result if d.doc_type in doc_type_filter]
 
-        return result
+            return result
 
     def add_document(self, document: IndexedDocument):
         """Add or update a document in the index."""
-        documents = self._load_documents()
-        documents[document.id] = document
-        self._save_documents(documents)
-
-        # Update topic document counts
-        self._update_topic_counts()
+        with self._lock:
+            documents = self._load_documents()
+            previous = documents.get(document.id)
+            documents[document.id] = document
+            self._save_documents(documents)
+
+            # Update topic document counts. A new document goes last in the index,
+            # so appending it to its topics matches a full recount; a replaced
+            # one keeps its position, so changed topics need the recount.
+            if previous is None:
+                self._adjust_topic_counts(document, added=True)
+            elif previous.topics != document.topics:
+                self._update_topic_counts()
 
     def remove_document(self, doc_id: str) -> bool:
         """Remove a document from the index."""
-        documents = self._load_documents()
-        if doc_id not in documents:
-            return False
-
-        del documents[doc_id]
-        self._save_documents(documents)
-        self._update_topic_counts()
-        return True
+        with self._lock:
+            documents = self._load_documents()
+            if doc_id not in documents:
+                return False
+
+            document = documents.pop(doc_id)
+            self._save_documents(documents)
+            self._adjust_topic_counts(document, added=False)
+            return True
+
+    def _adjust_topic_counts(self, document: IndexedDocument, added: bool):
+        """Add or remove one document in its topics' document lists and counts."""
+        topics = self._load_topics()
+        updated: dict[str, Topic] = {}
+        for topic_id in dict.fromkeys(document.topics):
+            topic = topics.get(topic_id)
+            if topic is None:
+                continue
+            if added:
+                # A topic listed twice on a document is counted twice, as in
+                # _update_topic_counts
+                occurrences = document.topics.count(topic_id)
+                doc_ids = [*topic.documents, *[document.id] * occurrences]
+            else:
+                doc_ids = [d for d in topic.documents if d != document.id]
+            updated[topic_id] = replace(topic, documents=doc_ids, document_count=len(doc_ids))
+        if updated:
+            self._save_topics({**topics, **updated})
 
     # Topic operations
 
     def get_topic(self, topic_id: str) -> Topic | None:
         """Get a topic by ID."""
-        topics = self._load_topics()
-        return topics.get(topic_id)
+        with self._lock:
+            topics = self._load_topics()
+            return topics.get(topic_id)
 
     def list_topics(self, include_counts: bool = True) -> list[Topic]:
         """List all topics."""
-        topics = self._load_topics()
-        result = list(topics.values())
-
-        if include_counts:
-            # Ensure counts are up to date
-            self._update_topic_counts()
+        with self._lock:
             topics = self._load_topics()
             result = list(topics.values())
 
-        return sorted(result, key=lambda t: t.document_count, reverse=True)
+            if include_counts:
+                # Ensure counts are up to date
+                self._update_topic_counts()
+                topics = self._load_topics()
+                result = list(topics.values())
+
+            return sorted(result, key=lambda t: t.document_count, reverse=True)
 
     def add_topic(self, topic: Topic):
         """Add or update a topic."""
-        topics = self._load_topics()
-        topics[topic.id] = topic
-        self._save_topics(topics)
+        with self._lock:
+            topics = self._load_topics()
+            self._save_topics({**topics, topic.id: topic})
 
     def find_or_create_topic(self, name: str) -> Topic:
         """Find a topic by name (case-insensitive) or create it."""
-        topics = self._load_topics()
-        name_lower = name.lower()
+        with self._lock:
+            topics = self._load_topics()
+            topic_names = self._topic_name_lookup(topics)
+            name_lower = name.lower()
 
-        # Check existing topics by name or alias
-        for topic in topics.values():
-            if topic.name.lower() == name_lower:
-                return topic
-            if any(alias.lower() == name_lower for alias in topic.aliases):
+            # Check existing topics by name or alias
+            topic = topic_names.get(name_lower)
+            if topic is not None:
                 return topic
 
-        # Create new topic
-        import re
-        topic_id = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+            # Create new topic
+            topic_id = _SLUG_RE.sub("-", name_lower).strip("-")
 
-        # Ensure unique ID
-        base_id = topic_id
-        counter = 1
-        while topic_id in topics:
-            topic_id = f"{base_id}-{counter}"
-            counter += 1
+            # Ensure unique ID
+            base_id = topic_id
+            counter = 1
+            while topic_id in topics:
+                topic_id = f"{base_id}-{counter}"
+                counter += 1
 
-        topic = Topic(id=topic_id, name=name)
-        topics[topic_id] = topic
-        self._save_topics(topics)
-        return topic
+            topic = Topic(id=topic_id, name=name)
+            self._save_topics({**topics, topic_id: topic})
+
+            # Keep the lookup current rather than rebuilding it for the save
+            topic_names[name_lower] = topic
+            self._topic_names_key = (self._cache.get(self.topics_path),)
+            return topic
+
+    def _topic_name_lookup(self, topics: dict[str, Topic]) -> dict[str, Topic]:
+        """Map lowercased topic names and aliases to topics.
+
+        Where several topics share a name or alias, the first in index order
+        wins, as in a scan of the topics.
+
+        Args:
+            topics: The topics just returned by _load_topics
+        """
+        entry = self._cache.get(self.topics_path)
+        if self._topic_names_key is None or self._topic_names_key[0] is not entry:
+            topic_names: dict[str, Topic] = {}
+            for topic in topics.values():
+                topic_names.setdefault(topic.name.lower(), topic)
+                for alias in topic.aliases:
+                    topic_names.setdefault(alias.lower(), topic)
+            self._topic_names = topic_names
+            self._topic_names_key = (entry,)
+        return self._topic_names
 
     def _update_topic_counts(self):
         """Update document counts for all topics."""
         documents = self._load_documents()
         topics = self._load_topics()
 
-        # Reset counts and document lists
-        for topic in topics.values():
-            topic.documents = []
-            topic.document_count = 0
-
-        # Count documents per topic
+        # Collect document lists per topic
+        topic_docs: dict[str, list[str]] = {topic_id: [] for topic_id in topics}
         for doc in documents.values():
             for topic_id in doc.topics:
-                if topic_id in topics:
-                    topics[topic_id].documents.append(doc.id)
-                    topics[topic_id].document_count += 1
+                if topic_id in topic_docs:
+                    topic_docs[topic_id].append(doc.id)
 
-        self._save_topics(topics)
+        # Save fresh Topic objects; the cached ones may be held by callers
+        self._save_topics({
+            topic_id: replace(topic, documents=topic_docs[topic_id], document_count=len(topic_docs[topic_id]))
+            for topic_id, topic in topics.items()
+        })
 
     # Entity indexing
 
@@ -434,14 +813,14 @@ class LibraryIndex:
         if not meta_path.exists():
             return {}
         try:
-            return json.loads(meta_path.read_text())
+            return _load_json(meta_path.read_bytes())
         except (json.JSONDecodeError, KeyError):
             return {}
 
     def _save_entity_meta(self, meta: dict):
         """Save entity index metadata."""
         meta_path = self.index_dir / "entity_index_meta.json"
-        meta_path.write_text(json.dumps(meta, indent=2))
+        _atomic_write(meta_path, _dump_json(meta))
 
     def index_entities(self, analyzer: "DocumentAnalyzer") -> dict:
         """Scan workspace entities and index new/changed ones.
@@ -475,45 +854,81 @@ class LibraryIndex:
         meta = self._load_entity_meta()
         entity_mtimes = meta.get("entity_mtimes", {})
 
-        documents = self._load_documents()
+        def read_and_analyze(md_file: Path) -> dict | None:
+            """Analyze an entity's body, or return None if it's empty."""
+            body = _strip_frontmatter(md_file.read_text())
+            if not body.strip():
+                return None
+
+            return analyzer.analyze(body, md_file.name)
+
+        def try_analyze(md_file: Path) -> tuple[dict | None, Exception | None]:
+            try:
+                return read_and_analyze(md_file), None
+            except Exception as e:
+                return None, e
+
+        # Scan and analyze without holding the lock: analysis can take minutes
+        with self._lock:
+            known_ids = set(self._load_documents())
         seen_entity_ids = set()
+        # New/changed entities: (doc_id, directory, entity_id, md_file, mtime)
+        pending = []
 
         for entity_type, config in entities_config.items():
             directory = config.get("directory", entity_type)
             type_dir = self.workspace / directory
 
-            if not type_dir.is_dir():
+            # The directory listing's entries carry the stat used for mtimes
+            try:
+                entries = list(os.scandir(type_dir))
+            except OSError:
                 continue
 
-            for md_file in type_dir.glob("*.md"):
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                md_file = Path(entry.path)
                 entity_id = md_file.stem
                 doc_id = f"entity:{directory}/{entity_id}"
+
+                # Entity types sharing a directory list the same files
+                if doc_id in seen_entity_ids:
+                    results["skipped"] += 1
+                    continue
                 seen_entity_ids.add(doc_id)
 
                 # Check mtime for incremental indexing
-                file_mtime = os.path.getmtime(md_file)
+                file_mtime = entry.stat().st_mtime
                 last_mtime = entity_mtimes.get(doc_id, 0)
 
-                if doc_id in documents and file_mtime <= last_mtime:
+                if doc_id in known_ids and file_mtime <= last_mtime:
                     results["skipped"] += 1
                     continue
 
+                pending.append((doc_id, directory, entity_id, md_file, file_mtime))
+
+        # Analysis is one API round-trip per entity, so overlap them. Results
+        # are applied below, in scan order, so topic creation stays
+        # single-threaded and deterministic.
+        outcomes = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(ANALYZE_WORKERS, len(pending))) as executor:
+                outcomes = list(executor.map(try_analyze, [item[3] for item in pending]))
+
+        # Topics created per document and the final saves are written once
+        with self.batch():
+            documents = self._load_documents()
+
+            for (doc_id, directory, entity_id, md_file, file_mtime), (analysis, error) in zip(pending, outcomes):
                 try:
-                    # Read and parse entity file
-                    text = md_file.read_text()
-                    body = text
-                    if text.startswith("---"):
-                        end = text.find("---", 3)
-                        if end != -1:
-                            body = text[end + 3:].lstrip("\n")
-
-                    if not body.strip():
+                    if error is not None:
+                        raise error
+
+                    if analysis is None:
                         results["skipped"] += 1
                         continue
 
-                    # Run AI analysis
-                    analysis = analyzer.analyze(body, md_file.name)
-
                     # Create/find topics
                     topic_ids = []
                     for topic_name in analysis["topics"]:
@@ -521,6 +936,7 @@ class LibraryIndex:
                         topic_ids.append(topic.id)
 
                     # Create indexed document
+                    now = datetime.utcnow().isoformat()
                     doc = IndexedDocument(
                         id=doc_id,
                         source_path=f"{directory}/{entity_id}.md",
@@ -533,8 +949,8 @@ class LibraryIndex:
                         ),
                         topics=topic_ids,
                         metadata=DocumentMetadata(
-                            created=datetime.utcnow().isoformat(),
-                            modified=datetime.utcnow().isoformat(),
+                            created=now,
+                            modified=now,
                             word_count=analysis["word_count"],
                             source_filename=md_file.name,
                         ),
@@ -552,24 +968,51 @@ class LibraryIndex:
                         "error": str(e),
                     })
 
-        # Clean up stale entries for deleted entities
-        stale_ids = [
-            did for did in documents
-            if did.startswith("entity:") and did not in seen_entity_ids
-        ]
-        for stale_id in stale_ids:
-            del documents[stale_id]
-            entity_mtimes.pop(stale_id, None)
-
-        # Save all at once
-        self._save_documents(documents)
-        self._update_topic_counts()
-        self._save_entity_meta({"entity_mtimes": entity_mtimes})
+            # Clean up stale entries for deleted entities
+            stale_ids = [
+                did for did in documents
+                if did.startswith("entity:") and did not in seen_entity_ids
+            ]
+            for stale_id in stale_ids:
+                del documents[stale_id]
+                entity_mtimes.pop(stale_id, None)
+
+            # Save all at once
+            self._save_documents(documents)
+            self._update_topic_counts()
+            self._save_entity_meta({"entity_mtimes": entity_mtimes})
 
         return results
 
     # Topic summaries
 
+    def _topic_summary_path(self, topic_id: str) -> Path:
+        """Cache file for a topic's collection summary.
+
+        The id is percent-encoded, so ids with path separators get their own
+        file inside topic_summaries/. Plain ids map to {topic_id}.json.
+        """
+        return self.topic_summaries_dir / f"{quote(topic_id, safe='')}.json"
+
+    def _migrate_topic_summaries(self):
+        """Split a topic_summaries.json written by older versions into per-topic files."""
+        with self._lock:
+            legacy_path = self.index_dir / "topic_summaries.json"
+            if not legacy_path.exists():
+                return
+            try:
+                legacy = _load_json(legacy_path.read_bytes())
+            except (OSError, json.JSONDecodeError):
+                legacy = {}
+
+            self.topic_summaries_dir.mkdir(exist_ok=True)
+            if isinstance(legacy, dict):
+                for topic_id, summary in legacy.items():
+                    path = self._topic_summary_path(topic_id)
+                    if not path.exists():
+                        _atomic_write(path, _dump_json(summary))
+            legacy_path.unlink(missing_ok=True)
+
     def get_topic_summary(self, topic_id: str) -> dict | None:
         """Get a cached collection summary for a topic, generating on miss.
 
@@ -582,16 +1025,12 @@ class LibraryIndex:
             return None
 
         # Check cache
-        summaries_path = self.index_dir / "topic_summaries.json"
-        cache = {}
-        if summaries_path.exists():
-            try:
-                cache = json.loads(summaries_path.read_text())
-            except (json.JSONDecodeError, KeyError):
-                cache = {}
-
-        if topic_id in cache:
-            return cache[topic_id]
+        self._migrate_topic_summaries()
+        summary_path = self._topic_summary_path(topic_id)
+        try:
+            return _load_json(summary_path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            pass
 
         # Generate on miss
         docs = self.list_documents(topic_filter=[topic_id])
@@ -611,8 +1050,8 @@ class LibraryIndex:
             summary = analyzer.summarize_collection(doc_summaries, topic.name)
 
             # Cache result
-            cache[topic_id] = summary
-            summaries_path.write_text(json.dumps(cache, indent=2))
+            self.topic_summaries_dir.mkdir(exist_ok=True)
+            _atomic_write(summary_path, _dump_json(summary))
 
             return summary
         except Exception:
@@ -620,23 +1059,42 @@ class LibraryIndex:
 
     def regenerate_topic_summary(self, topic_id: str) -> dict | None:
         """Force regenerate a topic summary (invalidates cache)."""
-        summaries_path = self.index_dir / "topic_summaries.json"
-        cache = {}
-        if summaries_path.exists():
-            try:
-                cache = json.loads(summaries_path.read_text())
-            except (json.JSONDecodeError, KeyError):
-                cache = {}
+        self._migrate_topic_summaries()
+        summary_path = self._topic_summary_path(topic_id)
 
         # Remove cached entry
-        cache.pop(topic_id, None)
-        summaries_path.write_text(json.dumps(cache, indent=2))
+        summary_path.unlink(missing_ok=True)
 
         # Regenerate
         return self.get_topic_summary(topic_id)
 
     # Search operations
 
+    def _search_postings(self) -> dict[str, set[str]]:
+        """Return search postings for the current documents and topics.
+
+        Postings built from saved files are keyed by the files' mtime and
+        size and shared across instances, so the per-request LibraryIndex
+        objects the server creates don't rebuild them for every search.
+        """
+        documents = self._load_documents()
+        topics = self._load_topics()
+        entries = (self._cache.get(self.documents_path), self._cache.get(self.topics_path))
+        if any(entry is not None and entry[0] is None for entry in entries):
+            # Unflushed batch() writes: nothing on disk to key them by
+            return _build_postings(documents, topics)
+
+        stamp = tuple(entry[:2] if entry is not None else None for entry in entries)
+        with _postings_cache_lock:
+            cached = _postings_cache.get(self.documents_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        postings = _build_postings(documents, topics)
+        with _postings_cache_lock:
+            _postings_cache[self.documents_path] = (stamp, postings)
+        return postings
+
     def find_documents(
         self,
         query: str,
@@ -660,60 +1118,67 @@ class LibraryIndex:
         Returns:
             List of dicts with id, title, doc_type, topics, summary
         """
-        documents = self.list_documents(topic_filter, doc_type_filter)
-        query_lower = query.lower()
-        results = []
-
-        for doc in documents:
-            # Simple relevance scoring
-            score = 0
-
-            # Title match
-            if query_lower in doc.title.lower():
-                score += 10
-
-            # Summary matches
-            if query_lower in doc.summaries.brief.lower():
-                score += 5
-            if query_lower in doc.summaries.standard.lower():
-                score += 3
-            if query_lower in doc.summaries.detailed.lower():
-                score += 1
-
-            # Topic name matches
+        with self._lock:
+            documents = self.list_documents(topic_filter, doc_type_filter)
             topics = self._load_topics()
-            for topic_id in doc.topics:
-                if topic_id in topics:
-                    topic = topics[topic_id]
-                    if query_lower in topic.name.lower():
-                        score += 5
-                    if any(query_lower in alias.lower() for alias in topic.aliases):
-                        score += 3
-
-            if score > 0:
-                # Get the appropriate summary
-                if summary_level == "brief":
-                    summary = doc.summaries.brief
-                elif summary_level == "detailed":
-                    summary = doc.summaries.detailed
-                else:
-                    summary = doc.summaries.standard
-
-                results.append({
-                    "id": doc.id,
-                    "title": doc.title,
-                    "doc_type": doc.doc_type,
-                    "topics": doc.topics,
-                    "summary": summary,
-                    "_score": score,
-                })
+            query_lower = query.lower()
+            results = []
+
+            # Narrow to documents that can match before scoring substrings
+            candidates = _search_candidates(self._search_postings(), query_lower)
+            if candidates is not None:
+                documents = [doc for doc in documents if doc.id in candidates]
+
+            for doc in documents:
+                # Simple relevance scoring
+                score = 0
+                title_lc, brief_lc, standard_lc, detailed_lc = doc._search_fields
+
+                # Title match
+                if query_lower in title_lc:
+                    score += 10
+
+                # Summary matches
+                if query_lower in brief_lc:
+                    score += 5
+                if query_lower in standard_lc:
+                    score += 3
+                if query_lower in detailed_lc:
+                    score += 1
+
+                # Topic name matches
+                for topic_id in doc.topics:
+                    if topic_id in topics:
+                        topic = topics[topic_id]
+                        if query_lower in topic.name.lower():
+                            score += 5
+                        if any(query_lower in alias.lower() for alias in topic.aliases):
+                            score += 3
+
+                if score > 0:
+                    # Get the appropriate summary
+                    if summary_level == "brief":
+                        summary = doc.summaries.brief
+                    elif summary_level == "detailed":
+                        summary = doc.summaries.detailed
+                    else:
+                        summary = doc.summaries.standard
+
+                    results.append({
+                        "id": doc.id,
+                        "title": doc.title,
+                        "doc_type": doc.doc_type,
+                        "topics": doc.topics,
+                        "summary": summary,
+                        "_score": score,
+                    })
 
-        # Sort by score and limit
-        results.sort(key=lambda x: x["_score"], reverse=True)
-        for r in results:
-            del r["_score"]
+            # Sort by score and limit
+            results.sort(key=lambda x: x["_score"], reverse=True)
+            for r in results:
+                del r["_score"]
 
-        return results[:max_results]
+            return results[:max_results]
 
     def get_document_content(self, doc_id: str) -> str | None:
         """Get the full extracted content of a document.
@@ -733,13 +1198,7 @@ class LibraryIndex:
             entity_path = doc_id[len("entity:"):]  # e.g. "notes/my-note"
             content_path = self.workspace / f"{entity_path}.md"
             if content_path.exists():
-                text = content_path.read_text()
-                # Strip YAML frontmatter
-                if text.startswith("---"):
-                    end = text.find("---", 3)
-                    if end != -1:
-                        text = text[end + 3:].lstrip("\n")
-                return text
+                return _strip_frontmatter(content_path.read_text())
             return None
 
         # Library file content: stored in .library/files/{id}/extracted.txt
@@ -1002,33 +1461,35 @@ Return ONLY a valid JSON array, no other text."""
         # Run analysis
         analysis = self.analyze(content, filename)
 
-        # Create/find topics and get their IDs
-        topic_ids = []
-        for topic_name in analysis["topics"]:
-            topic = index.find_or_create_topic(topic_name)
-            topic_ids.append(topic.id)
-
-        # Create indexed document
-        doc = IndexedDocument(
-            id=file_id,
-            source_path=f".library/files/{file_id}/extracted.txt",
-            title=analysis["title"],
-            doc_type=analysis["doc_type"],
-            summaries=DocumentSummaries(
-                brief=analysis["summaries"]["brief"],
-                standard=analysis["summaries"]["standard"],
-                detailed=analysis["summaries"]["detailed"],
-            ),
-            topics=topic_ids,
-            metadata=DocumentMetadata(
-                created=datetime.utcnow().isoformat(),
-                modified=datetime.utcnow().isoformat(),
-                word_count=analysis["word_count"],
-                source_filename=filename,
-            ),
-        )
-
-        # Add to index
-        index.add_document(doc)
+        with index.batch():
+            # Create/find topics and get their IDs
+            topic_ids = []
+            for topic_name in analysis["topics"]:
+                topic = index.find_or_create_topic(topic_name)
+                topic_ids.append(topic.id)
+
+            # Create indexed document
+            now = datetime.utcnow().isoformat()
+            doc = IndexedDocument(
+                id=file_id,
+                source_path=f".library/files/{file_id}/extracted.txt",
+                title=analysis["title"],
+                doc_type=analysis["doc_type"],
+                summaries=DocumentSummaries(
+                    brief=analysis["summaries"]["brief"],
+                    standard=analysis["summaries"]["standard"],
+                    detailed=analysis["summaries"]["detailed"],
+                ),
+                topics=topic_ids,
+                metadata=DocumentMetadata(
+                    created=now,
+                    modified=now,
+                    word_count=analysis["word_count"],
+                    source_filename=filename,
+                ),
+            )
+
+            # Add to index
+            index.add_document(doc)
 
         return doc
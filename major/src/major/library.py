@@ -7,14 +7,17 @@ written to workspace entities.
 """
 
 import base64
+import hashlib
 import json
 import os
 import re
+import sqlite3
+import threading
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Iterator, Literal
 
 # pypdf for PDF extraction
 try:
@@ -40,6 +43,28 @@ except ImportError:
 
 FileStatus = Literal["pending", "processing", "complete", "failed"]
 
+# Parsed index.json per library, shared by every LibraryManager in the process
+_index_cache: dict[str, "_IndexSnapshot"] = {}
+_index_cache_lock = threading.Lock()
+
+# Serializes read-modify-write updates of index.json within the process, so
+# background processing can't drop an entry written by another thread
+_index_write_lock = threading.RLock()
+
+# Shortest query the trigram full-text index can answer
+FTS_MIN_QUERY = 3
+
+# Full-text index connections per database path, shared by every
+# LibraryManager in the process (None if SQLite lacks FTS5/trigram)
+_fts_connections: dict[str, sqlite3.Connection | None] = {}
+# Serializes use of the shared connections
+_fts_lock = threading.Lock()
+# Index snapshot each full-text index was last backfilled from
+_fts_backfilled: dict[str, "_IndexSnapshot"] = {}
+
+# Write buffer for streamed uploads
+UPLOAD_BUFFER_SIZE = 64 * 1024
+
 
 @dataclass
 class LibraryFile:
@@ -56,8 +81,23 @@ class LibraryFile:
     processed_at: str | None = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        Every field is a scalar, so this builds the dict directly rather than
+        paying for asdict()'s recursive deep copy.
+        """
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "content_type": self.content_type,
+            "size_bytes": self.size_bytes,
+            "status": self.status,
+            "error_message": self.error_message,
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "created_at": self.created_at,
+            "processed_at": self.processed_at,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "LibraryFile":
@@ -65,6 +105,38 @@ class LibraryFile:
         return cls(**data)
 
 
+@dataclass(frozen=True)
+class _IndexSnapshot:
+    """A parsed index.json, valid while the file's mtime and size match."""
+    mtime_ns: int
+    size: int
+    files: dict[str, LibraryFile]
+    newest_first: list[LibraryFile]
+    by_status: dict[str, list[LibraryFile]]
+
+    @classmethod
+    def build(cls, st: os.stat_result, files: dict[str, LibraryFile]) -> "_IndexSnapshot":
+        """Build a snapshot, precomputing the ordering and status buckets."""
+        newest_first = sorted(files.values(), key=lambda f: f.created_at, reverse=True)
+        by_status: dict[str, list[LibraryFile]] = {}
+        for library_file in newest_first:
+            by_status.setdefault(library_file.status, []).append(library_file)
+        return cls(st.st_mtime_ns, st.st_size, files, newest_first, by_status)
+
+
+_EMPTY_INDEX = _IndexSnapshot(0, 0, {}, [], {})
+
+
+def _cache_dir() -> Path:
+    """Per-user cache directory for derived library data.
+
+    Workspaces are git repositories that get committed and pushed, so
+    rebuildable files stay out of them. (library-mcp loads this module on
+    its own, so it can't share image_cache.cache_root.)
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "major"
+
+
 class LibraryManager:
     """Manages library file storage and processing."""
 
@@ -73,34 +145,115 @@ class LibraryManager:
         self.library_dir = self.workspace / ".library"
         self.files_dir = self.library_dir / "files"
         self.index_path = self.library_dir / "index.json"
+        workspace_key = hashlib.sha256(str(self.workspace.resolve()).encode("utf-8")).hexdigest()[:16]
+        self.search_db_path = _cache_dir() / "library" / f"{workspace_key}.db"
 
         # Ensure directories exist
         self.files_dir.mkdir(parents=True, exist_ok=True)
 
     def _load_index(self) -> dict[str, LibraryFile]:
-        """Load the file index."""
-        if not self.index_path.exists():
-            return {}
+        """Load the file index.
+
+        The parsed index is cached per process and reused while index.json's
+        mtime and size are unchanged. Callers get their own dict but share the
+        LibraryFile objects with every other thread, so never mutate them:
+        build a changed copy with dataclasses.replace and save that.
+        """
+        return dict(self._cached_index().files)
+
+    def _cached_index(self) -> _IndexSnapshot:
+        """Return the cached index snapshot, reloading it if stale."""
+        key = str(self.index_path)
         try:
-            data = json.loads(self.index_path.read_text())
-            return {k: LibraryFile.from_dict(v) for k, v in data.items()}
-        except (json.JSONDecodeError, KeyError):
-            return {}
+            st = os.stat(key)
+        except OSError:
+            with _index_cache_lock:
+                _index_cache.pop(key, None)
+            return _EMPTY_INDEX
+
+        with _index_cache_lock:
+            cached = _index_cache.get(key)
+        if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+            return cached
+
+        try:
+            data = json.loads(self.index_path.read_bytes())
+            index = {k: LibraryFile.from_dict(v) for k, v in data.items()}
+        except (json.JSONDecodeError, KeyError, TypeError, OSError):
+            index = {}
+        return self._remember_index(key, st, index)
+
+    def _remember_index(
+        self,
+        key: str,
+        st: os.stat_result,
+        index: dict[str, LibraryFile],
+    ) -> _IndexSnapshot:
+        """Store a parsed index in the process-wide cache."""
+        snapshot = _IndexSnapshot.build(st, index)
+        with _index_cache_lock:
+            _index_cache[key] = snapshot
+        return snapshot
 
     def _save_index(self, index: dict[str, LibraryFile]):
-        """Save the file index."""
+        """Save the file index.
+
+        Written to a temp file and renamed over index.json so concurrent
+        readers never see a partial file. The snapshot is cached under the
+        temp file's stat, taken before the rename: if another process
+        replaces index.json right after, its file won't match our snapshot.
+        """
         data = {k: v.to_dict() for k, v in index.items()}
-        self.index_path.write_text(json.dumps(data, indent=2))
+        tmp_path = self.index_path.with_name(
+            f".{self.index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(json.dumps(data, indent=2))
+                f.flush()
+                st = os.fstat(f.fileno())
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._remember_index(str(self.index_path), st, dict(index))
+
+    def _put_file(self, library_file: LibraryFile):
+        """Insert or replace one entry in the index."""
+        with _index_write_lock:
+            index = self._load_index()
+            index[library_file.id] = library_file
+            self._save_index(index)
+
+    def _drop_file(self, file_id: str):
+        """Remove one entry from the index, if present."""
+        with _index_write_lock:
+            index = self._load_index()
+            if index.pop(file_id, None) is not None:
+                self._save_index(index)
 
     def list_files(self) -> list[LibraryFile]:
         """List all library files."""
-        index = self._load_index()
-        return sorted(index.values(), key=lambda f: f.created_at, reverse=True)
+        return list(self._cached_index().newest_first)
+
+    def list_files_by_status(self, status: str) -> list[LibraryFile]:
+        """List library files with a given status.
+
+        Args:
+            status: File status (pending, processing, complete, or failed)
+
+        Returns:
+            Matching files, newest first
+        """
+        return list(self._cached_index().by_status.get(status, ()))
 
     def get_file(self, file_id: str) -> LibraryFile | None:
-        """Get a specific file by ID."""
-        index = self._load_index()
-        return index.get(file_id)
+        """Get a specific file by ID.
+
+        The returned object is shared with the cached index; treat it as
+        read-only.
+        """
+        return self._cached_index().files.get(file_id)
 
     def save_uploaded_file(
         self,
@@ -117,6 +270,29 @@ class LibraryManager:
             content: File content bytes
             content_type: MIME type
 
+        Returns:
+            LibraryFile metadata
+        """
+        return self.save_uploaded_stream(file_id, filename, (content,), content_type)
+
+    def save_uploaded_stream(
+        self,
+        file_id: str,
+        filename: str,
+        chunks: Iterable[bytes],
+        content_type: str,
+    ) -> LibraryFile:
+        """Save an uploaded file from an iterable of byte chunks.
+
+        Chunks are written straight to disk, so large downloads never need
+        to be held in memory as a whole.
+
+        Args:
+            file_id: Unique ID for the file
+            filename: Original filename
+            chunks: File content, in order
+            content_type: MIME type
+
         Returns:
             LibraryFile metadata
         """
@@ -129,14 +305,18 @@ class LibraryManager:
 
         # Save original file
         original_path = file_dir / f"original{ext}"
-        original_path.write_bytes(content)
+        size_bytes = 0
+        with open(original_path, "wb", buffering=UPLOAD_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size_bytes += len(chunk)
 
         # Create metadata
         library_file = LibraryFile(
             id=file_id,
             filename=filename,
             content_type=content_type,
-            size_bytes=len(content),
+            size_bytes=size_bytes,
             status="pending",
         )
 
@@ -145,9 +325,7 @@ class LibraryManager:
         meta_path.write_text(json.dumps(library_file.to_dict(), indent=2))
 
         # Update index
-        index = self._load_index()
-        index[file_id] = library_file
-        self._save_index(index)
+        self._put_file(library_file)
 
         return library_file
 
@@ -186,16 +364,14 @@ class LibraryManager:
         Returns:
             Updated LibraryFile metadata
         """
-        index = self._load_index()
-        library_file = index.get(file_id)
+        library_file = self.get_file(file_id)
 
         if not library_file:
             raise ValueError(f"File not found: {file_id}")
 
         # Update status to processing
-        library_file.status = "processing"
-        index[file_id] = library_file
-        self._save_index(index)
+        library_file = replace(library_file, status="processing")
+        self._put_file(library_file)
 
         file_dir = self.files_dir / file_id
 
@@ -236,6 +412,7 @@ class LibraryManager:
             # Store extracted content in library (not workspace)
             extracted_path = file_dir / "extracted.txt"
             extracted_path.write_text(extracted_text)
+            self._index_content(file_id, extracted_text)
 
             # Store extra metadata if any
             if extra_metadata:
@@ -244,19 +421,21 @@ class LibraryManager:
 
             # Update metadata - note: entity_type/entity_id are NOT set
             # They will be set when the file is organized into workspace
-            library_file.status = "complete"
-            library_file.entity_type = file_type  # Store file type for organizing
-            library_file.entity_id = None  # No workspace entity yet
-            library_file.processed_at = datetime.utcnow().isoformat()
-            library_file.error_message = None
+            library_file = replace(
+                library_file,
+                status="complete",
+                entity_type=file_type,  # Store file type for organizing
+                entity_id=None,  # No workspace entity yet
+                processed_at=datetime.utcnow().isoformat(),
+                error_message=None,
+            )
 
         except Exception as e:
-            library_file.status = "failed"
-            library_file.error_message = str(e)
+            self._unindex_content(file_id)
+            library_file = replace(library_file, status="failed", error_message=str(e))
 
         # Save updated metadata
-        index[file_id] = library_file
-        self._save_index(index)
+        self._put_file(library_file)
 
         meta_path = file_dir / "meta.json"
         meta_path.write_text(json.dumps(library_file.to_dict(), indent=2))
@@ -272,10 +451,140 @@ class LibraryManager:
         Returns:
             Extracted text content, or None if not extracted
         """
-        extracted_path = self.files_dir / file_id / "extracted.txt"
-        if extracted_path.exists():
-            return extracted_path.read_text()
-        return None
+        try:
+            return (self.files_dir / file_id / "extracted.txt").read_text()
+        except FileNotFoundError:
+            return None
+
+    def iter_extracted_content(self, file_ids: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+        """Lazily read extracted content for several files.
+
+        Each file costs a single open (no separate existence check), and
+        nothing is read until the caller asks for it.
+
+        Args:
+            file_ids: IDs of the files, in the order wanted
+
+        Yields:
+            (file_id, extracted content or None if not extracted), in order
+        """
+        files_dir = str(self.files_dir)
+        for file_id in file_ids:
+            try:
+                with open(os.path.join(files_dir, file_id, "extracted.txt")) as f:
+                    yield file_id, f.read()
+            except FileNotFoundError:
+                yield file_id, None
+
+    def _fts_connection(self) -> sqlite3.Connection | None:
+        """Open the full-text index, or None if SQLite lacks FTS5/trigram.
+
+        The connection is shared by every LibraryManager for this workspace
+        in the process; use it only while holding _fts_lock.
+        """
+        key = str(self.search_db_path)
+        with _fts_lock:
+            if key not in _fts_connections:
+                conn = None
+                try:
+                    self.search_db_path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(key, check_same_thread=False, isolation_level=None)
+                    # Derived from extracted.txt files: losing the last commits
+                    # on power loss is fine, a corrupt database is not
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.execute(
+                        "CREATE VIRTUAL TABLE IF NOT EXISTS library "
+                        "USING fts5(file_id UNINDEXED, content, tokenize='trigram')"
+                    )
+                except (OSError, sqlite3.Error):
+                    if conn is not None:
+                        conn.close()
+                    conn = None
+                _fts_connections[key] = conn
+            return _fts_connections[key]
+
+    def _index_content(self, file_id: str, content: str):
+        """Add or replace a file's extracted content in the full-text index."""
+        conn = self._fts_connection()
+        if conn is None:
+            return
+        with _fts_lock:
+            try:
+                conn.execute("BEGIN")
+                conn.execute("DELETE FROM library WHERE file_id = ?", (file_id,))
+                conn.execute(
+                    "INSERT INTO library (file_id, content) VALUES (?, ?)",
+                    (file_id, content),
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+
+    def _unindex_content(self, file_id: str):
+        """Remove a file from the full-text index."""
+        conn = self._fts_connection()
+        if conn is None:
+            return
+        try:
+            with _fts_lock:
+                conn.execute("DELETE FROM library WHERE file_id = ?", (file_id,))
+        except sqlite3.Error:
+            pass
+
+    def _backfill_content(self, conn: sqlite3.Connection):
+        """Index completed files that predate the full-text index.
+
+        Runs once per change of index.json: the work is skipped while the
+        index snapshot is the one last backfilled from.
+        """
+        key = str(self.search_db_path)
+        snapshot = self._cached_index()
+        with _fts_lock:
+            if _fts_backfilled.get(key) is snapshot:
+                return
+            indexed = {row[0] for row in conn.execute("SELECT file_id FROM library")}
+        for library_file in snapshot.by_status.get("complete", ()):
+            if library_file.id not in indexed:
+                extracted = self.get_extracted_content(library_file.id)
+                if extracted is not None:
+                    self._index_content(library_file.id, extracted)
+        with _fts_lock:
+            _fts_backfilled[key] = snapshot
+
+    def search_content(self, query: str) -> dict[str, str] | None:
+        """Find files whose extracted content contains a query.
+
+        Matching is case-insensitive substring matching, answered by the
+        trigram full-text index. Completed files that predate the index are
+        added to it first.
+
+        Args:
+            query: Text to search for
+
+        Returns:
+            Mapping of file ID to extracted content for each candidate match,
+            or None if the index can't answer this query (SQLite without
+            FTS5, or a query shorter than FTS_MIN_QUERY characters)
+        """
+        if len(query) < FTS_MIN_QUERY:
+            return None
+        conn = self._fts_connection()
+        if conn is None:
+            return None
+
+        try:
+            self._backfill_content(conn)
+            phrase = '"' + query.replace('"', '""') + '"'
+            with _fts_lock:
+                rows = conn.execute(
+                    "SELECT file_id, content FROM library WHERE library MATCH ?",
+                    (phrase,),
+                ).fetchall()
+        except sqlite3.Error:
+            return None
+        return dict(rows)
 
     def get_extra_metadata(self, file_id: str) -> dict | None:
         """Get extra metadata for a library file (e.g., audio duration).
@@ -299,13 +608,10 @@ class LibraryManager:
             entity_type: The entity type directory
             entity_id: The created entity ID
         """
-        index = self._load_index()
-        library_file = index.get(file_id)
+        library_file = self.get_file(file_id)
         if library_file:
-            library_file.entity_type = entity_type
-            library_file.entity_id = entity_id
-            index[file_id] = library_file
-            self._save_index(index)
+            library_file = replace(library_file, entity_type=entity_type, entity_id=entity_id)
+            self._put_file(library_file)
 
             # Also update the meta.json in the file directory
             meta_path = self.files_dir / file_id / "meta.json"
@@ -608,8 +914,7 @@ class LibraryManager:
         Returns:
             True if deleted, False if not found
         """
-        index = self._load_index()
-        library_file = index.get(file_id)
+        library_file = self.get_file(file_id)
 
         if not library_file:
             return False
@@ -635,8 +940,8 @@ class LibraryManager:
             shutil.rmtree(file_dir)
 
         # Update index
-        del index[file_id]
-        self._save_index(index)
+        self._drop_file(file_id)
+        self._unindex_content(file_id)
 
         return True
 
@@ -671,8 +976,7 @@ class LibraryManager:
         Returns:
             Updated LibraryFile metadata
         """
-        index = self._load_index()
-        library_file = index.get(file_id)
+        library_file = self.get_file(file_id)
 
         if not library_file:
             raise ValueError(f"File not found: {file_id}")
@@ -681,10 +985,8 @@ class LibraryManager:
             raise ValueError(f"Cannot retry file with status: {library_file.status}")
 
         # Reset status and reprocess
-        library_file.status = "pending"
-        library_file.error_message = None
-        index[file_id] = library_file
-        self._save_index(index)
+        library_file = replace(library_file, status="pending", error_message=None)
+        self._put_file(library_file)
 
         return self.process_file(file_id)
 
@@ -80,28 +80,43 @@ def load_prompt_file(path: Path) -> str | None:
     return None
 
 
-def build_system_prompt(
-    attached_entities: list[dict] | None = None,
+def prompt_source_paths(
+    platform_config_path: str | None = None,
+    workspace_path: str | None = None,
+) -> list[Path]:
+    """Files that load_base_prompt reads, for change detection.
+
+    Args:
+        platform_config_path: Path to platform config directory.
+        workspace_path: Path to current workspace.
+
+    Returns:
+        Prompt file paths (which may not exist)
+    """
+    paths = []
+    if workspace_path:
+        paths.append(Path(workspace_path) / ".claude" / "PROMPT.md")
+        paths.append(Path(workspace_path) / "CLAUDE.md")
+    if platform_config_path:
+        paths.append(Path(platform_config_path) / "PROMPT.md")
+    return paths
+
+
+def load_base_prompt(
     platform_config_path: str | None = None,
     workspace_path: str | None = None,
-    source_constraint: list[dict] | None = None,
 ) -> str:
-    """Build system prompt with app-level and workspace-level context.
+    """Build the file-derived part of the system prompt.
 
-    Prompt sources (in order):
-    1. {platform_config_path}/PROMPT.md - App-level prompt (e.g., Motoko vs Motoko)
-    2. Falls back to DEFAULT_SYSTEM_PROMPT if no app prompt
-    3. {workspace_path}/CLAUDE.md - Workspace-level context (appended)
-    4. Attached entities (appended)
+    This is the app prompt plus workspace context; it depends only on
+    files on disk, so callers may cache it across messages.
 
     Args:
-        attached_entities: Optional list of attached entity dicts with
-            type, id, title, and content fields.
         platform_config_path: Path to platform config directory.
         workspace_path: Path to current workspace.
 
     Returns:
-        Complete system prompt string
+        Base prompt string
     """
     # 1. Try workspace prompt, then platform prompt, fall back to default
     prompt = None
@@ -125,6 +140,39 @@ def build_system_prompt(
             prompt += workspace_context
             prompt += "\n\n"
 
+    return prompt
+
+
+def build_system_prompt(
+    attached_entities: list[dict] | None = None,
+    platform_config_path: str | None = None,
+    workspace_path: str | None = None,
+    source_constraint: list[dict] | None = None,
+    base_prompt: str | None = None,
+) -> str:
+    """Build system prompt with app-level and workspace-level context.
+
+    Prompt sources (in order):
+    1. {platform_config_path}/PROMPT.md - App-level prompt (e.g., Motoko vs Motoko)
+    2. Falls back to DEFAULT_SYSTEM_PROMPT if no app prompt
+    3. {workspace_path}/CLAUDE.md - Workspace-level context (appended)
+    4. Attached entities (appended)
+
+    Args:
+        attached_entities: Optional list of attached entity dicts with
+            type, id, title, and content fields.
+        platform_config_path: Path to platform config directory.
+        workspace_path: Path to current workspace.
+        base_prompt: Precomputed result of load_base_prompt for the same
+            paths; when given, sources 1-3 are not re-read.
+
+    Returns:
+        Complete system prompt string
+    """
+    if base_prompt is None:
+        base_prompt = load_base_prompt(platform_config_path, workspace_path)
+    prompt = base_prompt
+
     # 3. Append source constraint (for source-grounded chat)
     if source_constraint:
         prompt += "## Source-Grounded Chat\n\n"
@@ -0,0 +1,42 @@
+"""Shared fixtures for major tests."""
+
+from pathlib import Path
+
+import pytest
+
+from major import config, library
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the per-user cache directory at a temp dir."""
+    home = tmp_path / "cache-home"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    return home
+
+
+@pytest.fixture(autouse=True)
+def clear_library_caches():
+    """Drop process-wide library indexes and connections between tests."""
+    yield
+    library._index_cache.clear()
+    library._fts_backfilled.clear()
+    for conn in library._fts_connections.values():
+        if conn is not None:
+            conn.close()
+    library._fts_connections.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_skills_sync():
+    """Forget which workspaces have had their skills synced."""
+    yield
+    config._skills_synced.clear()
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """An empty workspace directory."""
+    path = tmp_path / "workspace"
+    path.mkdir()
+    return path
@@ -0,0 +1,152 @@
+"""Tests for skill syncing and MCP config loading."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from major import config
+from major.config import MajorConfig
+
+
+@pytest.fixture
+def platform(tmp_path: Path) -> Path:
+    """A platform config dir with two skills."""
+    root = tmp_path / "platform"
+    for name in ("alpha", "beta"):
+        skill = root / ".claude" / "skills" / name
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(f"# {name}\n")
+    return root
+
+
+@pytest.fixture
+def major_config(tmp_path: Path, platform: Path) -> MajorConfig:
+    return MajorConfig(
+        workspace_root=str(tmp_path),
+        platform_config_path=str(platform),
+        platform_skills_path=str(platform / ".claude" / "skills"),
+    )
+
+
+def _skills(workspace: Path) -> list[str]:
+    return sorted(p.name for p in (workspace / ".claude" / "skills").iterdir())
+
+
+def _count_copies(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    copied: list[str] = []
+    real_copytree = shutil.copytree
+
+    def copytree(src, dst, *args, **kwargs):
+        copied.append(Path(dst).name)
+        return real_copytree(src, dst, *args, **kwargs)
+
+    monkeypatch.setattr(shutil, "copytree", copytree)
+    return copied
+
+
+def test_sync_copies_skills_and_nothing_else(major_config, workspace):
+    major_config.sync_skills(str(workspace))
+
+    assert _skills(workspace) == ["alpha", "beta"]
+    assert [p.name for p in workspace.rglob("*") if p.is_file()] == ["SKILL.md", "SKILL.md"]
+
+
+def test_unchanged_sync_skips_the_walk(major_config, workspace, monkeypatch):
+    major_config.sync_skills(str(workspace))
+    scanned: list[str] = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(config.os, "scandir", lambda p: scanned.append(str(p)) or real_scandir(p))
+
+    major_config.sync_skills(str(workspace))
+
+    # Only the signature's one listing per directory, no copy pass
+    assert len(scanned) == len(set(scanned))
+
+
+def test_new_source_skill_is_copied(major_config, workspace, platform, monkeypatch):
+    major_config.sync_skills(str(workspace))
+    copied = _count_copies(monkeypatch)
+
+    gamma = platform / ".claude" / "skills" / "gamma"
+    gamma.mkdir()
+    (gamma / "SKILL.md").write_text("# gamma\n")
+    major_config.sync_skills(str(workspace))
+
+    assert copied == ["gamma"]
+    assert _skills(workspace) == ["alpha", "beta", "gamma"]
+
+
+def test_deleted_workspace_skill_is_restored(major_config, workspace):
+    major_config.sync_skills(str(workspace))
+    shutil.rmtree(workspace / ".claude" / "skills" / "alpha")
+
+    major_config.sync_skills(str(workspace))
+
+    assert _skills(workspace) == ["alpha", "beta"]
+
+
+def test_failed_copy_is_retried(major_config, workspace, monkeypatch):
+    real_copytree = shutil.copytree
+
+    def flaky_copytree(src, dst, *args, **kwargs):
+        real_copytree(src, dst, *args, **kwargs)
+        if Path(dst).name == "beta":
+            raise OSError("disk full")
+
+    monkeypatch.setattr(shutil, "copytree", flaky_copytree)
+    major_config.sync_skills(str(workspace))
+    assert _skills(workspace) == ["alpha"]
+
+    monkeypatch.setattr(shutil, "copytree", real_copytree)
+    major_config.sync_skills(str(workspace))
+    assert _skills(workspace) == ["alpha", "beta"]
+
+
+def test_workspace_skills_are_not_overwritten(major_config, workspace):
+    own = workspace / ".claude" / "skills" / "alpha"
+    own.mkdir(parents=True)
+    (own / "SKILL.md").write_text("# mine\n")
+
+    major_config.sync_skills(str(workspace))
+
+    assert (own / "SKILL.md").read_text() == "# mine\n"
+    assert _skills(workspace) == ["alpha", "beta"]
+
+
+def test_forget_skills_sync_drops_only_that_workspace(major_config, workspace, tmp_path):
+    other = tmp_path / "other"
+    other.mkdir()
+    major_config.sync_skills(str(workspace))
+    major_config.sync_skills(str(other))
+
+    major_config.forget_skills_sync(str(workspace))
+
+    assert list(config._skills_synced) == [str(other / ".claude" / "skills")]
+
+
+def test_mcp_configs_merge_and_reload_on_change(major_config, workspace, platform):
+    (platform / ".mcp.json").write_text(json.dumps({"mcpServers": {"batou": {"command": "batou"}}}))
+    (workspace / ".mcp.json").write_text(json.dumps({"mcpServers": {"extra": {"command": "x"}}}))
+
+    servers = major_config.load_mcp_servers(str(workspace))
+    assert servers["batou"]["env"]["WORKSPACE_PATH"] == str(workspace)
+    assert set(servers) == {"batou", "extra"}
+
+    (workspace / ".mcp.json").write_text(json.dumps({"mcpServers": {"other": {"command": "y"}}}))
+    assert set(major_config.load_mcp_servers(str(workspace))) == {"batou", "other"}
+
+
+def test_mcp_config_cache_is_not_mutated(major_config, workspace, platform):
+    (platform / ".mcp.json").write_text(json.dumps({"mcpServers": {"batou": {"command": "batou"}}}))
+
+    major_config.load_mcp_servers(str(workspace))
+    other = workspace.parent / "other"
+    other.mkdir()
+    servers = major_config.load_mcp_servers(str(other))
+
+    assert servers["batou"]["env"]["WORKSPACE_PATH"] == str(other)
+    cached = config._mcp_config_cache[str(platform / ".mcp.json")][2]
+    assert "env" not in cached["batou"]
@@ -0,0 +1,104 @@
+"""Tests for the on-disk image cache."""
+
+import os
+import threading
+
+from major import image_cache
+from major.image_cache import ImageCache
+
+
+def test_workspace_cache_lives_outside_the_workspace(tmp_path, cache_home):
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+
+    cache = ImageCache.for_workspace(workspace)
+    cache.put("https://example.com/a.png", "image/png", "AAAA", None, None)
+
+    assert cache.cache_dir.is_relative_to(cache_home / "major" / "images")
+    assert list(workspace.iterdir()) == []
+
+
+def test_workspaces_get_separate_caches(tmp_path):
+    first = ImageCache.for_workspace(tmp_path / "one")
+    second = ImageCache.for_workspace(tmp_path / "two")
+
+    assert first.cache_dir != second.cache_dir
+    assert ImageCache.for_workspace(tmp_path / "one").cache_dir == first.cache_dir
+
+
+def test_hit_from_disk_in_a_new_instance(tmp_path):
+    ImageCache(tmp_path).put("u", "image/png", "AAAA", '"etag"', "yesterday")
+
+    entry = ImageCache(tmp_path).get("u")
+
+    assert entry == {
+        "media_type": "image/png",
+        "data": "AAAA",
+        "etag": '"etag"',
+        "last_modified": "yesterday",
+    }
+
+
+def test_miss_and_corrupt_entry(tmp_path):
+    cache = ImageCache(tmp_path)
+    assert cache.get("missing") is None
+
+    cache.put("u", "image/png", "AAAA", None, None)
+    cache._path("u").write_text("{not json")
+    assert ImageCache(tmp_path).get("u") is None
+
+
+def test_put_replaces_entry(tmp_path):
+    cache = ImageCache(tmp_path)
+    cache.put("u", "image/png", "AAAA", "v1", None)
+    cache.put("u", "image/jpeg", "BBBB", "v2", None)
+
+    assert cache.get("u")["etag"] == "v2"
+    assert ImageCache(tmp_path).get("u")["data"] == "BBBB"
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = ImageCache(tmp_path, max_bytes=10**9)
+    for name in ("old", "used", "new"):
+        cache.put(name, "image/png", "A" * 1000, None, None)
+    os.utime(cache._path("old"), ns=(1, 1))
+    os.utime(cache._path("used"), ns=(2, 2))
+    cache.get("used")  # bumps its mtime past "new"
+
+    entry_size = cache._path("new").stat().st_size
+    cache.max_bytes = entry_size * 2
+    cache._evict()
+
+    assert not cache._path("old").exists()
+    assert cache._path("used").exists()
+    assert cache._path("new").exists()
+
+
+def test_concurrent_writers(tmp_path):
+    caches = [ImageCache(tmp_path) for _ in range(4)]
+    errors = []
+
+    def write(cache: ImageCache, worker: int):
+        try:
+            for i in range(50):
+                cache.put(f"url-{i % 10}", "image/png", f"{worker}-{i}", None, None)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(cache, n)) for n, cache in enumerate(caches)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith(".tmp")]
+    for i in range(10):
+        assert ImageCache(tmp_path).get(f"url-{i}")["media_type"] == "image/png"
+
+
+def test_cache_root_defaults_to_home(monkeypatch, tmp_path):
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    assert image_cache.cache_root() == tmp_path / ".cache" / "major"
@@ -0,0 +1,387 @@
+"""Tests for LibraryIndex's cached index files."""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from major.librarian import (
+    DocumentSummaries,
+    IndexedDocument,
+    InsightItem,
+    LibraryIndex,
+    Topic,
+)
+
+
+def _doc(doc_id: str, title: str = "Title", topics: list[str] | None = None, brief: str = "") -> IndexedDocument:
+    return IndexedDocument(
+        id=doc_id,
+        source_path=f"files/{doc_id}",
+        title=title,
+        doc_type="note",
+        summaries=DocumentSummaries(brief=brief, standard=f"standard {doc_id}", detailed=""),
+        topics=topics or [],
+    )
+
+
+def test_cached_documents_are_reused_until_the_file_changes(workspace):
+    index = LibraryIndex(workspace)
+    index.add_document(_doc("d1"))
+
+    first = index._load_documents()
+    assert index._load_documents() is first
+
+    data = json.loads(index.documents_path.read_text())
+    data["d1"]["title"] = "Edited elsewhere"
+    index.documents_path.write_text(json.dumps(data))
+
+    assert index.get_document("d1").title == "Edited elsewhere"
+
+
+def test_corrupt_file_reads_as_empty(workspace):
+    index = LibraryIndex(workspace)
+    index.add_document(_doc("d1"))
+    index.documents_path.write_text("{not json")
+
+    assert index.list_documents() == []
+
+
+def test_write_racing_another_writer_does_not_cache_stale_data(workspace, monkeypatch):
+    index = LibraryIndex(workspace)
+    index.add_document(_doc("d1"))
+    real_replace = os.replace
+
+    def replace_then_other_writer(src, dst):
+        real_replace(src, dst)
+        if str(dst) == str(index.documents_path):
+            # Another process rewrites documents.json right after our rename
+            data = json.loads(index.documents_path.read_text())
+            data["other"] = {**data["d1"], "id": "other"}
+            index.documents_path.write_text(json.dumps(data, indent=2))
+
+    monkeypatch.setattr(os, "replace", replace_then_other_writer)
+    index.add_document(_doc("d2"))
+    monkeypatch.undo()
+
+    assert {doc.id for doc in index.list_documents()} == {"d1", "d2", "other"}
+
+
+def test_batch_defers_writes_until_exit(workspace):
+    index = LibraryIndex(workspace)
+    with index.batch():
+        index.add_topic(Topic(id="t1", name="Topic"))
+        index.add_document(_doc("d1", topics=["t1"]))
+        assert not index.documents_path.exists()
+        assert index.get_document("d1") is not None
+
+    assert LibraryIndex(workspace).get_document("d1").topics == ["t1"]
+    assert LibraryIndex(workspace).get_topic("t1").document_count == 1
+
+
+def _search_ids(index: LibraryIndex, query: str) -> list[str]:
+    return sorted(result["id"] for result in index.find_documents(query, max_results=100))
+
+
+def _insight(insight_id: str, title: str, status: str = "new") -> InsightItem:
+    return InsightItem(
+        id=insight_id,
+        type="connection",
+        title=title,
+        description="",
+        source_ids=[],
+        source_titles=[],
+        status=status,
+        created_at="2024-01-01T00:00:00",
+    )
+
+
+def test_insight_counts_follow_adds_and_updates(workspace):
+    index = LibraryIndex(workspace)
+    index.add_insights([_insight("i1", "A"), _insight("i2", "B")])
+    index.add_insights([_insight("i3", "A"), _insight("i4", "C", status="saved")])
+
+    assert [i.id for i in index.list_insights()] == ["i1", "i2", "i4"]
+    assert index.get_insight_count("new") == 2
+    assert index.get_insight_count("saved") == 1
+
+    index.update_insight("i1", "dismissed")
+    assert index.get_insight_count("new") == 1
+    assert index.get_insight_count("dismissed") == 1
+
+
+def test_insight_counts_are_rebuilt_after_an_external_edit(workspace):
+    index = LibraryIndex(workspace)
+    index.add_insights([_insight("i1", "A")])
+    assert index.get_insight_count("new") == 1
+
+    data = json.loads(index.insights_path.read_text())
+    data.append({**data[0], "id": "i2", "title": "B", "status": "saved"})
+    index.insights_path.write_text(json.dumps(data, indent=4))
+
+    assert index.get_insight_count("saved") == 1
+    index.add_insights([_insight("i3", "B")])
+    assert [i.id for i in index.list_insights()] == ["i1", "i2"]
+
+
+def test_unchanged_insight_status_is_not_rewritten(workspace, monkeypatch):
+    index = LibraryIndex(workspace)
+    index.add_insights([_insight("i1", "A")])
+    monkeypatch.setattr(index, "_save_insights", lambda items: pytest.fail("rewrote insights.json"))
+
+    assert index.update_insight("i1", "new").status == "new"
+
+
+def _recounted(index: LibraryIndex) -> dict[str, list[str]]:
+    counts = {t.id: list(t.documents) for t in index._load_topics().values()}
+    index._update_topic_counts()
+    assert counts == {t.id: list(t.documents) for t in index._load_topics().values()}
+    return counts
+
+
+def test_incremental_topic_counts_match_a_recount(workspace):
+    index = LibraryIndex(workspace)
+    index.add_topic(Topic(id="a", name="A"))
+    index.add_topic(Topic(id="b", name="B"))
+
+    index.add_document(_doc("d1", topics=["a", "b"]))
+    index.add_document(_doc("d2", topics=["a"]))
+    assert _recounted(index) == {"a": ["d1", "d2"], "b": ["d1"]}
+
+    index.add_document(_doc("d1", topics=["b"]))
+    assert _recounted(index) == {"a": ["d2"], "b": ["d1"]}
+
+    index.remove_document("d2")
+    assert _recounted(index) == {"a": [], "b": ["d1"]}
+
+
+def test_topic_lookup_by_name_and_alias(workspace):
+    index = LibraryIndex(workspace)
+    index.add_topic(Topic(id="ml", name="Machine Learning", aliases=["ML"]))
+
+    assert index.find_or_create_topic("machine learning").id == "ml"
+    assert index.find_or_create_topic("ml").id == "ml"
+    created = index.find_or_create_topic("Deep Learning")
+    assert created.id == "deep-learning"
+    assert index.find_or_create_topic("DEEP LEARNING") is created
+
+    data = json.loads(index.topics_path.read_text())
+    data["ml"]["aliases"] = ["Statistical Learning"]
+    index.topics_path.write_text(json.dumps(data, indent=4))
+
+    assert index.find_or_create_topic("statistical learning").id == "ml"
+
+
+def test_find_documents_matches_substrings_and_topics(workspace):
+    index = LibraryIndex(workspace)
+    index.add_topic(Topic(id="ml", name="Machine Learning", aliases=["ML"]))
+    index.add_document(_doc("d1", title="Gradient descent", brief="notes on optimisers"))
+    index.add_document(_doc("d2", title="Cooking", topics=["ml"]))
+    index.add_document(_doc("d3", title="C++ tips"))
+
+    assert _search_ids(index, "adient desc") == ["d1"]
+    assert _search_ids(index, "OPTIMIS") == ["d1"]
+    assert _search_ids(index, "learning") == ["d2"]
+    assert _search_ids(index, "ml") == ["d2"]
+    assert _search_ids(index, "++") == ["d3"]
+    assert _search_ids(index, "standard d") == ["d1", "d2", "d3"]
+    assert _search_ids(index, "absent") == []
+
+
+def test_postings_are_shared_until_files_change(workspace, monkeypatch):
+    from major import librarian
+
+    LibraryIndex(workspace).add_document(_doc("d1", title="First"))
+    builds = []
+    real_build = librarian._build_postings
+    monkeypatch.setattr(
+        librarian, "_build_postings", lambda *args: builds.append(1) or real_build(*args)
+    )
+
+    assert _search_ids(LibraryIndex(workspace), "first") == ["d1"]
+    assert _search_ids(LibraryIndex(workspace), "first") == ["d1"]
+    assert len(builds) == 1
+
+    writer = LibraryIndex(workspace)
+    writer.add_document(_doc("d2", title="First again"))
+    assert _search_ids(LibraryIndex(workspace), "first") == ["d1", "d2"]
+    assert len(builds) == 2
+
+    writer.remove_document("d1")
+    assert _search_ids(LibraryIndex(workspace), "first") == ["d2"]
+
+
+def test_search_inside_batch_sees_unflushed_documents(workspace):
+    index = LibraryIndex(workspace)
+    index.add_document(_doc("d1", title="Saved"))
+    index.find_documents("saved")
+
+    with index.batch():
+        index.add_document(_doc("d2", title="Saved later"))
+        assert _search_ids(index, "saved") == ["d1", "d2"]
+
+    assert _search_ids(LibraryIndex(workspace), "saved") == ["d1", "d2"]
+
+
+class _FakeAnalyzer:
+    calls = 0
+
+    def summarize_collection(self, doc_summaries, topic_name):
+        _FakeAnalyzer.calls += 1
+        return {"overview": f"{topic_name} ({len(doc_summaries)} docs)", "call": _FakeAnalyzer.calls}
+
+
+def _summary_index(workspace, monkeypatch, topic_id: str) -> LibraryIndex:
+    from major import librarian
+
+    _FakeAnalyzer.calls = 0
+    monkeypatch.setattr(librarian, "DocumentAnalyzer", _FakeAnalyzer)
+    index = LibraryIndex(workspace)
+    index.add_topic(Topic(id=topic_id, name="Topic"))
+    index.add_document(_doc("d1", topics=[topic_id]))
+    return index
+
+
+def test_topic_summary_is_cached_until_regenerated(workspace, monkeypatch):
+    index = _summary_index(workspace, monkeypatch, "ml")
+
+    assert index.get_topic_summary("ml")["call"] == 1
+    assert index.get_topic_summary("ml")["call"] == 1
+    assert (index.topic_summaries_dir / "ml.json").exists()
+
+    assert index.regenerate_topic_summary("ml")["call"] == 2
+    assert index.get_topic_summary("ml")["call"] == 2
+
+
+def test_topic_ids_with_separators_stay_inside_the_summaries_dir(workspace, monkeypatch):
+    index = _summary_index(workspace, monkeypatch, "../ai/ml")
+
+    assert index.get_topic_summary("../ai/ml")["call"] == 1
+    assert index.get_topic_summary("../ai/ml")["call"] == 1
+    assert [p.name for p in index.topic_summaries_dir.iterdir()] == ["..%2Fai%2Fml.json"]
+    assert not (index.index_dir / "ai").exists()
+
+
+def test_legacy_summaries_file_is_split_per_topic(workspace, monkeypatch):
+    index = _summary_index(workspace, monkeypatch, "a/b")
+    legacy = {"a/b": {"overview": "old"}, "..": {"overview": "dots"}}
+    (index.index_dir / "topic_summaries.json").write_text(json.dumps(legacy))
+
+    assert index.get_topic_summary("a/b") == {"overview": "old"}
+    assert not (index.index_dir / "topic_summaries.json").exists()
+    assert sorted(p.name for p in index.topic_summaries_dir.iterdir()) == ["...json", "a%2Fb.json"]
+    assert _FakeAnalyzer.calls == 0
+
+
+def test_returned_objects_are_not_changed_by_later_updates(workspace):
+    index = LibraryIndex(workspace)
+    index.add_topic(Topic(id="a", name="A"))
+    index.add_document(_doc("d1", topics=["a"]))
+    index.add_insights([_insight("i1", "A")])
+    notebook = index.create_notebook("N", [], [])
+
+    topic = index.get_topic("a")
+    insights = index.list_insights()
+    index.add_document(_doc("d2", topics=["a"]))
+    index.list_topics()
+    index.update_insight("i1", "saved")
+    index.add_insights([_insight("i2", "B")])
+    index.update_notebook(notebook.id, title="Renamed")
+
+    assert topic.documents == ["d1"] and topic.document_count == 1
+    assert [(i.id, i.status) for i in insights] == [("i1", "new")]
+    assert notebook.title == "N"
+    assert index.get_topic("a").documents == ["d1", "d2"]
+    assert index.list_insights("saved")[0].id == "i1"
+    assert index.get_notebook(notebook.id).title == "Renamed"
+
+
+def test_topic_filter_is_consistent_while_counts_are_rebuilt(workspace):
+    index = LibraryIndex(workspace)
+    index.add_topic(Topic(id="a", name="A"))
+    index.add_topic(Topic(id="b", name="B"))
+    with index.batch():
+        for i in range(2000):
+            index.add_document(_doc(f"d{i}", topics=["a" if i % 2 else "b"]))
+    expected = sorted(f"d{i}" for i in range(1, 2000, 2))
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    stop = threading.Event()
+    wrong = []
+
+    def recount():
+        while not stop.is_set():
+            index.list_topics()
+
+    def read():
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            if sorted(d.id for d in index.list_documents(topic_filter=["a"])) != expected:
+                wrong.append(1)
+
+    writer = threading.Thread(target=recount)
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    try:
+        writer.start()
+        for t in readers:
+            t.start()
+        for t in readers:
+            t.join()
+    finally:
+        stop.set()
+        writer.join()
+        sys.setswitchinterval(interval)
+
+    assert wrong == []
+
+
+def test_writes_from_other_threads_wait_for_a_batch(workspace):
+    index = LibraryIndex(workspace)
+    other = threading.Thread(target=index.add_document, args=(_doc("d2"),))
+
+    with index.batch():
+        index.add_document(_doc("d1"))
+        other.start()
+        other.join(timeout=0.2)
+        assert other.is_alive()
+    other.join()
+
+    assert sorted(LibraryIndex(workspace)._load_documents()) == ["d1", "d2"]
+
+
+class _BlockingAnalyzer:
+    """Checks that the index stays usable from other threads during analysis."""
+
+    def __init__(self, index: LibraryIndex):
+        self.index = index
+        self.reads_blocked = False
+
+    def analyze(self, content, filename):
+        reader = threading.Thread(target=self.index.list_documents)
+        reader.start()
+        reader.join(timeout=2)
+        self.reads_blocked |= reader.is_alive()
+        return {
+            "title": filename,
+            "doc_type": "note",
+            "summaries": {"brief": content, "standard": content, "detailed": content},
+            "topics": ["Notes"],
+            "word_count": len(content.split()),
+        }
+
+
+def test_index_entities_does_not_hold_the_lock_during_analysis(workspace):
+    (workspace / ".claude").mkdir()
+    (workspace / ".claude" / "schema.yaml").write_text("entities:\n  notes:\n    directory: notes\n")
+    (workspace / "notes").mkdir()
+    (workspace / "notes" / "a.md").write_text("---\ntitle: A\n---\n\nsome body\n")
+    index = LibraryIndex(workspace)
+    analyzer = _BlockingAnalyzer(index)
+
+    assert index.index_entities(analyzer)["indexed"] == 1
+
+    assert not analyzer.reads_blocked
+    assert index.get_topic("notes").documents == ["entity:notes/a"]
@@ -0,0 +1,229 @@
+"""Tests for LibraryManager's cached index and file processing."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from major.library import LibraryManager
+
+
+def _add(manager: LibraryManager, file_id: str, text: str = "# Notes\n\nSome text\n"):
+    return manager.save_uploaded_file(file_id, f"{file_id}.md", text.encode(), "text/markdown")
+
+
+def _buckets_consistent(manager: LibraryManager) -> bool:
+    snapshot = manager._cached_index()
+    return all(f.status == status for status, files in snapshot.by_status.items() for f in files)
+
+
+def test_process_file_does_not_mutate_shared_objects(workspace):
+    manager = LibraryManager(workspace)
+    added = _add(manager, "f1")
+    before = manager.get_file("f1")
+
+    processed = manager.process_file("f1")
+
+    assert processed.status == "complete"
+    assert added.status == "pending"
+    assert before.status == "pending"
+    assert manager.get_file("f1").status == "complete"
+    assert [f.id for f in manager.list_files_by_status("complete")] == ["f1"]
+    assert manager.list_files_by_status("pending") == []
+
+
+def test_failed_processing_is_recorded(workspace):
+    manager = LibraryManager(workspace)
+    manager.save_uploaded_file("bad", "bad.xyz", b"data", "application/octet-stream")
+
+    result = manager.process_file("bad")
+
+    assert result.status == "failed"
+    assert "Unsupported file type" in result.error_message
+    assert [f.id for f in manager.list_files_by_status("failed")] == ["bad"]
+
+
+def test_failed_save_leaves_cache_matching_disk(workspace, monkeypatch):
+    manager = LibraryManager(workspace)
+    _add(manager, "f1")
+
+    def fail(index):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager, "_save_index", fail)
+    with pytest.raises(OSError):
+        manager.process_file("f1")
+
+    monkeypatch.undo()
+    assert manager.get_file("f1").status == "pending"
+    assert LibraryManager(workspace).get_file("f1").status == "pending"
+
+
+def test_retry_and_entity_update_copy_before_changing(workspace):
+    manager = LibraryManager(workspace)
+    manager.save_uploaded_file("bad", "bad.xyz", b"data", "application/octet-stream")
+    failed = manager.process_file("bad")
+
+    manager.retry_processing("bad")
+    assert failed.status == "failed"
+
+    _add(manager, "f1")
+    done = manager.process_file("f1")
+    manager._update_file_entity("f1", "documents", "notes")
+    assert done.entity_id is None
+    assert manager.get_file("f1").entity_id == "notes"
+
+
+def test_background_processing_keeps_status_buckets_consistent(workspace):
+    manager = LibraryManager(workspace)
+    for i in range(10):
+        _add(manager, f"f{i}")
+    stop = threading.Event()
+    inconsistent = []
+
+    def watch():
+        reader = LibraryManager(workspace)
+        while not stop.is_set():
+            if not _buckets_consistent(reader):
+                inconsistent.append(True)
+
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    workers = [
+        threading.Thread(target=manager.process_file, args=(f"f{i}",)) for i in range(10)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    stop.set()
+    watcher.join()
+
+    assert inconsistent == []
+    assert len(manager.list_files_by_status("complete")) == 10
+
+
+def test_index_snapshot_is_reused_until_index_changes(workspace):
+    manager = LibraryManager(workspace)
+    _add(manager, "f1")
+
+    first = manager.get_file("f1")
+    assert LibraryManager(workspace).get_file("f1") is first
+
+    other = LibraryManager(workspace)
+    data = json.loads(other.index_path.read_text())
+    data["f1"]["filename"] = "renamed-elsewhere.md"
+    other.index_path.write_text(json.dumps(data))
+
+    assert manager.get_file("f1").filename == "renamed-elsewhere.md"
+
+
+def test_missing_index_reads_as_empty(workspace):
+    manager = LibraryManager(workspace)
+    _add(manager, "f1")
+    manager.index_path.unlink()
+
+    assert manager.list_files() == []
+    assert manager.get_file("f1") is None
+
+
+def test_save_racing_another_writer_does_not_cache_stale_data(workspace, monkeypatch):
+    manager = LibraryManager(workspace)
+    _add(manager, "f1")
+    real_replace = os.replace
+
+    def replace_then_other_writer(src, dst):
+        real_replace(src, dst)
+        if str(dst) == str(manager.index_path):
+            # Another process rewrites index.json right after our rename
+            data = json.loads(manager.index_path.read_text())
+            data["other"] = {**data["f1"], "id": "other", "filename": "other-process.md"}
+            manager.index_path.write_text(json.dumps(data, indent=2))
+
+    monkeypatch.setattr(os, "replace", replace_then_other_writer)
+    _add(manager, "f2")
+    monkeypatch.undo()
+
+    assert {f.id for f in manager.list_files()} == {"f1", "f2", "other"}
+
+
+def test_search_index_lives_outside_the_workspace(workspace, cache_home):
+    manager = LibraryManager(workspace)
+    _add(manager, "f1")
+    manager.process_file("f1")
+
+    assert manager.search_db_path.is_relative_to(cache_home / "major" / "library")
+    assert manager.search_db_path.exists()
+    assert not list(workspace.rglob("*.db"))
+
+
+def test_search_content_hits_and_deletion(workspace):
+    manager = LibraryManager(workspace)
+    _add(manager, "f1", "Quarterly revenue grew\n")
+    _add(manager, "f2", "Nothing relevant\n")
+    manager.process_file("f1")
+    manager.process_file("f2")
+
+    assert set(manager.search_content("REVENUE")) == {"f1"}
+    assert manager.search_content("ab") is None
+
+    manager.delete_file("f1")
+    assert manager.search_content("revenue") == {}
+
+
+def test_managers_share_one_connection(workspace):
+    first = LibraryManager(workspace)._fts_connection()
+
+    assert first is not None
+    assert LibraryManager(workspace)._fts_connection() is first
+
+
+def test_backfill_runs_once_per_index_change(workspace, monkeypatch):
+    manager = LibraryManager(workspace)
+    _add(manager, "f1", "older content\n")
+    manager.process_file("f1")
+    # Simulate a file completed before the full-text index existed
+    manager._unindex_content("f1")
+
+    reads = []
+    real_read = LibraryManager.get_extracted_content
+    monkeypatch.setattr(
+        LibraryManager,
+        "get_extracted_content",
+        lambda self, file_id: reads.append(file_id) or real_read(self, file_id),
+    )
+
+    assert set(manager.search_content("older")) == {"f1"}
+    assert reads == ["f1"]
+    manager.search_content("content")
+    LibraryManager(workspace).search_content("content")
+    assert reads == ["f1"]
+
+    _add(manager, "f2")
+    manager.search_content("content")
+    assert reads == ["f1"]  # f1 is indexed now; f2 isn't complete
+
+
+def test_concurrent_processing_and_search(workspace):
+    manager = LibraryManager(workspace)
+    for i in range(8):
+        _add(manager, f"f{i}", f"shared phrase number {i}\n")
+    errors = []
+
+    def search():
+        try:
+            for _ in range(20):
+                LibraryManager(workspace).search_content("shared phrase")
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=manager.process_file, args=(f"f{i}",)) for i in range(8)]
+    threads += [threading.Thread(target=search) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(manager.search_content("shared phrase")) == 8